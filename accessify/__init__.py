@@ -1,9 +1,36 @@
 from accessify.access import (
     accessify,
+    pass_through,
     private,
     protected,
+    remove_pass_through,
+    trusted,
+)
+from accessify.audit import (
+    disable_audit,
+    enable_audit,
+)
+from accessify.dispatch import dispatch
+from accessify.engines import (
+    get_engine,
+    set_engine,
 )
 from accessify.interfaces import (
+    get_interfaces_conformance_diff,
     implements,
     throws,
 )
+from accessify.monitoring import (
+    disable_monitoring,
+    enable_monitoring,
+    uninstall_monitoring,
+)
+from accessify.registry import (
+    implementors,
+    provides,
+)
+from accessify.warmup import (
+    freeze,
+    unfreeze,
+    warm,
+)
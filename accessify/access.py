@@ -1,128 +1,552 @@
 """
 Provide implementation of accessibility levels.
 """
-import copy
-import inspect
+import contextlib
 import os
+import sys
+import types
+import weakref
 
+from accessify.audit import get_current_auditor
 from accessify.errors import (
     INACCESSIBLE_DUE_TO_ITS_PROTECTION_LEVEL_EXCEPTION_MESSAGE,
     InaccessibleDueToItsProtectionLevelException,
 )
 from accessify.utils import (
-    ACCESS_WRAPPERS_NAMES,
     DISABLE_ACCESSIFY_ENV_VARIABLE_NAME,
-    ClassMemberMagicMethodNames,
+    TRUSTED_BLOCK,
+    AccessModifierTypes,
     ClassMemberTypes,
+    does_class_contain_code,
     does_classes_contain_private_method,
     find_decorated_method,
     get_method_class_by_frame,
+    get_nested_codes,
+    is_access_wrapper,
+    is_coroutine_function,
+    mangle_name,
+    rename_function_receiver_attributes,
+    unwrap_class_member,
 )
 
+HIDDEN_MEMBERS_NAMES = weakref.WeakKeyDictionary()
+SET_NAME_HOOKS = []
+PASS_THROUGH_CODES = {}
 
-def accessify(cls):
+pass_through_codes_identifiers = frozenset()
+
+
+def get_hidden_members_names(class_):
     """
-    Mark class as class that uses accessibility levels.
+    Get names of the class members with accessibility levels, including inherited ones, computed once per class.
 
-    Check if called method is covered by accessibility level decorators, then remove it from __dir__.
+    Members are either accessibility level wrappers or, if monitoring engine is used, methods it has unwrapped.
     """
-    class_locals = copy.deepcopy(dir(cls))
+    hidden_members_names = HIDDEN_MEMBERS_NAMES.get(class_)
 
-    for name, func in list(cls.__dict__.items()):
+    if hidden_members_names is None:
+        hidden_members_names = frozenset(
+            name for ancestor in class_.__mro__ for name, member in ancestor.__dict__.items()
+            if is_access_wrapper(object_=member)
+        )
+        HIDDEN_MEMBERS_NAMES[class_] = hidden_members_names
 
-        if hasattr(func, ClassMemberMagicMethodNames.NAME):
+    return hidden_members_names
 
-            if func.__name__ in ACCESS_WRAPPERS_NAMES:
-                class_locals.remove(name)
 
-    def dir_magic_method_mock(_):
-        return class_locals
+def get_visible_members_names(self):
+    """
+    Get names of the instance members except members with accessibility levels.
 
-    cls.__dir__ = dir_magic_method_mock
+    Shared by all the accessified classes as `__dir__`.
+    """
+    hidden_members_names = get_hidden_members_names(class_=self.__class__)
+    return [name for name in object.__dir__(self) if name not in hidden_members_names]
 
-    return cls
 
+def rename_class_member_attributes(class_, member, names):
+    """
+    Get the member with attributes loaded from `self` or `cls` in its code renamed, the member itself otherwise.
 
-def private(func):
+    Methods, class methods and properties accessors are copied, so the functions set to other classes as well are
+    kept. The receiver is the first argument of the method. Static methods have no receiver, so they are not renamed.
+    Methods under other decorators could not be copied, so they are renamed in place if they are defined in the class.
     """
-    Provide private accessibility level.
+    if isinstance(member, property):
+        for function_name, copy_name in (('fget', 'getter'), ('fset', 'setter'), ('fdel', 'deleter')):
+            function = getattr(member, function_name)
+
+            if function is not None:
+                function = rename_class_member_attributes(class_=class_, member=function, names=names)
+                member = getattr(member, copy_name)(function)
+
+        return member
+
+    if isinstance(member, AccessWrapper):
+        member.function = rename_class_member_attributes(class_=class_, member=member.function, names=names)
+        member.decorated_method = find_decorated_method(function=member.function)
+        return member
+
+    if member.__class__.__name__ == ClassMemberTypes.CLASS_METHOD:
+        return member.__class__(rename_class_member_attributes(class_=class_, member=member.__func__, names=names))
+
+    method = find_decorated_method(function=member)
+
+    if not isinstance(method, types.FunctionType) or method.__code__.co_argcount == 0:
+        return member
+
+    if method is member:
+        return rename_function_receiver_attributes(function=method, names=names)
+
+    if method.__qualname__.startswith(class_.__qualname__ + '.'):
+        method.__code__ = rename_function_receiver_attributes(function=method, names=names).__code__
+
+    return member
+
+
+def rename_class_methods_attributes(class_, names):
     """
-    def private_wrapper(*args, **kwargs):
-        """
-        Provide private accessibility level wrapper.
-        """
-        instance, *arguments_without_instance = args
-        instance_class = instance.__class__
-        instance_class_parents = instance.__class__.__bases__
+    Rename attributes loaded from `self` or `cls` in the methods, class methods and properties the class defines.
+    """
+    for name, member in list(class_.__dict__.items()):
+        member_type = member.member_type if isinstance(member, AccessWrapper) else member.__class__.__name__
 
-        if os.environ.get(DISABLE_ACCESSIFY_ENV_VARIABLE_NAME) is None:
-            method = find_decorated_method(function=func)
+        if member_type == ClassMemberTypes.STATIC_METHOD:
+            continue
 
-            does_class_contain_private_method, class_that_contains_private_method = \
-                does_classes_contain_private_method(classes=instance_class_parents, method=method)
+        renamed_member = rename_class_member_attributes(class_=class_, member=member, names=names)
 
-            if does_class_contain_private_method:
-                raise InaccessibleDueToItsProtectionLevelException(
-                    INACCESSIBLE_DUE_TO_ITS_PROTECTION_LEVEL_EXCEPTION_MESSAGE.format(
-                        class_name=class_that_contains_private_method.__name__, class_method_name=method.__name__,
-                    ),
-                )
+        if renamed_member is not member:
+            setattr(class_, name, renamed_member)
 
-            method_caller_frame = inspect.currentframe().f_back
-            method_caller_class = get_method_class_by_frame(frame=method_caller_frame)
 
-            if instance_class is not method_caller_class:
-                raise InaccessibleDueToItsProtectionLevelException(
-                    INACCESSIBLE_DUE_TO_ITS_PROTECTION_LEVEL_EXCEPTION_MESSAGE.format(
-                        class_name=instance_class.__name__, class_method_name=method.__name__,
-                    ),
-                )
+def wrap_subclasses_private_members(class_, names):
+    """
+    Put wrappers of the class private members under mangled names of the class subclasses, when they are created.
 
-        if func.__class__.__name__ == ClassMemberTypes.CLASS_METHOD:
-            arguments = (instance_class, ) + tuple(arguments_without_instance)
-            return func.__func__(*arguments, **kwargs)
+    Methods subclasses inherit load private members by mangled names, so subclasses get wrappers under them and
+    access is denied as for the methods of not mangled class. `__init_subclass__` the class defines is called after.
+    """
+    wrappers = {mangled_name: class_.__dict__[name] for name, mangled_name in names.items()}
+    class_init_subclass = class_.__dict__.get('__init_subclass__')
 
-        elif func.__class__.__name__ == ClassMemberTypes.STATIC_METHOD:
-            return func.__func__(*arguments_without_instance, **kwargs)
+    def init_subclass(cls, **kwargs):
+        for mangled_name, wrapper in wrappers.items():
+            if mangled_name not in cls.__dict__:
+                setattr(cls, mangled_name, wrapper)
 
+        if class_init_subclass is None:
+            super(class_, cls).__init_subclass__(**kwargs)
         else:
-            return func(*args, **kwargs)
+            class_init_subclass.__get__(None, cls)(**kwargs)
 
-    return private_wrapper
+    class_.__init_subclass__ = classmethod(init_subclass)
 
 
-def protected(func):
+def mangle_private_members(class_):
     """
-    Provide private accessibility level.
+    Put private members of the class under mangled names (e.g. `_Car__start_engine`) for the class methods to use.
+
+    Attributes loaded from `self` or `cls` in the code of the class methods, including their nested functions, lambdas
+    and comprehensions, are renamed, so the class methods call private members directly at native speed. Globals and
+    attributes of other objects with the same names are kept. Wrappers are kept under the original names, so access
+    from outside the class is denied as usual and the class is introspected (e.g. by interfaces) as usual. Subclasses
+    get wrappers under mangled names, see `wrap_subclasses_private_members`.
+    """
+    names = {
+        name: mangle_name(class_name=class_.__name__, name='__' + name)
+        for name, member in class_.__dict__.items()
+        if isinstance(member, AccessWrapper) and member.access_type == AccessModifierTypes.PRIVATE
+    }
+
+    if not names:
+        return
+
+    rename_class_methods_attributes(class_=class_, names=names)
+
+    for name, mangled_name in names.items():
+        setattr(class_, mangled_name, class_.__dict__[name].function)
+
+    wrap_subclasses_private_members(class_=class_, names=names)
+
+
+def accessify(cls=None, mangle=False):
+    """
+    Mark class as class that uses accessibility levels.
+
+    Members covered by accessibility level decorators are removed from __dir__ of the class instances. Names of such
+    members are computed on the first `dir` call, so the class does not keep anything until it is introspected.
+
+    With `mangle`, the class methods call private members by mangled names without wrappers, see
+    `mangle_private_members`.
+
+        @accessify(mangle=True)
+        class Car:
+            ...
+    """
+    if cls is None:
+        return lambda cls: accessify(cls, mangle=mangle)
+
+    if mangle:
+        mangle_private_members(class_=cls)
+
+    cls.__dir__ = get_visible_members_names
+
+    return cls
+
+
+def get_pass_through_codes(decorator):
+    """
+    Get code objects of the decorator and wrappers it defines (e.g. `wrapper` inside `retry`), recursively.
+
+    Decorator is either function, class (its `__call__` method wraps) or code object of the wrapper. Decorators
+    implemented in C (e.g. `functools.lru_cache`) have no frames, so they have no code objects and need not to be
+    passed through.
+    """
+    if isinstance(decorator, type):
+        decorator = decorator.__call__
+
+    code = decorator if isinstance(decorator, types.CodeType) else getattr(decorator, '__code__', None)
+
+    if code is None:
+        return []
+
+    return get_nested_codes(code=code)
+
+
+def pass_through(decorator):
+    """
+    Trust the decorator to pass calls through, so frames of its wrappers are skipped when the caller is resolved.
+
+    Used when the decorator is applied on top of the accessibility level, so the method is called by the decorator's
+    wrapper on behalf of the real caller. Could be used to decorate the decorator.
+
+        @accessify.pass_through
+        def retry(function):
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                ...
+
+            return wrapper
+    """
+    global pass_through_codes_identifiers
+
+    for code in get_pass_through_codes(decorator=decorator):
+        PASS_THROUGH_CODES[id(code)] = code
+
+    pass_through_codes_identifiers = frozenset(PASS_THROUGH_CODES)
+
+    return decorator
+
+
+def remove_pass_through(decorator):
+    """
+    Stop trusting the decorator to pass calls through.
+    """
+    global pass_through_codes_identifiers
+
+    for code in get_pass_through_codes(decorator=decorator):
+        PASS_THROUGH_CODES.pop(id(code), None)
+
+    pass_through_codes_identifiers = frozenset(PASS_THROUGH_CODES)
+
+
+def skip_pass_through_frames(frame):
+    """
+    Get the frame or, if it is the frame of the pass-through decorator's wrapper, the first frame after the wrappers.
+
+    Every frame is checked by the code object identifier in the frozen set, code objects are kept in the registry, so
+    identifiers are not reused.
+    """
+    while id(frame.f_code) in pass_through_codes_identifiers:
+        frame = frame.f_back
+
+    return frame
+
+
+def deny_access(class_name, method, caller_frame):
+    """
+    Deny access to the method of the class called from the caller frame.
+
+    Raise inaccessible due to its protection level exception or, if audit enforcement mode is enabled, record
+    the violation and allow the access.
+    """
+    auditor = get_current_auditor()
+
+    if auditor is None:
+        raise InaccessibleDueToItsProtectionLevelException(
+            INACCESSIBLE_DUE_TO_ITS_PROTECTION_LEVEL_EXCEPTION_MESSAGE.format(
+                class_name=class_name, class_method_name=method.__name__,
+            ),
+        )
+
+    auditor.record(class_name=class_name, method=method, caller_frame=caller_frame)
+
+
+def check_private_access(instance_class, method, caller_frame):
+    """
+    Check the private method is not inherited by the class of the instance it is called on.
+    """
+    does_class_contain_private_method, class_that_contains_private_method = \
+        does_classes_contain_private_method(classes=instance_class.__bases__, method=method)
+
+    if does_class_contain_private_method:
+        deny_access(class_name=class_that_contains_private_method.__name__, method=method, caller_frame=caller_frame)
+
+
+def check_access(instance_class, method, access_type, caller_frame):
+    """
+    Check accessibility level of the method called on the instance of the class from the caller frame.
+
+    Private method is inaccessible if one of the class bases contains it. Both private and protected methods are
+    accessible only from the methods of the class itself, the class of the caller is found by the caller frame.
+    """
+    caller_frame = skip_pass_through_frames(frame=caller_frame)
+
+    if access_type == AccessModifierTypes.PRIVATE:
+        check_private_access(instance_class=instance_class, method=method, caller_frame=caller_frame)
+
+    method_caller_class = get_method_class_by_frame(frame=caller_frame)
+
+    if instance_class is not method_caller_class:
+        deny_access(class_name=instance_class.__name__, method=method, caller_frame=caller_frame)
+
+
+def check_access_by_code_set(instance_class, method, access_type, caller_frame):
+    """
+    Check accessibility level of the method the same way `check_access` does, but by the set of methods code objects.
+
+    The caller is allowed if its code object is the code object of one of the methods the class defines itself, so
+    the caller's module globals are not browsed and the classes do not need to be reachable from them. Methods added
+    to the class or replaced after the set is cached are found as well.
+    """
+    caller_frame = skip_pass_through_frames(frame=caller_frame)
+
+    if access_type == AccessModifierTypes.PRIVATE:
+        check_private_access(instance_class=instance_class, method=method, caller_frame=caller_frame)
+
+    if not does_class_contain_code(class_=instance_class, code=caller_frame.f_code):
+        deny_access(class_name=instance_class.__name__, method=method, caller_frame=caller_frame)
+
+
+class AccessWrapper:
     """
-    def protected_wrapper(*args, **kwargs):
+    Provide accessibility level wrapper of the class member.
+
+    Wrapper is bound to the class object the same way as function is. It exposes the access modifier type, the class
+    that owns the member, the member it wraps and the method under possible decorators chain as attributes, so they are
+    read directly instead of being guessed from names and closures.
+
+    Wrapper keeps only the member, its type, the access modifier type, the owner and the decorated method in slots,
+    everything else (e.g. name, documentation, attributes) is read from the member, so it looks like the member
+    without copying its attributes.
+
+    Access is checked by `access_check` of the current enforcement engine, shared by all the wrappers, None if access
+    is not checked.
+    """
+
+    __slots__ = ('function', 'member_type', 'access_type', 'owner_reference', 'decorated_method', '__weakref__')
+
+    access_check = staticmethod(check_access)
+
+    def __init__(self, function, access_type):
         """
-        Provide private accessibility level wrapper.
+        Constructor.
         """
-        instance, *arguments_without_instance = args
-        instance_class = instance.__class__
+        self.function = function
+        self.member_type = ClassMemberTypes.METHOD
+        self.access_type = access_type
+        self.owner_reference = None
+        self.decorated_method = find_decorated_method(function=function)
+
+        if function.__class__.__name__ in (ClassMemberTypes.STATIC_METHOD, ClassMemberTypes.CLASS_METHOD):
+            self.member_type = function.__class__.__name__
+
+    def __getattr__(self, name):
+        """
+        Get attribute of the member, as the wrapper looks like the member.
+
+        Name and qualified name (e.g. `Car.start_engine`) of the member, so the wrapper is pickled as the member, and
+        attributes set by other decorators are got this way.
+        """
+        if name in AccessWrapper.__slots__:
+            raise AttributeError(name)
+
+        return getattr(unwrap_class_member(member=self.function), name)
+
+    @property
+    def __wrapped__(self):
+        """
+        Get the member the wrapper wraps, static method or class method object for static and class methods.
+        """
+        return self.function
+
+    @property
+    def __module__(self):
+        """
+        Get name of the module the member is defined in, so the wrapper is pickled as the member.
+        """
+        return self.function.__module__
+
+    @property
+    def __doc__(self):
+        """
+        Get documentation of the member.
+        """
+        return self.function.__doc__
+
+    @property
+    def __access_type__(self):
+        """
+        Get access modifier type of the member.
+        """
+        return self.access_type
+
+    @property
+    def __member_type__(self):
+        """
+        Get type of the member: method, static method or class method.
+        """
+        return self.member_type
+
+    @property
+    def __decorated_method__(self):
+        """
+        Get method under possible decorators chain.
+        """
+        return self.decorated_method
+
+    @property
+    def __owner__(self):
+        """
+        Get the class that owns the member, None if the member is not set to the class.
+        """
+        if self.owner_reference is None:
+            return None
+
+        return self.owner_reference()
 
-        if os.environ.get(DISABLE_ACCESSIFY_ENV_VARIABLE_NAME) is None:
-            method = find_decorated_method(function=func)
+    @property
+    def _is_coroutine(self):
+        """
+        Get coroutine function mark `asyncio.iscoroutinefunction` checks, None if the member is not coroutine function.
+
+        Wrapper checks access synchronously when it is called, so the caller is the frame that creates the coroutine
+        (or the generator, or the asynchronous generator) and no extra wrapping layer is needed. The only thing to fix
+        is introspection: frameworks use `asyncio.iscoroutinefunction` or `inspect.iscoroutinefunction` (Python 3.12+)
+        to decide whether the callable should be awaited.
+        """
+        if not is_coroutine_function(function=self.function):
+            return None
+
+        from asyncio import coroutines
+
+        return coroutines._is_coroutine
+
+    @property
+    def _is_coroutine_marker(self):
+        """
+        Get coroutine function mark `inspect.iscoroutinefunction` checks, None if the member is not coroutine function.
+        """
+        if not is_coroutine_function(function=self.function):
+            return None
+
+        import inspect
+
+        return getattr(inspect, '_is_coroutine_mark', None)
+
+    def __set_name__(self, owner, name):
+        """
+        Remember the class that owns the member.
+
+        The class is referenced weakly, so caches those keep members do not keep the class alive. Hooks (e.g. of
+        the monitoring engine) are called with the wrapper, the class and the name, those could replace the wrapper.
+        """
+        self.owner_reference = weakref.ref(owner)
+
+        for hook in SET_NAME_HOOKS:
+            hook(self, owner, name)
+
+    def __get__(self, instance, owner=None):
+        """
+        Bind the wrapper to the class object.
+        """
+        if instance is None:
+            return self
+
+        return types.MethodType(self, instance)
+
+    def __reduce__(self):
+        """
+        Pickle the wrapper by the qualified name as function is pickled.
+        """
+        return self.__qualname__
+
+    def __repr__(self):
+        """
+        Get representation of the wrapper.
+        """
+        return '<{access_type} {qualname}>'.format(access_type=self.access_type, qualname=self.__qualname__)
+
+    def __call__(self, instance, *args, **kwargs):
+        """
+        Check accessibility level of the member for the caller, then call the member.
+
+        Access is not checked inside the trusted block, it is read before the environment variable as it is cheaper.
+        """
+        instance_class = instance.__class__
 
-            method_caller_frame = inspect.currentframe().f_back
-            method_caller_class = get_method_class_by_frame(frame=method_caller_frame)
+        access_check = self.access_check
 
-            if instance_class is not method_caller_class:
-                raise InaccessibleDueToItsProtectionLevelException(
-                    INACCESSIBLE_DUE_TO_ITS_PROTECTION_LEVEL_EXCEPTION_MESSAGE.format(
-                        class_name=instance_class.__name__, class_method_name=method.__name__,
-                    ),
+        if access_check is not None and not TRUSTED_BLOCK.get():
+            if os.environ.get(DISABLE_ACCESSIFY_ENV_VARIABLE_NAME) is None:
+                access_check(
+                    instance_class=instance_class,
+                    method=self.decorated_method,
+                    access_type=self.access_type,
+                    caller_frame=sys._getframe(1),
                 )
 
-        if func.__class__.__name__ == ClassMemberTypes.CLASS_METHOD:
-            arguments = (instance_class, ) + tuple(arguments_without_instance)
-            return func.__func__(*arguments, **kwargs)
+        if self.member_type == ClassMemberTypes.CLASS_METHOD:
+            return self.function.__func__(instance_class, *args, **kwargs)
 
-        elif func.__class__.__name__ == ClassMemberTypes.STATIC_METHOD:
-            return func.__func__(*arguments_without_instance, **kwargs)
+        if self.member_type == ClassMemberTypes.STATIC_METHOD:
+            return self.function.__func__(*args, **kwargs)
 
-        else:
-            return func(*args, **kwargs)
+        return self.function(instance, *args, **kwargs)
+
+
+def private(func):
+    """
+    Provide private accessibility level.
+    """
+    return AccessWrapper(function=func, access_type=AccessModifierTypes.PRIVATE)
+
+
+def protected(func):
+    """
+    Provide protected accessibility level.
+    """
+    return AccessWrapper(function=func, access_type=AccessModifierTypes.PROTECTED)
+
+
+@contextlib.contextmanager
+def trusted():
+    """
+    Provide block of the code, accessibility levels are not checked inside, for the current thread or asyncio task.
+
+    Used by the code known to be correct, that calls members with accessibility levels in tight loops, so calls cost
+    a single context variable read instead of the check. The block is kept in the context variable, the token to
+    restore it is local to the block, so blocks could be nested and entered by many threads and tasks at once.
+
+        with accessify.trusted():
+            for order in orders:
+                order.recalculate()
+    """
+    token = TRUSTED_BLOCK.set(True)
 
-    return protected_wrapper
+    try:
+        yield
+    finally:
+        TRUSTED_BLOCK.reset(token)
@@ -0,0 +1,242 @@
+"""
+Provide audit enforcement mode that records accessibility levels violations instead of raising.
+"""
+import collections
+import threading
+import weakref
+
+from accessify.errors import INACCESSIBLE_DUE_TO_ITS_PROTECTION_LEVEL_EXCEPTION_MESSAGE
+
+ACCESSIFY_LOGGER_NAME = 'accessify'
+AUDIT_BUFFER_CAPACITY = 1024
+AUDIT_FLUSH_BATCH_SIZE = 128
+AUDIT_FLUSH_INTERVAL_SECONDS = 1.0
+AUDIT_FLUSHER_THREAD_NAME = 'accessify-audit-flusher'
+
+ACCESS_VIOLATION_MESSAGE = '{message} (called from {caller_name} in {caller_filename}:{caller_line_number})'
+AUDIT_SINK_FAILURE_MESSAGE = 'Accessibility levels violations have not been passed to the sink.'
+
+current_auditor = None
+
+
+class AccessViolation:
+    """
+    Provide implementation of recorded accessibility level violation.
+    """
+
+    def __init__(self, class_name, class_method_name, caller_code, caller_line_number):
+        """
+        Constructor.
+        """
+        self.class_name = class_name
+        self.class_method_name = class_method_name
+        self.caller_code = caller_code
+        self.caller_line_number = caller_line_number
+
+    @property
+    def message(self):
+        """
+        Get human readable description of the violation.
+        """
+        return ACCESS_VIOLATION_MESSAGE.format(
+            message=INACCESSIBLE_DUE_TO_ITS_PROTECTION_LEVEL_EXCEPTION_MESSAGE.format(
+                class_name=self.class_name, class_method_name=self.class_method_name,
+            ),
+            caller_name=self.caller_code.co_name,
+            caller_filename=self.caller_code.co_filename,
+            caller_line_number=self.caller_line_number,
+        )
+
+
+class LoggingSink:
+    """
+    Provide sink that writes violations to the logger.
+    """
+
+    def __init__(self, logger=None):
+        """
+        Constructor.
+        """
+        if logger is None:
+            import logging
+
+            logger = logging.getLogger(ACCESSIFY_LOGGER_NAME)
+
+        self.logger = logger
+
+    def __call__(self, violations):
+        """
+        Write batch of violations to the logger.
+        """
+        for violation in violations:
+            self.logger.warning(violation.message)
+
+
+class FileSink:
+    """
+    Provide sink that appends violations to the file, one violation per line.
+    """
+
+    def __init__(self, path):
+        """
+        Constructor.
+        """
+        self.path = path
+
+    def __call__(self, violations):
+        """
+        Append batch of violations to the file.
+        """
+        with open(self.path, 'a') as file:
+            file.writelines(violation.message + '\n' for violation in violations)
+
+
+class AccessViolationsAuditor:
+    """
+    Provide implementation of accessibility levels violations auditor.
+
+    Violations are deduplicated by caller code and method and put to the bounded in-memory ring buffer, so recording
+    never blocks on I/O. Caller codes and methods are referenced weakly, so recorded violations do not keep classes
+    created at runtime alive. The background thread flushes the buffer to the sink by batches.
+    """
+
+    def __init__(
+        self,
+        sink=None,
+        capacity=AUDIT_BUFFER_CAPACITY,
+        batch_size=AUDIT_FLUSH_BATCH_SIZE,
+        flush_interval=AUDIT_FLUSH_INTERVAL_SECONDS,
+    ):
+        """
+        Constructor.
+        """
+        self.sink = LoggingSink() if sink is None else sink
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.buffer = collections.deque(maxlen=capacity)
+        self.seen = weakref.WeakKeyDictionary()
+        self.wake_up = threading.Event()
+        self.stopped = threading.Event()
+        self.flusher = None
+
+    def record(self, class_name, method, caller_frame):
+        """
+        Record the violation if it has not been recorded for the caller code and method yet.
+        """
+        caller_code = caller_frame.f_code
+        seen_methods = self.seen.get(caller_code)
+
+        if seen_methods is None:
+            seen_methods = self.seen.setdefault(caller_code, weakref.WeakSet())
+
+        if method in seen_methods:
+            return
+
+        seen_methods.add(method)
+        self.buffer.append(
+            AccessViolation(
+                class_name=class_name,
+                class_method_name=method.__name__,
+                caller_code=caller_code,
+                caller_line_number=caller_frame.f_lineno,
+            ),
+        )
+
+        if len(self.buffer) >= self.batch_size:
+            self.wake_up.set()
+
+    def flush(self):
+        """
+        Pass all buffered violations to the sink by batches.
+        """
+        batch = []
+
+        while self.buffer:
+
+            try:
+                batch.append(self.buffer.popleft())
+            except IndexError:
+                break
+
+            if len(batch) == self.batch_size:
+                self.sink(batch)
+                batch = []
+
+        if batch:
+            self.sink(batch)
+
+    def run(self):
+        """
+        Flush buffered violations periodically or when the batch is ready until the auditor is stopped.
+
+        Errors of the sink (e.g. of writing to the file) are logged and the batch is dropped, so the thread keeps
+        flushing violations recorded after.
+        """
+        while not self.stopped.is_set():
+            self.wake_up.wait(self.flush_interval)
+            self.wake_up.clear()
+
+            try:
+                self.flush()
+            except Exception:
+                import logging
+
+                logging.getLogger(ACCESSIFY_LOGGER_NAME).exception(AUDIT_SINK_FAILURE_MESSAGE)
+
+    def start(self):
+        """
+        Start background flushing thread.
+        """
+        self.stopped.clear()
+        self.flusher = threading.Thread(target=self.run, name=AUDIT_FLUSHER_THREAD_NAME, daemon=True)
+        self.flusher.start()
+
+    def stop(self):
+        """
+        Stop background flushing thread and flush the rest of buffered violations.
+        """
+        self.stopped.set()
+        self.wake_up.set()
+
+        if self.flusher is not None:
+            self.flusher.join()
+            self.flusher = None
+
+        self.flush()
+
+
+def get_current_auditor():
+    """
+    Get auditor that records violations if audit enforcement mode is enabled, else None.
+    """
+    return current_auditor
+
+
+def enable_audit(sink=None, **auditor_options):
+    """
+    Enable audit enforcement mode.
+
+    Denied accesses are recorded to the sink instead of raising the inaccessible due to its protection level exception.
+    """
+    global current_auditor
+
+    disable_audit()
+
+    auditor = AccessViolationsAuditor(sink=sink, **auditor_options)
+    auditor.start()
+
+    current_auditor = auditor
+
+    return auditor
+
+
+def disable_audit():
+    """
+    Disable audit enforcement mode and flush violations recorded so far.
+    """
+    global current_auditor
+
+    auditor, current_auditor = current_auditor, None
+
+    if auditor is not None:
+        auditor.stop()
@@ -0,0 +1,429 @@
+"""
+Provide import hook that compiles accessibility level checks into the methods instead of wrapping them.
+"""
+import ast
+import importlib.machinery
+import importlib.util
+import marshal
+import os
+import sys
+
+from accessify.access import AccessWrapper
+from accessify.utils import (
+    DISABLE_ACCESSIFY_ENV_VARIABLE_NAME,
+    TRUSTED_BLOCK,
+    AccessModifierTypes,
+    ClassMemberMagicMethodNames,
+    ClassMemberTypes,
+    compute_class_methods_codes_identifiers,
+    find_decorated_method,
+    mangle_name,
+)
+
+COMPILER_VERSION = 2
+BYTECODE_OPTIMIZATION_PREFIX = 'accessify'
+
+GET_FRAME_NAME = '__accessify_get_frame__'
+GET_IDENTIFIER_NAME = '__accessify_id__'
+CHECK_ACCESS_NAME = '__accessify_check__'
+COMPILE_CLASS_NAME = '__accessify_compile_class__'
+MARK_NAME = '__accessify_mark__'
+
+ACCESS_TYPES = (AccessModifierTypes.PRIVATE, AccessModifierTypes.PROTECTED)
+
+RUNTIME_IMPORTS = (
+    'from builtins import id as {get_identifier_name}\n'
+    'from sys import _getframe as {get_frame_name}\n'
+    'from accessify.compiler import check_compiled_access as {check_access_name}, '
+    'compile_class as {compile_class_name}, mark as {mark_name}\n'
+).format(
+    get_identifier_name=GET_IDENTIFIER_NAME,
+    get_frame_name=GET_FRAME_NAME,
+    check_access_name=CHECK_ACCESS_NAME,
+    compile_class_name=COMPILE_CLASS_NAME,
+    mark_name=MARK_NAME,
+)
+
+ACCESS_CHECK_TEMPLATE = (
+    'if (\n'
+    '    {instance_class} is not __class__ or\n'
+    '    {get_identifier_name}({get_frame_name}(1).f_code) not in __class__.{codes_name}\n'
+    '):\n'
+    '    {check_access_name}({instance_class}, __class__, {name!r}, {access_type!r}, {get_frame_name}(1))\n'
+)
+
+current_finder = None
+
+
+class AccessChecksTransformer(ast.NodeTransformer):
+    """
+    Provide transformer of classes methods with accessibility levels decorators to methods with inline access checks.
+
+    The check compares the caller's code object identifier with identifiers of the code objects of the methods the
+    class defines itself, so the caller that is allowed costs one identity comparison and one set lookup. Otherwise
+    the access is checked by the current enforcement engine the same way wrappers check it.
+
+        class Car:
+
+            @private
+            def start_engine(self):
+                return 'Engine sound.'
+
+    is compiled as
+
+        @__accessify_compile_class__
+        class Car:
+
+            @__accessify_mark__('private')
+            def start_engine(self):
+                if self.__class__ is not __class__ or __accessify_id__(__accessify_get_frame__(1).f_code) not in ...:
+                    __accessify_check__(self.__class__, __class__, 'start_engine', 'private', ...)
+                return 'Engine sound.'
+
+    The mark keeps access modifier type as the method attribute, so interfaces, `dir` and private methods lookup
+    in the bases see it. Methods the check could not be compiled into keep the wrappers, see `get_access_type`.
+    """
+
+    def __init__(self):
+        """
+        Constructor.
+        """
+        self.is_transformed = False
+
+    def visit_ClassDef(self, node):  # noqa: N802
+        """
+        Compile access checks into methods of the class and its nested classes.
+        """
+        self.generic_visit(node)
+
+        is_class_transformed = False
+
+        for member in node.body:
+            if isinstance(member, ast.FunctionDef) and self.transform_method(class_name=node.name, method=member):
+                is_class_transformed = True
+
+        if is_class_transformed:
+            node.decorator_list.append(ast.copy_location(ast.Name(id=COMPILE_CLASS_NAME, ctx=ast.Load()), node))
+            self.is_transformed = True
+
+        return node
+
+    def transform_method(self, class_name, method):
+        """
+        Replace accessibility level decorator of the method by the mark and compile the access check into its body.
+
+        Return true if the method has been transformed.
+        """
+        access_type = get_access_type(method=method)
+
+        if access_type is None:
+            return False
+
+        first_argument_name = (method.args.posonlyargs + method.args.args)[0].arg
+
+        if len(method.decorator_list) == 2:
+            instance_class = first_argument_name
+        else:
+            instance_class = first_argument_name + '.__class__'
+
+        access_check = ast.parse(
+            ACCESS_CHECK_TEMPLATE.format(
+                instance_class=instance_class,
+                get_identifier_name=GET_IDENTIFIER_NAME,
+                get_frame_name=GET_FRAME_NAME,
+                codes_name=ClassMemberMagicMethodNames.ACCESSIFY_CODES,
+                check_access_name=CHECK_ACCESS_NAME,
+                name=mangle_name(class_name=class_name, name=method.name),
+                access_type=access_type,
+            ),
+        ).body[0]
+
+        for node in ast.walk(access_check):
+            ast.copy_location(node, method)
+
+        method.decorator_list[0] = ast.copy_location(
+            ast.Call(
+                func=ast.Name(id=MARK_NAME, ctx=ast.Load()), args=[ast.Constant(value=access_type)], keywords=[],
+            ),
+            method.decorator_list[0],
+        )
+        ast.fix_missing_locations(method.decorator_list[0])
+
+        method.body.insert(1 if has_docstring(node=method) else 0, access_check)
+
+        return True
+
+
+class AccessifyLoader(importlib.machinery.SourceFileLoader):
+    """
+    Provide loader of the module source, that compiles accessibility level checks into the methods.
+
+    Compiled bytecode is cached in `__pycache__` next to the regular one, tagged by the compiler version (e.g.
+    `cars.cpython-312.opt-accessify2.pyc`), so modules imported without the hook do not load it and vice versa.
+    """
+
+    def source_to_code(self, data, path, *, _optimize=-1):
+        """
+        Compile the source with access checks.
+        """
+        tree = transform(tree=ast.parse(data, filename=path))
+        return compile(tree, path, 'exec', dont_inherit=True, optimize=_optimize)
+
+    def get_code(self, fullname):
+        """
+        Get code of the module from the cached compiled bytecode if it is up to date, compile the source otherwise.
+        """
+        source_path = self.get_filename(fullname)
+        bytecode_path = importlib.util.cache_from_source(source_path, optimization=get_bytecode_optimization())
+        bytecode_header = get_bytecode_header(source_stats=self.path_stats(source_path))
+
+        try:
+            bytecode = self.get_data(bytecode_path)
+        except OSError:
+            pass
+        else:
+            if bytecode[:len(bytecode_header)] == bytecode_header:
+                return marshal.loads(memoryview(bytecode)[len(bytecode_header):])
+
+        code = self.source_to_code(self.get_data(source_path), source_path)
+
+        if not sys.dont_write_bytecode:
+            self.set_data(bytecode_path, bytecode_header + marshal.dumps(code))
+
+        return code
+
+
+class AccessifyFinder:
+    """
+    Provide `sys.meta_path` finder of the opted-in packages modules, that are loaded by the accessify loader.
+    """
+
+    def __init__(self, packages_names):
+        """
+        Constructor.
+        """
+        self.packages_names = tuple(packages_names)
+
+    def is_opted_in(self, module_name):
+        """
+        Check if the module is one of the opted-in packages or their submodules.
+        """
+        return any(
+            module_name == package_name or module_name.startswith(package_name + '.')
+            for package_name in self.packages_names
+        )
+
+    def find_spec(self, fullname, path, target=None):
+        """
+        Find specification of the opted-in package module with the source, that is loaded by the accessify loader.
+        """
+        if not self.is_opted_in(module_name=fullname):
+            return None
+
+        spec = importlib.machinery.PathFinder.find_spec(fullname, path)
+
+        if spec is None or not isinstance(spec.loader, importlib.machinery.SourceFileLoader):
+            return None
+
+        spec.loader = AccessifyLoader(fullname, spec.origin)
+        spec.cached = importlib.util.cache_from_source(spec.origin, optimization=get_bytecode_optimization())
+
+        return spec
+
+    def invalidate_caches(self):
+        """
+        Invalidate caches of the finder, it has no caches.
+        """
+
+
+def get_access_type(method):
+    """
+    Get access modifier type of the method the access check could be compiled into, None if it could not.
+
+    The check is compiled into methods and class methods decorated by accessibility level decorator (`@private`,
+    `@accessify.protected`) only. Methods under other decorators (those could call them differently or at other
+    time), static methods (those do not take the instance), methods without arguments and generators (those body
+    runs on the first iteration, not when they are called) keep the wrappers.
+    """
+    decorators = method.decorator_list
+
+    if not decorators or len(decorators) > 2:
+        return None
+
+    access_decorator = decorators[0]
+
+    if isinstance(access_decorator, ast.Name):
+        access_type = access_decorator.id
+    elif isinstance(access_decorator, ast.Attribute):
+        access_type = access_decorator.attr
+    else:
+        return None
+
+    if access_type not in ACCESS_TYPES:
+        return None
+
+    if len(decorators) == 2 and not (
+        isinstance(decorators[1], ast.Name) and decorators[1].id == ClassMemberTypes.CLASS_METHOD
+    ):
+        return None
+
+    if not method.args.posonlyargs + method.args.args or is_generator(function=method):
+        return None
+
+    return access_type
+
+
+def is_generator(function):
+    """
+    Check if the function is a generator, i.e. yields in its own body, not in nested functions and classes.
+    """
+    nodes = list(function.body)
+
+    while nodes:
+        node = nodes.pop()
+
+        if isinstance(node, (ast.Yield, ast.YieldFrom)):
+            return True
+
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef)):
+            nodes.extend(ast.iter_child_nodes(node))
+
+    return False
+
+
+def has_docstring(node):
+    """
+    Check if the first statement of the node body is a docstring.
+    """
+    first_statement = node.body[0]
+
+    return isinstance(first_statement, ast.Expr) and isinstance(first_statement.value, ast.Constant) \
+        and isinstance(first_statement.value.value, str)
+
+
+def transform(tree):
+    """
+    Compile access checks into the methods of the module tree classes, import runtime helpers if any is compiled.
+
+    Helpers are imported after the module docstring and `__future__` imports.
+    """
+    transformer = AccessChecksTransformer()
+    tree = transformer.visit(tree)
+
+    if not transformer.is_transformed:
+        return tree
+
+    index = 1 if tree.body and has_docstring(node=tree) else 0
+
+    while index < len(tree.body) and isinstance(tree.body[index], ast.ImportFrom) \
+            and tree.body[index].module == '__future__':
+        index += 1
+
+    tree.body[index:index] = ast.parse(RUNTIME_IMPORTS).body
+
+    return ast.fix_missing_locations(tree)
+
+
+def get_bytecode_optimization():
+    """
+    Get optimization tag of the compiled bytecode file name, that includes the compiler version and optimization level.
+    """
+    optimization = BYTECODE_OPTIMIZATION_PREFIX + str(COMPILER_VERSION)
+
+    if sys.flags.optimize:
+        optimization += 'opt' + str(sys.flags.optimize)
+
+    return optimization
+
+
+def get_bytecode_header(source_stats):
+    """
+    Get header of the compiled bytecode file: magic number, flags, source modification time and size as `.pyc` has.
+    """
+    return b''.join((
+        importlib.util.MAGIC_NUMBER,
+        (0).to_bytes(4, 'little'),
+        (int(source_stats['mtime']) & 0xFFFFFFFF).to_bytes(4, 'little'),
+        (source_stats.get('size', 0) & 0xFFFFFFFF).to_bytes(4, 'little'),
+    ))
+
+
+def mark(access_type):
+    """
+    Mark the member with the access modifier type instead of wrapping it, used by compiled classes.
+    """
+    def decorator(member):
+        """
+        Mark decorator.
+        """
+        setattr(member, ClassMemberMagicMethodNames.ACCESS_TYPE, access_type)
+        return member
+
+    return decorator
+
+
+def compile_class(class_):
+    """
+    Remember identifiers of code objects of the methods the compiled class defines itself.
+
+    Code objects nested in the methods (e.g. of lambdas) are included, inline access checks compare callers code
+    objects identifiers with them. Code objects are compared by identity, as equal code objects could be defined in
+    different modules.
+    """
+    setattr(
+        class_,
+        ClassMemberMagicMethodNames.ACCESSIFY_CODES,
+        compute_class_methods_codes_identifiers(class_=class_),
+    )
+
+    return class_
+
+
+def check_compiled_access(instance_class, class_, name, access_type, caller_frame):
+    """
+    Check access to the compiled method by the current enforcement engine, if the inline check has not allowed it.
+    """
+    access_check = AccessWrapper.access_check
+
+    if access_check is None or TRUSTED_BLOCK.get() or os.environ.get(DISABLE_ACCESSIFY_ENV_VARIABLE_NAME) is not None:
+        return
+
+    access_check(
+        instance_class=instance_class,
+        method=find_decorated_method(function=class_.__dict__[name]),
+        access_type=access_type,
+        caller_frame=caller_frame,
+    )
+
+
+def install_import_hook(packages_names):
+    """
+    Compile accessibility level checks into the methods of the opted-in packages modules imported after.
+
+        import accessify.compiler
+
+        accessify.compiler.install_import_hook(['cars'])
+
+        import cars
+
+    Methods are not wrapped, the caller is checked by a comparison inlined into the method body, so allowed calls
+    cost almost nothing. Should be installed before the packages are imported, modules imported before are kept.
+    """
+    global current_finder
+
+    uninstall_import_hook()
+
+    current_finder = AccessifyFinder(packages_names=packages_names)
+    sys.meta_path.insert(0, current_finder)
+
+
+def uninstall_import_hook():
+    """
+    Stop compiling accessibility level checks into the modules imported after.
+    """
+    global current_finder
+
+    finder, current_finder = current_finder, None
+
+    if finder in sys.meta_path:
+        sys.meta_path.remove(finder)
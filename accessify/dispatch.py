@@ -0,0 +1,97 @@
+"""
+Provide dispatching calls by interfaces implemented by the class of the first argument.
+"""
+import functools
+import threading
+import weakref
+
+from accessify.registry import INTERFACES_REGISTRY
+from accessify.utils import IdentityCache
+
+INTERFACE_DISPATCHERS = weakref.WeakSet()
+
+
+class InterfaceDispatcher:
+    """
+    Provide function that dispatches calls to implementations registered for interfaces.
+
+    The implementation is chosen by the most specific interface the class of the first argument provides (see
+    `InterfacesRegistry.get_interfaces_resolution_order`), the default function is called if there is no such.
+    Resolution is cached per class, so dispatching costs a dictionary lookup regardless of number of classes and
+    implementations. The cache is invalidated when an implementation or implemented interfaces are registered.
+    """
+
+    def __init__(self, default):
+        """
+        Constructor.
+        """
+        functools.update_wrapper(self, default)
+
+        self.default = default
+        self.implementations = {}
+        self.resolution_cache = IdentityCache()
+        self.registry_version = INTERFACES_REGISTRY.version
+        self.lock = threading.Lock()
+
+        INTERFACE_DISPATCHERS.add(self)
+
+    def register(self, interface, implementation=None):
+        """
+        Register the implementation for the interface, could be used as decorator.
+        """
+        if implementation is None:
+            return functools.partial(self.register, interface)
+
+        with self.lock:
+            implementations = self.implementations.copy()
+            implementations[interface] = implementation
+
+            self.implementations = implementations
+            self.resolution_cache.clear()
+
+        return implementation
+
+    def resolve(self, class_):
+        """
+        Find the implementation for the class.
+        """
+        implementations = self.implementations
+
+        for interface in INTERFACES_REGISTRY.get_interfaces_resolution_order(class_=class_):
+            implementation = implementations.get(interface)
+
+            if implementation is not None:
+                return implementation
+
+        return self.default
+
+    def dispatch(self, class_):
+        """
+        Get the implementation for the class, resolved once per class.
+        """
+        if self.registry_version != INTERFACES_REGISTRY.version:
+            self.resolution_cache.clear()
+            self.registry_version = INTERFACES_REGISTRY.version
+
+        return self.resolution_cache.get(class_, self.resolve)
+
+    def __call__(self, object_, *args, **kwargs):
+        """
+        Call the implementation for the class of the first argument.
+        """
+        return self.dispatch(class_=object_.__class__)(object_, *args, **kwargs)
+
+
+def dispatch(function):
+    """
+    Turn the function into the default implementation of the function that dispatches by interfaces.
+
+        @dispatch
+        def handle(handler, request):
+            raise NotImplementedError
+
+        @handle.register(RepositoryInterface)
+        def handle_repository(repository, request):
+            ...
+    """
+    return InterfaceDispatcher(default=function)
@@ -0,0 +1,174 @@
+"""
+Provide interchangeable engines that enforce accessibility levels.
+"""
+from accessify.access import (
+    AccessWrapper,
+    check_access,
+    check_access_by_code_set,
+)
+from accessify.audit import (
+    disable_audit,
+    enable_audit,
+)
+from accessify.errors import (
+    ENGINE_DOES_NOT_EXIST_EXCEPTION_MESSAGE,
+    EngineDoesNotExistException,
+)
+from accessify.monitoring import MONITORING_ENGINE
+
+
+class EngineNames:
+    """
+    Provide names of the enforcement engines.
+    """
+
+    FRAME = 'frame'
+    CODE_SET = 'code-set'
+    MONITORING = 'monitoring'
+    AUDIT = 'audit'
+    NONE = 'none'
+
+
+class FrameEngine:
+    """
+    Provide reference engine, wrappers find the class of the caller by the caller frame's code and globals.
+    """
+
+    name = EngineNames.FRAME
+    access_check = staticmethod(check_access)
+
+    def start(self):
+        """
+        Start checking access.
+        """
+        access_check = self.access_check
+        AccessWrapper.access_check = None if access_check is None else staticmethod(access_check)
+
+    def stop(self):
+        """
+        Stop checking access.
+        """
+
+
+class CodeSetEngine(FrameEngine):
+    """
+    Provide engine, wrappers check the caller frame's code is in the set of code objects of the class methods.
+    """
+
+    name = EngineNames.CODE_SET
+    access_check = staticmethod(check_access_by_code_set)
+
+
+class MonitoringEngine(FrameEngine):
+    """
+    Provide engine, methods are unwrapped and checked by `sys.monitoring` events, available on Python 3.12 and later.
+
+    Wrappers the monitoring engine keeps (e.g. of static methods) check access as the reference engine does.
+    """
+
+    name = EngineNames.MONITORING
+
+    def start(self):
+        """
+        Start checking access.
+        """
+        MONITORING_ENGINE.enable()
+        super().start()
+
+    def stop(self):
+        """
+        Stop checking access.
+        """
+        MONITORING_ENGINE.uninstall()
+
+
+class AuditEngine(FrameEngine):
+    """
+    Provide engine, violations found as the reference engine does are recorded instead of raising.
+
+    Options (e.g. the sink) are passed to `enable_audit`.
+    """
+
+    name = EngineNames.AUDIT
+
+    def __init__(self, **audit_options):
+        """
+        Constructor.
+        """
+        self.audit_options = audit_options
+
+    def start(self):
+        """
+        Start checking access.
+        """
+        enable_audit(**self.audit_options)
+        super().start()
+
+    def stop(self):
+        """
+        Stop checking access.
+        """
+        disable_audit()
+
+
+class NoneEngine(FrameEngine):
+    """
+    Provide engine, that does not check access at all, wrappers only call the members.
+    """
+
+    name = EngineNames.NONE
+    access_check = None
+
+
+ENGINES = {
+    engine.name: engine for engine in (FrameEngine, CodeSetEngine, MonitoringEngine, AuditEngine, NoneEngine)
+}
+
+current_engine = FrameEngine()
+
+
+def get_engine():
+    """
+    Get name of the current enforcement engine.
+    """
+    return current_engine.name
+
+
+def set_engine(name, **options):
+    """
+    Set the engine that enforces accessibility levels.
+
+        import accessify
+
+        accessify.set_engine('code-set')
+
+    Engines are:
+        - `frame` (default): the reference engine, the class of the caller is found by the caller frame,
+        - `code-set`: the caller code object is looked up in the set of code objects of the class methods,
+        - `monitoring`: methods are unwrapped and checked by `sys.monitoring` (Python 3.12+),
+        - `audit`: violations are recorded instead of raising, options are passed to `enable_audit`,
+        - `none`: access is not checked.
+
+    The previous engine is stopped before the new one is started, and restarted if the new one fails to start (e.g.
+    monitoring is not available).
+    """
+    global current_engine
+
+    engine_class = ENGINES.get(name)
+
+    if engine_class is None:
+        raise EngineDoesNotExistException(
+            ENGINE_DOES_NOT_EXIST_EXCEPTION_MESSAGE.format(engine_name=name, engines_names=', '.join(ENGINES)),
+        )
+
+    engine = engine_class(**options)
+
+    current_engine.stop()
+
+    try:
+        engine.start()
+    except Exception:
+        current_engine.start()
+        raise
+
+    current_engine = engine
@@ -20,6 +20,19 @@ IMPLEMENTED_INTERFACE_MEMBER_HAS_INCORRECT_ACCESS_MODIFIER_EXCEPTION = \
     '{class_name}.{class_method_name}({class_method_arguments}) mismatches ' \
     '{interface_name}.{interface_method_name}() member access modifier.'
 
+CLASS_DOES_NOT_CONFORM_TO_INTERFACES_EXCEPTION_MESSAGE = \
+    'class {class_name} does not conform to implemented interfaces:\n{errors_messages}'
+
+CLASS_DOES_NOT_CONFORM_TO_INTERFACES_ERROR_MESSAGE = '  - {error_message}'
+
+ENGINE_DOES_NOT_EXIST_EXCEPTION_MESSAGE = 'engine {engine_name} does not exist, engines are: {engines_names}'
+
+MONITORING_IS_NOT_SUPPORTED_EXCEPTION_MESSAGE = \
+    'monitoring engine requires sys.monitoring, available on Python 3.12 and later'
+
+MONITORING_TOOLS_IDENTIFIERS_ARE_IN_USE_EXCEPTION_MESSAGE = \
+    'monitoring engine requires one of sys.monitoring tools identifiers {tools_identifiers}, all of them are in use'
+
 
 class InaccessibleDueToItsProtectionLevelException(Exception):
     """
@@ -64,3 +77,33 @@ class ImplementedInterfaceMemberHasIncorrectAccessModifierException(Exception):
 
     def __init__(self, message):
         self.message = message
+
+
+class ClassDoesNotConformToInterfacesException(Exception):
+    """
+    Class does not conform to implemented interfaces exception.
+
+    Aggregates all the mismatches between the class and the interfaces it implements, `diff` contains them structured.
+    """
+
+    def __init__(self, message, diff):
+        self.message = message
+        self.diff = diff
+
+
+class EngineDoesNotExistException(Exception):
+    """
+    Engine does not exist exception.
+    """
+
+    def __init__(self, message):
+        self.message = message
+
+
+class MonitoringIsNotAvailableException(Exception):
+    """
+    Monitoring is not available exception.
+    """
+
+    def __init__(self, message):
+        self.message = message
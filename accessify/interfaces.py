@@ -1,25 +1,29 @@
 """
 Provide implementation of interfaces.
 """
-import inspect
 import os
 
 from accessify.errors import (
+    CLASS_DOES_NOT_CONFORM_TO_INTERFACES_ERROR_MESSAGE,
+    CLASS_DOES_NOT_CONFORM_TO_INTERFACES_EXCEPTION_MESSAGE,
     DECLARED_INTERFACE_EXCEPTION_HAS_NOT_BEEN_IMPLEMENTED_EXCEPTION_MESSAGE,
     IMPLEMENTED_INTERFACE_MEMBER_HAS_INCORRECT_ACCESS_MODIFIER_EXCEPTION,
     INTERFACE_MEMBER_HAS_BEEN_IMPLEMENTED_WITH_MISMATCHED_ARGUMENT_EXCEPTION_MESSAGE,
     INTERFACE_MEMBER_HAS_NOT_BEEN_IMPLEMENTED_EXCEPTION_MESSAGE,
+    ClassDoesNotConformToInterfacesException,
     DeclaredInterfaceExceptionHasNotBeenImplementedException,
     ImplementedInterfaceMemberHasIncorrectAccessModifierException,
     InterfaceMemberHasNotBeenImplementedException,
     InterfaceMemberHasNotBeenImplementedWithMismatchedArgumentsException,
 )
+from accessify.registry import register_implementation
 from accessify.utils import (
     DISABLE_ACCESSIFY_ENV_VARIABLE_NAME,
-    MARK_MEMBER_RAISES_EXCEPTION,
     ClassMemberMagicMethodNames,
     find_decorated_method,
     get_class_members,
+    get_interface_members,
+    get_raised_exceptions_names,
 )
 
 
@@ -37,77 +41,197 @@ def throws(*exceptions):
     return decorator
 
 
-def implements(*interfaces):
+class InterfacesConformanceDiff:
+    """
+    Provide differences between the class and the interfaces it implements.
+
+    Every difference is kept in the list of its kind: missing members are tuples of interface and interface member,
+    wrong access and wrong signature members are tuples of interface, interface member and class member, unraised
+    exceptions are tuples of interface, interface member, class member and exception. Extra members are class members
+    that are not declared by any interface. `errors` contains an exception for every difference except extra members
+    in order of interfaces and their members.
+    """
+
+    def __init__(self, class_):
+        """
+        Constructor.
+        """
+        self.class_ = class_
+        self.missing = []
+        self.extra = []
+        self.wrong_access = []
+        self.wrong_signature = []
+        self.unraised_exceptions = []
+        self.errors = []
+
+    def __bool__(self):
+        """
+        Check if the class does not conform to the interfaces.
+        """
+        return bool(self.errors)
+
+    def add_missing(self, interface, interface_member):
+        """
+        Add interface member that has not been implemented by the class.
+        """
+        self.missing.append((interface, interface_member))
+        self.errors.append(InterfaceMemberHasNotBeenImplementedException(
+            INTERFACE_MEMBER_HAS_NOT_BEEN_IMPLEMENTED_EXCEPTION_MESSAGE.format(
+                class_name=self.class_.__name__,
+                interface_name=interface.__name__,
+                interface_method_name=interface_member.name,
+                interface_method_arguments=interface_member.arguments_as_string,
+            ),
+        ))
+
+    def add_wrong_access(self, interface, interface_member, class_member):
+        """
+        Add class member that has access modifier other than interface member has.
+        """
+        self.wrong_access.append((interface, interface_member, class_member))
+        self.errors.append(ImplementedInterfaceMemberHasIncorrectAccessModifierException(
+            IMPLEMENTED_INTERFACE_MEMBER_HAS_INCORRECT_ACCESS_MODIFIER_EXCEPTION.format(
+                class_name=self.class_.__name__,
+                class_method_name=interface_member.name,
+                class_method_arguments=class_member.arguments_as_string,
+                interface_name=interface.__name__,
+                interface_method_name=interface_member.name,
+            ),
+        ))
+
+    def add_wrong_signature(self, interface, interface_member, class_member):
+        """
+        Add class member that has arguments other than interface member has.
+        """
+        self.wrong_signature.append((interface, interface_member, class_member))
+        self.errors.append(InterfaceMemberHasNotBeenImplementedWithMismatchedArgumentsException(
+            INTERFACE_MEMBER_HAS_BEEN_IMPLEMENTED_WITH_MISMATCHED_ARGUMENT_EXCEPTION_MESSAGE.format(
+                class_name=self.class_.__name__,
+                interface_name=interface.__name__,
+                interface_method_name=interface_member.name,
+                interface_method_arguments=interface_member.arguments_as_string,
+            ),
+        ))
+
+    def add_unraised_exception(self, interface, interface_member, class_member, exception):
+        """
+        Add exception that is declared by interface member, but is not raised by class member.
+        """
+        self.unraised_exceptions.append((interface, interface_member, class_member, exception))
+        self.errors.append(DeclaredInterfaceExceptionHasNotBeenImplementedException(
+            DECLARED_INTERFACE_EXCEPTION_HAS_NOT_BEEN_IMPLEMENTED_EXCEPTION_MESSAGE.format(
+                exception_name=exception.__name__,
+                interface_name=interface.__name__,
+                interface_method_name=interface_member.name,
+                class_name=self.class_.__name__,
+                class_method_name=interface_member.name,
+                class_method_arguments=class_member.arguments_as_string,
+            ),
+        ))
+
+    def get_exception(self):
+        """
+        Get single exception that describes all the differences, None if class conforms to the interfaces.
+
+        If there is the only difference, its own exception is returned.
+        """
+        if len(self.errors) <= 1:
+            return next(iter(self.errors), None)
+
+        return ClassDoesNotConformToInterfacesException(
+            CLASS_DOES_NOT_CONFORM_TO_INTERFACES_EXCEPTION_MESSAGE.format(
+                class_name=self.class_.__name__,
+                errors_messages='\n'.join(
+                    CLASS_DOES_NOT_CONFORM_TO_INTERFACES_ERROR_MESSAGE.format(error_message=error.message)
+                    for error in self.errors
+                ),
+            ),
+            diff=self,
+        )
+
+
+def get_interfaces_conformance_diff(class_, *interfaces, strict=False):
+    """
+    Get all differences between the class and the interfaces it implements in one pass.
+
+    Missing and extra members are found by set operations on member tables keys, other checks are done only for
+    members both interface and class have. Interfaces members tables are cached, so they are shared by all
+    the implementors.
+    """
+    diff = InterfacesConformanceDiff(class_=class_)
+    class_members = get_class_members(class_=class_)
+    interfaces_members_unique_names = set()
+
+    for interface in interfaces:
+        interface_members = get_interface_members(interface=interface)
+        interfaces_members_unique_names.update(interface_members)
+
+        missing_members_unique_names = interface_members.keys() - class_members.keys()
+
+        for unique_name, interface_member in interface_members.items():
+
+            if unique_name in missing_members_unique_names:
+                diff.add_missing(interface=interface, interface_member=interface_member)
+                continue
+
+            class_member = class_members[unique_name]
+
+            if interface_member.access_type != class_member.access_type:
+                diff.add_wrong_access(interface=interface, interface_member=interface_member, class_member=class_member)
+
+            if class_member.get_signature(strict=strict) != interface_member.get_signature(strict=strict):
+                diff.add_wrong_signature(
+                    interface=interface, interface_member=interface_member, class_member=class_member,
+                )
+
+            if hasattr(interface_member.method, ClassMemberMagicMethodNames.THROWS):
+                raised_exceptions_names = get_raised_exceptions_names(code=class_member.method.__code__)
+
+                for exception in interface_member.method.__throws__:
+                    if exception.__name__ not in raised_exceptions_names:
+                        diff.add_unraised_exception(
+                            interface=interface,
+                            interface_member=interface_member,
+                            class_member=class_member,
+                            exception=exception,
+                        )
+
+    extra_members_unique_names = class_members.keys() - interfaces_members_unique_names
+
+    diff.extra = [
+        class_member for unique_name, class_member in class_members.items()
+        if unique_name in extra_members_unique_names
+    ]
+
+    return diff
+
+
+def implements(*interfaces, strict=False):
     """
     Implement detecting whether class that implements interface has been implemented all members of the interface.
 
     Rules:
         - get class members, get interfaces members, compare it,
         - match interface member is presented in the class,
-        - match interface member arguments with class member arguments,
-        - check if interface member has exception to throw, if yes, inspect class member source code if it raise it.
+        - match interface member arguments with class member arguments (and their kinds and annotations if strict),
+        - check if interface member has exception to throw, if yes, inspect class member bytecode if it raise it.
+
+    All the differences are collected at once. If there is the only difference, its own exception is raised, else
+    class does not conform to interfaces exception that aggregates all of them is raised.
+
+    Implemented interfaces are registered, so `provides` answers whether an object implements an interface.
     """
     def decorator(class_):
         """
         Provide logic of implementing interface.
         """
-        if os.environ.get(DISABLE_ACCESSIFY_ENV_VARIABLE_NAME) is not None:
-            return class_
-
-        class_members = get_class_members(class_=class_)
-
-        for interface in interfaces:
-            interface_members = get_class_members(class_=interface)
-
-            for interface_method_unique_identifier, interface_method in interface_members.items():
-                class_member = class_members.get(interface_method_unique_identifier)
-
-                if class_member is None:
-                    raise InterfaceMemberHasNotBeenImplementedException(
-                        INTERFACE_MEMBER_HAS_NOT_BEEN_IMPLEMENTED_EXCEPTION_MESSAGE.format(
-                            class_name=class_.__name__,
-                            interface_name=interface.__name__,
-                            interface_method_name=interface_method.name,
-                            interface_method_arguments=interface_method.arguments_as_string,
-                        ),
-                    )
-
-                if interface_method.access_type != class_member.access_type:
-                    raise ImplementedInterfaceMemberHasIncorrectAccessModifierException(
-                        IMPLEMENTED_INTERFACE_MEMBER_HAS_INCORRECT_ACCESS_MODIFIER_EXCEPTION.format(
-                            class_name=class_.__name__,
-                            class_method_name=interface_method.name,
-                            class_method_arguments=class_member.arguments_as_string,
-                            interface_name=interface.__name__,
-                            interface_method_name=interface_method.name,
-                        ),
-                    )
-
-                if class_member.arguments_as_string != interface_method.arguments_as_string:
-                    raise InterfaceMemberHasNotBeenImplementedWithMismatchedArgumentsException(
-                        INTERFACE_MEMBER_HAS_BEEN_IMPLEMENTED_WITH_MISMATCHED_ARGUMENT_EXCEPTION_MESSAGE.format(
-                            class_name=class_.__name__,
-                            interface_name=interface.__name__,
-                            interface_method_name=interface_method.name,
-                            interface_method_arguments=interface_method.arguments_as_string,
-                        ),
-                    )
-
-                if hasattr(interface_method.method, ClassMemberMagicMethodNames.THROWS):
-                    source_code = inspect.getsource(class_member.method)
-
-                    for exception in interface_method.method.__throws__:
-                        if MARK_MEMBER_RAISES_EXCEPTION.format(exception_name=exception.__name__) not in source_code:
-                            raise DeclaredInterfaceExceptionHasNotBeenImplementedException(
-                                DECLARED_INTERFACE_EXCEPTION_HAS_NOT_BEEN_IMPLEMENTED_EXCEPTION_MESSAGE.format(
-                                    exception_name=exception.__name__,
-                                    interface_name=interface.__name__,
-                                    interface_method_name=interface_method.name,
-                                    class_name=class_.__name__,
-                                    class_method_name=interface_method.name,
-                                    class_method_arguments=class_member.arguments_as_string,
-                                ),
-                            )
+        if os.environ.get(DISABLE_ACCESSIFY_ENV_VARIABLE_NAME) is None:
+            exception = get_interfaces_conformance_diff(class_, *interfaces, strict=strict).get_exception()
+
+            if exception is not None:
+                raise exception
+
+        register_implementation(class_=class_, interfaces=interfaces)
 
         return class_
     return decorator
@@ -0,0 +1,281 @@
+"""
+Provide enforcement of accessibility levels by `sys.monitoring` (PEP 669), available on Python 3.12 and later.
+"""
+import os
+import sys
+import types
+import weakref
+
+from accessify.access import (
+    SET_NAME_HOOKS,
+    AccessWrapper,
+    check_access,
+)
+from accessify.errors import (
+    MONITORING_IS_NOT_SUPPORTED_EXCEPTION_MESSAGE,
+    MONITORING_TOOLS_IDENTIFIERS_ARE_IN_USE_EXCEPTION_MESSAGE,
+    MonitoringIsNotAvailableException,
+)
+from accessify.utils import (
+    DISABLE_ACCESSIFY_ENV_VARIABLE_NAME,
+    NOT_CACHED,
+    TRUSTED_BLOCK,
+    ClassMemberMagicMethodNames,
+    ClassMemberTypes,
+    IdentityCache,
+    unwrap_class_member,
+)
+
+MONITORING_TOOL_NAME = 'accessify'
+MONITORING_TOOLS_IDENTIFIERS = (4, 3)
+MONITORING_NO_EVENTS = 0
+
+
+class MonitoringEngine:
+    """
+    Provide enforcement engine that leaves methods unwrapped and checks access when their code starts.
+
+    Installing the engine replaces accessibility level wrappers in the classes by the methods they wrap and registers
+    the methods code with `sys.monitoring` for `PY_START` events. Unwrapped member keeps access modifier type as
+    an attribute, so interfaces, `dir` and private methods lookup in the bases see it as before. Wrappers of classes
+    created after installing are replaced as soon as they are set to the class.
+
+    Events are local to the methods code, so the rest of the code runs without monitoring. Enabled engine checks
+    the caller in the event callback, disabled engine turns the events off, so methods are called with no overhead and
+    are not checked at all. Uninstalling puts the wrappers back.
+
+    Guarded methods are keyed by code identity and referenced weakly, the classes unwrapped members belong to are
+    referenced weakly as well, so the engine does not keep classes created at runtime alive.
+    """
+
+    def __init__(self):
+        """
+        Constructor.
+        """
+        self.tool_identifier = None
+        self.is_enabled = False
+        self.guards = IdentityCache(maximum_size=sys.maxsize)
+        self.wrappers = weakref.WeakKeyDictionary()
+
+    @property
+    def is_installed(self):
+        """
+        Check if the engine is installed.
+        """
+        return self.tool_identifier is not None
+
+    def install(self):
+        """
+        Take `sys.monitoring` tool identifier and unwrap members of all the classes.
+        """
+        if self.is_installed:
+            return
+
+        if not is_monitoring_supported():
+            raise MonitoringIsNotAvailableException(MONITORING_IS_NOT_SUPPORTED_EXCEPTION_MESSAGE)
+
+        self.tool_identifier = use_monitoring_tool_identifier()
+        sys.monitoring.register_callback(self.tool_identifier, sys.monitoring.events.PY_START, self.check)
+
+        for class_ in get_classes():
+            for name, member in list(class_.__dict__.items()):
+                if isinstance(member, AccessWrapper):
+                    self.unwrap(member, class_, name)
+
+        SET_NAME_HOOKS.append(self.unwrap)
+
+    def uninstall(self):
+        """
+        Put wrappers back to the classes and free `sys.monitoring` tool identifier.
+        """
+        if not self.is_installed:
+            return
+
+        self.disable()
+        SET_NAME_HOOKS.remove(self.unwrap)
+
+        for class_, wrappers in list(self.wrappers.items()):
+            for name, wrapper in wrappers.items():
+                vars(wrapper.function).pop(ClassMemberMagicMethodNames.ACCESS_TYPE, None)
+                setattr(class_, name, wrapper)
+
+        self.wrappers = weakref.WeakKeyDictionary()
+        self.guards.clear()
+
+        sys.monitoring.register_callback(self.tool_identifier, sys.monitoring.events.PY_START, None)
+        sys.monitoring.free_tool_id(self.tool_identifier)
+        self.tool_identifier = None
+
+    def enable(self):
+        """
+        Install the engine if it is not installed and turn events of guarded methods on.
+        """
+        self.install()
+
+        for code in self.guards:
+            sys.monitoring.set_local_events(self.tool_identifier, code, sys.monitoring.events.PY_START)
+
+        self.is_enabled = True
+
+    def disable(self):
+        """
+        Turn events of guarded methods off, methods stay unwrapped.
+        """
+        if not self.is_enabled:
+            return
+
+        for code in self.guards:
+            sys.monitoring.set_local_events(self.tool_identifier, code, MONITORING_NO_EVENTS)
+
+        self.is_enabled = False
+
+    def unwrap(self, wrapper, owner, name):
+        """
+        Replace the wrapper set to the class by the member it wraps and guard the member's method.
+
+        The wrapper is kept if its method could not be guarded, see `get_monitored_method`.
+        """
+        method = get_monitored_method(wrapper=wrapper)
+
+        if method is None:
+            return
+
+        setattr(wrapper.function, ClassMemberMagicMethodNames.ACCESS_TYPE, wrapper.access_type)
+        setattr(owner, name, wrapper.function)
+
+        self.wrappers.setdefault(owner, {})[name] = wrapper
+        self.guards.set(method.__code__, (wrapper.access_type, wrapper.member_type, weakref.ref(method)))
+
+        if self.is_enabled:
+            sys.monitoring.set_local_events(self.tool_identifier, method.__code__, sys.monitoring.events.PY_START)
+
+    def check(self, code, instruction_offset):
+        """
+        Check accessibility level of the method, the code of which has just started, for the caller.
+
+        Called by `sys.monitoring` in the frame of the method, raised exception propagates to the caller.
+        """
+        guard = self.guards.lookup(code)
+
+        if guard is NOT_CACHED or TRUSTED_BLOCK.get():
+            return
+
+        if os.environ.get(DISABLE_ACCESSIFY_ENV_VARIABLE_NAME) is not None:
+            return
+
+        access_type, member_type, method_reference = guard
+        method = method_reference()
+
+        if method is None:
+            return
+
+        method_frame = sys._getframe(1)
+        instance = method_frame.f_locals[code.co_varnames[0]]
+
+        check_access(
+            instance_class=instance if member_type == ClassMemberTypes.CLASS_METHOD else instance.__class__,
+            method=method,
+            access_type=access_type,
+            caller_frame=method_frame.f_back,
+        )
+
+
+MONITORING_ENGINE = MonitoringEngine()
+
+
+def is_monitoring_supported():
+    """
+    Check if `sys.monitoring` is available.
+    """
+    return hasattr(sys, 'monitoring')
+
+
+def use_monitoring_tool_identifier():
+    """
+    Take the first free `sys.monitoring` tool identifier.
+
+    Debugger, coverage, profiler and optimizer identifiers are kept for them.
+    """
+    for tool_identifier in MONITORING_TOOLS_IDENTIFIERS:
+        if sys.monitoring.get_tool(tool_identifier) is None:
+            sys.monitoring.use_tool_id(tool_identifier, MONITORING_TOOL_NAME)
+            return tool_identifier
+
+    raise MonitoringIsNotAvailableException(
+        MONITORING_TOOLS_IDENTIFIERS_ARE_IN_USE_EXCEPTION_MESSAGE.format(
+            tools_identifiers=MONITORING_TOOLS_IDENTIFIERS,
+        ),
+    )
+
+
+def get_classes():
+    """
+    Get all the classes by walking subclasses down from `object`.
+    """
+    classes = [object]
+    seen_classes_identifiers = {id(object)}
+
+    for class_ in classes:
+        for subclass in type.__subclasses__(class_):
+            if id(subclass) not in seen_classes_identifiers:
+                seen_classes_identifiers.add(id(subclass))
+                classes.append(subclass)
+
+    return classes
+
+
+def get_monitored_method(wrapper):
+    """
+    Get method of the wrapper the monitoring engine guards, None if the wrapper should be kept.
+
+    Access is checked when the method's code starts, so the method should be a function that is not under other
+    decorators (code of the decorator's wrapper is shared by all decorated functions), that is run when it is called
+    (code of generator and coroutine functions starts on the first iteration or awaiting) and that takes the instance
+    or the class as the first argument (static methods do not).
+    """
+    import inspect
+
+    if wrapper.member_type == ClassMemberTypes.STATIC_METHOD:
+        return None
+
+    method = unwrap_class_member(member=wrapper.function)
+
+    if not isinstance(method, types.FunctionType) or method is not wrapper.decorated_method:
+        return None
+
+    code = method.__code__
+    not_monitored_code_flags = \
+        inspect.CO_GENERATOR | inspect.CO_COROUTINE | inspect.CO_ITERABLE_COROUTINE | inspect.CO_ASYNC_GENERATOR
+
+    if code.co_argcount == 0 or code.co_flags & not_monitored_code_flags:
+        return None
+
+    return method
+
+
+def enable_monitoring():
+    """
+    Enforce accessibility levels by `sys.monitoring` instead of wrappers.
+
+        import accessify
+
+        accessify.enable_monitoring()
+
+    Methods are unwrapped, so they are called without an extra frame, their callers are checked in `sys.monitoring`
+    events callback. Raise monitoring is not available exception on Python versions before 3.12.
+    """
+    MONITORING_ENGINE.enable()
+
+
+def disable_monitoring():
+    """
+    Stop checking accessibility levels by `sys.monitoring`, methods stay unwrapped and are called with no overhead.
+    """
+    MONITORING_ENGINE.disable()
+
+
+def uninstall_monitoring():
+    """
+    Stop using `sys.monitoring` and put accessibility level wrappers back.
+    """
+    MONITORING_ENGINE.uninstall()
@@ -0,0 +1,211 @@
+"""
+Provide registry of interfaces implemented by classes.
+"""
+import abc
+import threading
+import weakref
+
+from accessify.utils import (
+    ClassMemberMagicMethodNames,
+    IdentityCache,
+)
+
+INTERFACES_ROOTS = (object, abc.ABC)
+QUALIFIED_NAME = '{module}:{qualname}'
+QUALIFIED_NAME_SEPARATOR = ':'
+LOCAL_CLASS_QUALIFIED_NAME_MARK = '<locals>'
+
+
+def get_interface_ancestors(interface):
+    """
+    Get the interface and interfaces it extends.
+    """
+    return tuple(ancestor for ancestor in interface.__mro__ if ancestor not in INTERFACES_ROOTS)
+
+
+class InterfacesRegistry:
+    """
+    Provide registry of interfaces implemented by classes.
+
+    Declarations are written once per class, when the class is created, while membership queries are done at runtime
+    on every call, so interfaces provided by a type (including ones declared by its parents and interfaces extended by
+    declared interfaces) are computed once and cached per type. Registration clears the cache, so queries do not need a
+    lock. Registration increments the version, so caches built on top of the registry know when to be invalidated.
+
+    Reverse index keeps implementors of every interface (including interfaces extended by the declared ones) in weak
+    sets by weakly referenced interfaces, so dynamically created classes and interfaces are not kept alive by the
+    registry.
+    """
+
+    def __init__(self):
+        """
+        Constructor.
+        """
+        self.declarations = weakref.WeakKeyDictionary()
+        self.implementors = weakref.WeakKeyDictionary()
+        self.provided_interfaces_cache = IdentityCache()
+        self.version = 0
+        self.lock = threading.Lock()
+
+    def register(self, class_, interfaces):
+        """
+        Register interfaces implemented by the class.
+
+        Declared interfaces are stored in the `__implements__` class attribute as well. If the interface is an abstract
+        base class, the class is registered as its virtual subclass, so `isinstance` and `issubclass` are answered
+        (and cached per type) by the interface itself.
+        """
+        with self.lock:
+            declared_interfaces = self.declarations.get(class_, ())
+            declared_interfaces += tuple(
+                interface for interface in dict.fromkeys(interfaces) if interface not in declared_interfaces
+            )
+
+            self.declarations[class_] = declared_interfaces
+            setattr(class_, ClassMemberMagicMethodNames.IMPLEMENTS, frozenset(declared_interfaces))
+
+            for interface in interfaces:
+                for ancestor in get_interface_ancestors(interface):
+                    self.implementors.setdefault(ancestor, weakref.WeakSet()).add(class_)
+
+            self.provided_interfaces_cache.clear()
+            self.version += 1
+
+        for interface in interfaces:
+            if isinstance(interface, abc.ABCMeta) and not issubclass(class_, interface):
+                interface.register(class_)
+
+    def get_declared_interfaces(self, class_):
+        """
+        Get interfaces declared by the class itself in order of declaration.
+        """
+        return self.declarations.get(class_, ())
+
+    def get_interfaces_resolution_order(self, class_):
+        """
+        Get interfaces the class provides from the most to the least specific.
+
+        Class parents are walked in method resolution order, their declared interfaces in order of declaration,
+        followed by interfaces they extend.
+        """
+        resolution_order = {}
+
+        for parent in class_.__mro__:
+            for interface in self.declarations.get(parent, ()):
+                resolution_order.update(dict.fromkeys(get_interface_ancestors(interface)))
+
+        return tuple(resolution_order)
+
+    def get_implementors(self, interface):
+        """
+        Get classes declared to implement the interface or interfaces extending it.
+        """
+        implementors = self.implementors.get(interface)
+
+        if implementors is None:
+            return frozenset()
+
+        with self.lock:
+            return frozenset(implementors)
+
+    def compute_provided_interfaces(self, class_):
+        """
+        Compute interfaces the class provides, walking through its parents and interfaces they extend.
+        """
+        return frozenset(self.get_interfaces_resolution_order(class_=class_))
+
+    def get_provided_interfaces(self, class_):
+        """
+        Get interfaces the class provides, computed once per class.
+        """
+        return self.provided_interfaces_cache.get(class_, self.compute_provided_interfaces)
+
+
+INTERFACES_REGISTRY = InterfacesRegistry()
+
+
+def register_implementation(class_, interfaces):
+    """
+    Register interfaces implemented by the class in the global registry.
+    """
+    INTERFACES_REGISTRY.register(class_=class_, interfaces=interfaces)
+
+
+def implementors(interface):
+    """
+    Get classes declared to implement the interface or interfaces extending it.
+    """
+    return INTERFACES_REGISTRY.get_implementors(interface=interface)
+
+
+def get_qualified_name(class_):
+    """
+    Get qualified name of the class that is enough to import it (e.g. `services.exporters:CsvExporter`).
+    """
+    return QUALIFIED_NAME.format(module=class_.__module__, qualname=class_.__qualname__)
+
+
+def import_by_qualified_name(qualified_name):
+    """
+    Import the class by the qualified name.
+    """
+    import importlib
+
+    module_name, qualname = qualified_name.split(QUALIFIED_NAME_SEPARATOR)
+    object_ = importlib.import_module(module_name)
+
+    for name in qualname.split('.'):
+        object_ = getattr(object_, name)
+
+    return object_
+
+
+def write_implementors_manifest(path, interfaces):
+    """
+    Write manifest of the interfaces implementors to the file to discover them without importing all the candidates.
+
+    Manifest is a JSON object with interfaces qualified names as keys and their implementors qualified names as values.
+    Classes defined inside functions could not be imported, so they are skipped. The manifest is expected to be built
+    at build time, when all the modules with implementors are imported.
+    """
+    import json
+
+    manifest = {}
+
+    for interface in interfaces:
+        manifest[get_qualified_name(interface)] = sorted(
+            get_qualified_name(implementor) for implementor in implementors(interface)
+            if LOCAL_CLASS_QUALIFIED_NAME_MARK not in implementor.__qualname__
+        )
+
+    with open(path, 'w') as file:
+        json.dump(manifest, file, indent=4, sort_keys=True)
+
+
+def load_implementors_from_manifest(path, interface):
+    """
+    Load implementors of the interface listed in the manifest, importing only modules they are defined in.
+    """
+    import json
+
+    with open(path) as file:
+        manifest = json.load(file)
+
+    return tuple(
+        import_by_qualified_name(qualified_name)
+        for qualified_name in manifest.get(get_qualified_name(interface), ())
+    )
+
+
+def get_provided_interfaces(class_):
+    """
+    Get interfaces the class provides including ones declared by its parents and extended by declared interfaces.
+    """
+    return INTERFACES_REGISTRY.get_provided_interfaces(class_=class_)
+
+
+def provides(object_, interface):
+    """
+    Check if the object provides the interface, i.e. its class has been declared to implement the interface.
+    """
+    return interface in INTERFACES_REGISTRY.get_provided_interfaces(class_=type(object_))
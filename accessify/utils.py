@@ -1,11 +1,47 @@
 """
 Provide utils.
 """
-import inspect
+import contextvars
+import functools
+import sys
+import threading
+import types
+import weakref
 
-COMMERCIAL_AT_SYMBOL = '@'
 DISABLE_ACCESSIFY_ENV_VARIABLE_NAME = 'DISABLE_ACCESSIFY'
-MARK_MEMBER_RAISES_EXCEPTION = 'raise {exception_name}'
+RAISE_INSTRUCTION_NAME = 'RAISE_VARARGS'
+LOAD_NAME_INSTRUCTIONS_NAMES = (
+    'LOAD_NAME',
+    'LOAD_GLOBAL',
+    'LOAD_DEREF',
+    'LOAD_CLASSDEREF',
+    'LOAD_FROM_DICT_OR_GLOBALS',
+    'LOAD_ATTR',
+    'LOAD_METHOD',
+)
+RECEIVER_LOAD_INSTRUCTIONS_NAMES = (
+    'LOAD_FAST',
+    'LOAD_FAST_CHECK',
+    'LOAD_FAST_LOAD_FAST',
+    'LOAD_DEREF',
+)
+ATTRIBUTE_LOAD_INSTRUCTIONS_NAMES = (
+    'LOAD_ATTR',
+    'LOAD_METHOD',
+)
+LOAD_ATTR_NAME_INDEX_SHIFT = 1 if sys.version_info >= (3, 12) else 0
+MAXIMUM_INSTRUCTION_ARGUMENT = 255
+
+CACHE_MAXIMUM_SIZE = 16384
+INTERNED_SIGNATURES_MAXIMUM_NUMBER = 16384
+
+METHODS_TYPES = (types.FunctionType, types.MethodType)
+
+NOT_CACHED = object()
+NOT_FOUND = object()
+CACHES = weakref.WeakSet()
+
+TRUSTED_BLOCK = contextvars.ContextVar('accessify_trusted_block', default=False)
 
 
 class AccessModifierTypes:
@@ -18,10 +54,16 @@ class AccessModifierTypes:
     PROTECTED = 'protected'
 
 
-ACCESS_WRAPPERS_NAMES = (
-    AccessModifierTypes.PRIVATE + '_wrapper',
-    AccessModifierTypes.PROTECTED + '_wrapper',
-)
+class ArgumentKinds:
+    """
+    Provide function argument kinds.
+    """
+
+    POSITIONAL_ONLY = 'positional_only'
+    POSITIONAL_OR_KEYWORD = 'positional_or_keyword'
+    VARIABLE_POSITIONAL = 'variable_positional'
+    KEYWORD_ONLY = 'keyword_only'
+    VARIABLE_KEYWORD = 'variable_keyword'
 
 
 class ClassMemberMagicMethodNames:
@@ -30,8 +72,14 @@ class ClassMemberMagicMethodNames:
     """
 
     NAME = '__name__'
-    SELF = '__self__'
     THROWS = '__throws__'
+    WRAPPED = '__wrapped__'
+    ACCESS_TYPE = '__access_type__'
+    OWNER = '__owner__'
+    MEMBER_TYPE = '__member_type__'
+    IMPLEMENTS = '__implements__'
+    DECORATED_METHOD = '__decorated_method__'
+    ACCESSIFY_CODES = '__accessify_codes__'
 
 
 class ClassMemberTypes:
@@ -47,6 +95,192 @@ class ClassMemberTypes:
     CLASS_METHOD = 'classmethod'
 
 
+class IdentityCache:
+    """
+    Provide cache of values computed from objects, keyed by the object identity.
+
+    Different objects could be equal (e.g. code objects of the functions with the same body in different files), so
+    objects are not used as keys themselves. Objects are referenced weakly along with the value, so the cache does not
+    keep alive classes and functions created at runtime: the item is discarded when the object is garbage collected,
+    reference is checked on reads to make sure the identifier has not been reused by another object. The cache is
+    bounded, the oldest item is evicted when the cache is full, so values those reference their objects (e.g. members
+    of the class) do not grow the memory infinitely. Objects those could not be referenced weakly are not cached.
+
+    Reads and writes are single dictionary operations those do not need a lock, computing the same value concurrently
+    is harmless. Clearing replaces the table, so values computed before clearing are not written to the new one.
+
+    Frozen cache moves cached items to the frozen table that is never written again, items cached after are put to the
+    new table. So the frozen table pages are kept shared between forked processes.
+    """
+
+    def __init__(self, maximum_size=CACHE_MAXIMUM_SIZE):
+        """
+        Constructor.
+        """
+        self.maximum_size = maximum_size
+        self.table = {}
+        self.frozen_table = {}
+
+        CACHES.add(self)
+
+    def __len__(self):
+        """
+        Get number of cached items.
+        """
+        return len(self.table) + len(self.frozen_table)
+
+    def __iter__(self):
+        """
+        Iterate over alive objects of the cached items.
+        """
+        for reference, _ in [*self.frozen_table.values(), *self.table.values()]:
+            object_ = reference()
+
+            if object_ is not None:
+                yield object_
+
+    def lookup(self, object_):
+        """
+        Get cached value computed from the object, `NOT_CACHED` if it is absent.
+        """
+        cached = self.table.get(id(object_))
+
+        if cached is None:
+            cached = self.frozen_table.get(id(object_))
+
+        if cached is not None and cached[0]() is object_:
+            return cached[1]
+
+        return NOT_CACHED
+
+    def get(self, object_, compute):
+        """
+        Get cached value computed from the object, compute and cache it if it is absent.
+        """
+        table = self.table
+        value = self.lookup(object_)
+
+        if value is NOT_CACHED:
+            value = compute(object_)
+            self.store(table=table, object_=object_, value=value)
+
+        return value
+
+    def set(self, object_, value):
+        """
+        Cache the value computed from the object.
+        """
+        self.store(table=self.table, object_=object_, value=value)
+
+    def store(self, table, object_, value):
+        """
+        Put the value computed from the object to the table, evict the oldest item if the table is full.
+        """
+        try:
+            reference = weakref.ref(object_, functools.partial(self.discard, id(object_)))
+        except TypeError:
+            return
+
+        if len(table) >= self.maximum_size:
+            evict_oldest(table=table)
+
+        table[id(object_)] = (reference, value)
+
+    def discard(self, key, reference):
+        """
+        Discard the item of the garbage collected object.
+
+        Called by the garbage collector at any point, so does not take locks. Frozen table is not written, its items
+        are discarded on unfreezing.
+        """
+        table = self.table
+        cached = table.get(key)
+
+        if cached is not None and cached[0] is reference:
+            table.pop(key, None)
+
+    def clear(self):
+        """
+        Remove all cached items.
+        """
+        self.table = {}
+        self.frozen_table = {}
+
+    def freeze(self):
+        """
+        Move cached items to the frozen table.
+        """
+        self.frozen_table = {**self.frozen_table, **self.table}
+        self.table = {}
+
+    def unfreeze(self):
+        """
+        Move alive frozen items back to the table.
+        """
+        frozen_table, self.frozen_table = self.frozen_table, {}
+        self.table = {
+            **{key: cached for key, cached in frozen_table.items() if cached[0]() is not None},
+            **self.table,
+        }
+
+
+class CopyOnWriteCache(IdentityCache):
+    """
+    Provide identity cache that is safe to use from multiple threads without locking on reads.
+
+    Reads look the object up in the current table without any lock. Writes are serialized by the lock, update a copy
+    of the table and publish it by replacing the reference to the table, so readers always see consistent table. Suits
+    caches that are read on every call and written once per object.
+    """
+
+    def __init__(self, maximum_size=CACHE_MAXIMUM_SIZE):
+        """
+        Constructor.
+        """
+        super().__init__(maximum_size=maximum_size)
+        self.lock = threading.Lock()
+
+    def set(self, object_, value):
+        """
+        Cache the value computed from the object.
+        """
+        with self.lock:
+            table = self.table.copy()
+            self.store(table=table, object_=object_, value=value)
+            self.table = table
+
+    def clear(self):
+        """
+        Remove all cached items.
+        """
+        with self.lock:
+            super().clear()
+
+    def freeze(self):
+        """
+        Move cached items to the frozen table.
+        """
+        with self.lock:
+            super().freeze()
+
+    def unfreeze(self):
+        """
+        Move alive frozen items back to the table.
+        """
+        with self.lock:
+            super().unfreeze()
+
+
+METHOD_CLASS_BY_CODE_CACHE = CopyOnWriteCache()
+CODE_ARGUMENTS_CACHE = IdentityCache()
+CODE_PARAMETERS_CACHE = IdentityCache()
+STRICT_SIGNATURES_CACHE = IdentityCache()
+CLASS_OWN_MEMBERS_CACHE = IdentityCache()
+INTERFACE_MEMBERS_CACHE = IdentityCache()
+CLASS_METHODS_CODES_CACHE = IdentityCache()
+INTERNED_SIGNATURES = {}
+
+
 def does_classes_contain_private_method(classes, method):
     """
     Check if at least one of provided classes contains a method.
@@ -55,9 +289,10 @@ def does_classes_contain_private_method(classes, method):
     that contains the method.
     """
     for class_ in classes:
-        if hasattr(class_, method.__name__):
-            if getattr(class_, method.__name__).__name__ in 'private_wrapper':
-                return True, class_
+        class_member = getattr(class_, method.__name__, None)
+
+        if getattr(class_member, ClassMemberMagicMethodNames.ACCESS_TYPE, None) == AccessModifierTypes.PRIVATE:
+            return True, class_
 
     return False, None
 
@@ -73,20 +308,329 @@ def find_decorated_method(function):
             pass
 
     When you pass `class.function` objects, you do not pass `class.function` actually. You pass a reference to
-    private object (e.g. `function private.<locals>.private_wrapper at 0x1065cf2f0`).
+    accessibility level wrapper (e.g. `<private Car.function>`). Wrapper keeps the method under decorators chain in
+    `__decorated_method__`, so it is returned without recursion. Other decorators are followed through `__wrapped__`
+    (set by `functools.wraps`) or, if it is absent, through the first closure cell. The `__class__` cell methods
+    using `super()` have is skipped, as it references the class, not the decorated function.
     """
     if isinstance(function, property):
         return function
 
+    decorated_method = getattr(function, ClassMemberMagicMethodNames.DECORATED_METHOD, None)
+
+    if decorated_method is not None:
+        return decorated_method
+
     if function.__class__.__name__ in (ClassMemberTypes.STATIC_METHOD, ClassMemberTypes.CLASS_METHOD):
         return find_decorated_method(function.__func__)
 
-    if function.__closure__ is not None:
-        return find_decorated_method(function.__closure__[0].cell_contents)
+    wrapped_function = getattr(function, ClassMemberMagicMethodNames.WRAPPED, None)
+
+    if wrapped_function is not None:
+        return find_decorated_method(wrapped_function)
+
+    closure = getattr(function, '__closure__', None)
+
+    if closure:
+        for free_variable_name, cell in zip(function.__code__.co_freevars, closure):
+            if free_variable_name != '__class__':
+                return find_decorated_method(cell.cell_contents)
 
     return function
 
 
+def unwrap_class_member(member):
+    """
+    Get the function of the static method or the class method, the member itself otherwise.
+    """
+    if member.__class__.__name__ in (ClassMemberTypes.STATIC_METHOD, ClassMemberTypes.CLASS_METHOD):
+        return member.__func__
+
+    return member
+
+
+def mangle_name(class_name, name):
+    """
+    Get name of the class member as Python stores it, private names (e.g. `__start_engine`) are mangled.
+    """
+    if not name.startswith('__') or name.endswith('__') or not class_name.strip('_'):
+        return name
+
+    return '_' + class_name.lstrip('_') + name
+
+
+def is_receiver_attribute_load(instruction, previous_instruction, receiver_name, names):
+    """
+    Check if the instruction loads one of the attributes by the names from the receiver (e.g. `self`).
+
+    The receiver is loaded by the previous instruction, it loads two variables at once since Python 3.13, the receiver
+    is the last one then.
+    """
+    if instruction.opname not in ATTRIBUTE_LOAD_INSTRUCTIONS_NAMES or instruction.argval not in names:
+        return False
+
+    if previous_instruction is None or previous_instruction.opname not in RECEIVER_LOAD_INSTRUCTIONS_NAMES:
+        return False
+
+    loaded_name = previous_instruction.argval
+
+    if isinstance(loaded_name, tuple):
+        loaded_name = loaded_name[-1]
+
+    return loaded_name == receiver_name
+
+
+def rename_receiver_attributes(code, receiver_name, names):
+    """
+    Get the code object with attributes loaded from the receiver (e.g. `self.start_engine`) renamed.
+
+    Only the attribute load right after the receiver load is renamed, so globals and attributes of other objects with
+    the same names are kept. Nested functions, lambdas and comprehensions code objects are renamed as well, unless
+    they define their own variable with the receiver name. The load, the renamed attribute index of which does not fit
+    into the single byte instruction argument, is kept, so the attribute is loaded by the original name.
+    """
+    import dis
+
+    code_names = list(code.co_names)
+    code_bytes = bytearray(code.co_code)
+    previous_instruction = None
+
+    for instruction in dis.get_instructions(code):
+        if is_receiver_attribute_load(
+            instruction=instruction,
+            previous_instruction=previous_instruction,
+            receiver_name=receiver_name,
+            names=names,
+        ):
+            name = names[instruction.argval]
+            name_index = code_names.index(name) if name in code_names else len(code_names)
+            shift = LOAD_ATTR_NAME_INDEX_SHIFT if instruction.opname == 'LOAD_ATTR' else 0
+            argument = name_index << shift | instruction.arg & ((1 << shift) - 1)
+
+            if argument <= MAXIMUM_INSTRUCTION_ARGUMENT:
+                if name_index == len(code_names):
+                    code_names.append(name)
+
+                code_bytes[instruction.offset + 1] = argument
+
+        previous_instruction = instruction
+
+    renamed_constants = tuple(
+        rename_receiver_attributes(code=constant, receiver_name=receiver_name, names=names)
+        if isinstance(constant, types.CodeType) and receiver_name not in constant.co_varnames else constant
+        for constant in code.co_consts
+    )
+
+    return code.replace(co_code=bytes(code_bytes), co_names=tuple(code_names), co_consts=renamed_constants)
+
+
+def rename_function_receiver_attributes(function, names):
+    """
+    Get the copy of the function with attributes loaded from the receiver (the first argument) renamed.
+
+    The function could be set to other classes as well (e.g. the helper shared by several classes), so its code is
+    not replaced in place.
+    """
+    code = function.__code__
+    renamed_function = types.FunctionType(
+        rename_receiver_attributes(code=code, receiver_name=code.co_varnames[0], names=names),
+        function.__globals__,
+        function.__name__,
+        function.__defaults__,
+        function.__closure__,
+    )
+
+    renamed_function.__kwdefaults__ = function.__kwdefaults__
+    renamed_function.__qualname__ = function.__qualname__
+    renamed_function.__doc__ = function.__doc__
+    renamed_function.__module__ = function.__module__
+    renamed_function.__annotations__ = function.__annotations__
+    renamed_function.__dict__.update(function.__dict__)
+
+    return renamed_function
+
+
+def is_coroutine_function(function):
+    """
+    Return true if the function, static method or class method is coroutine function.
+    """
+    import inspect
+
+    return inspect.iscoroutinefunction(unwrap_class_member(member=function))
+
+
+def evict_oldest(table):
+    """
+    Remove the oldest item from the table, if the table is changed concurrently, nothing is removed.
+    """
+    try:
+        table.pop(next(iter(table)), None)
+    except (StopIteration, RuntimeError):
+        pass
+
+
+def intern_signature(signature):
+    """
+    Get the single instance of the equal signatures, so equal signatures are usually the same object.
+
+    Number of interned signatures is bounded, signatures those do not fit are returned as is, so signatures should be
+    compared by equality that is fast for the same objects.
+    """
+    interned_signature = INTERNED_SIGNATURES.get(signature)
+
+    if interned_signature is not None:
+        return interned_signature
+
+    if len(INTERNED_SIGNATURES) >= INTERNED_SIGNATURES_MAXIMUM_NUMBER:
+        return signature
+
+    return INTERNED_SIGNATURES.setdefault(signature, signature)
+
+
+def compute_code_parameters(code):
+    """
+    Compute names and kinds of the function arguments from its code object in order of declaration.
+
+    `co_varnames` starts with positional (including positional-only) arguments, followed by keyword-only arguments,
+    then by variable positional (e.g. `*args`) and variable keyword (e.g. `**kwargs`) arguments if they are declared.
+    In the declaration, variable positional argument goes before keyword-only arguments.
+    """
+    import inspect
+
+    positional_only_arguments_count = getattr(code, 'co_posonlyargcount', 0)
+    positional_arguments_count = code.co_argcount
+    keyword_only_arguments_end = positional_arguments_count + code.co_kwonlyargcount
+    variable_arguments_index = keyword_only_arguments_end
+
+    parameters = []
+
+    for index, name in enumerate(code.co_varnames[:positional_arguments_count]):
+        if index < positional_only_arguments_count:
+            parameters.append((name, ArgumentKinds.POSITIONAL_ONLY))
+        else:
+            parameters.append((name, ArgumentKinds.POSITIONAL_OR_KEYWORD))
+
+    if code.co_flags & inspect.CO_VARARGS:
+        parameters.append((code.co_varnames[variable_arguments_index], ArgumentKinds.VARIABLE_POSITIONAL))
+        variable_arguments_index += 1
+
+    parameters.extend(
+        (name, ArgumentKinds.KEYWORD_ONLY)
+        for name in code.co_varnames[positional_arguments_count:keyword_only_arguments_end]
+    )
+
+    if code.co_flags & inspect.CO_VARKEYWORDS:
+        parameters.append((code.co_varnames[variable_arguments_index], ArgumentKinds.VARIABLE_KEYWORD))
+
+    return intern_signature(tuple(parameters))
+
+
+def get_code_parameters(code):
+    """
+    Get names and kinds of the function arguments from its code object, computed once per code object.
+    """
+    return CODE_PARAMETERS_CACHE.get(code, compute_code_parameters)
+
+
+def compute_code_arguments(code):
+    """
+    Compute names of the function arguments from its code object in order of declaration.
+    """
+    return intern_signature(tuple(name for name, _ in get_code_parameters(code=code)))
+
+
+def get_code_arguments(code):
+    """
+    Get names of the function arguments from its code object in order of declaration, computed once per code object.
+
+    Arguments tuple is interned, so the same arguments of the different functions are the same object.
+    """
+    return CODE_ARGUMENTS_CACHE.get(code, compute_code_arguments)
+
+
+def get_hashable_annotation(annotation):
+    """
+    Get annotation that could be a part of the signature fingerprint.
+    """
+    try:
+        hash(annotation)
+    except TypeError:
+        return repr(annotation)
+
+    return annotation
+
+
+def compute_strict_signature(function):
+    """
+    Compute function signature fingerprint that contains names, kinds and annotations of the arguments.
+    """
+    import inspect
+
+    annotations = getattr(function, '__annotations__', None) or {}
+
+    return intern_signature(tuple(
+        (name, kind, get_hashable_annotation(annotations.get(name, inspect.Parameter.empty)))
+        for name, kind in get_code_parameters(code=function.__code__)
+    ) + (get_hashable_annotation(annotations.get('return', inspect.Signature.empty)), ))
+
+
+def get_strict_signature(function):
+    """
+    Get function signature fingerprint that contains names, kinds and annotations of the arguments.
+
+    Annotations belong to the function rather than to its code object, so the fingerprint is computed once per function.
+    """
+    return STRICT_SIGNATURES_CACHE.get(function, compute_strict_signature)
+
+
+def get_raised_exceptions_names(code):
+    """
+    Get names of the exceptions the code object raises, analyzing its bytecode.
+
+    Names of the globals and attributes loaded on the line where `RAISE_VARARGS` instruction is (i.e. `raise` statement
+    line) are treated as raised exceptions names, so `raise DoesNotExistError`, `raise errors.DoesNotExistError` and
+    `raise DoesNotExistError('Does not exist.') from error` are recognized. Nested functions are analyzed as well.
+    Source code is not needed, so it works for bytecode-only deployments.
+    """
+    import dis
+
+    loaded_names_by_line = {}
+    raise_lines = set()
+    line = None
+
+    for instruction in dis.get_instructions(code):
+
+        if hasattr(instruction, 'line_number'):
+            line = instruction.line_number
+
+        elif instruction.starts_line is not None:
+            line = instruction.starts_line
+
+        if instruction.opname in LOAD_NAME_INSTRUCTIONS_NAMES:
+            loaded_names_by_line.setdefault(line, set()).add(instruction.argval)
+
+        elif instruction.opname == RAISE_INSTRUCTION_NAME and instruction.arg:
+            raise_lines.add(line)
+
+    raised_exceptions_names = set()
+
+    for line in raise_lines:
+        raised_exceptions_names.update(loaded_names_by_line.get(line, ()))
+
+    for constant in code.co_consts:
+        if isinstance(constant, types.CodeType):
+            raised_exceptions_names.update(get_raised_exceptions_names(code=constant))
+
+    return frozenset(raised_exceptions_names)
+
+
+def is_access_wrapper(object_):
+    """
+    Return true if the object is accessibility level wrapper of the class member.
+    """
+    return not isinstance(object_, types.MethodType) and hasattr(object_, ClassMemberMagicMethodNames.ACCESS_TYPE)
+
+
 def isprop(object_):
     """
     Return true if the object is a property of the class.
@@ -108,14 +652,22 @@ class ClassMember:
         """
         Constructor.
 
-        `self.method` is a method under possible decorators chain started from `object`.
+        `self.method` is a method under possible decorators chain started from `object`. The class is referenced
+        weakly, so cached members do not keep the class alive.
         """
         self.name = name
         self.object_ = object_
-        self.class_ = class_
+        self.class_reference = weakref.ref(class_)
         self.method = find_decorated_method(function=object_)
         self.type = self.get_type() if type_ is None else type_
 
+    @property
+    def class_(self):
+        """
+        Get class the member belongs to.
+        """
+        return self.class_reference()
+
     @property
     def unique_name(self):
         """
@@ -148,6 +700,48 @@ class ClassMember:
         """
         return ', '.join(self.arguments)
 
+    def get_signature(self, strict=False):
+        """
+        Get class member signature fingerprint.
+
+        Fingerprints are interned, so the equal fingerprints are usually the same object and are compared fast.
+        By default, fingerprint is arguments names in order of declaration. Strict fingerprint contains arguments kinds
+        (e.g. positional-only, keyword-only) and annotations as well.
+        """
+        if not strict:
+            return self.arguments
+
+        if self.type == ClassMemberTypes.GETTER:
+            return get_strict_signature(function=find_decorated_method(function=self.method.fget))
+
+        if self.type == ClassMemberTypes.SETTER:
+            return get_strict_signature(function=find_decorated_method(function=self.method.fset))
+
+        if self.type == ClassMemberTypes.DELETER:
+            return get_strict_signature(function=find_decorated_method(function=self.method.fdel))
+
+        return get_strict_signature(function=self.method)
+
+    def has_code(self):
+        """
+        Check if the function, the member signature is computed from, has the code object.
+
+        Functions implemented in C (e.g. `types.GenericAlias` of `__class_getitem__ = classmethod(types.GenericAlias)`)
+        have no code objects, so their signatures are not computed.
+        """
+        function = self.method
+
+        if self.type == ClassMemberTypes.GETTER:
+            function = find_decorated_method(function=self.method.fget)
+
+        if self.type == ClassMemberTypes.SETTER:
+            function = find_decorated_method(function=self.method.fset)
+
+        if self.type == ClassMemberTypes.DELETER:
+            function = find_decorated_method(function=self.method.fdel)
+
+        return hasattr(function, '__code__')
+
     def get_property_arguments(self, property):
         """
         Get property arguments.
@@ -155,33 +749,16 @@ class ClassMember:
         If property is getter or deleter, the fetched arguments are single argument of
         class instance reference (e.g `self`).
 
-        If property is setter, the arguments as string looks like `self, value`. To return it as tuple, blank symbols
-        should be removed and return should be splitted by comma.
+        If property is setter, the arguments are class instance reference and the value (e.g. `self, value`).
         """
-        property_source_code = inspect.getsource(property)
-        _, code_after_open_bracket = property_source_code.split('(')
-        arguments_as_string, _ = code_after_open_bracket.split(')')
-
-        if self.type == ClassMemberTypes.GETTER or self.type == ClassMemberTypes.DELETER:
-            return (arguments_as_string, )
-
-        arguments_as_string = arguments_as_string.replace(' ', '')
-        arguments_as_tuple = tuple(arguments_as_string.split(','))
-
-        return arguments_as_tuple
+        return get_code_arguments(code=find_decorated_method(function=property).__code__)
 
     def get_arguments(self, function):
         """
         Get class member arguments.
 
-        `function.__code__.co_varnames` returns unordered function arguments.
-        `function.__code__.co_varnames` returns all function arguments as expected in order of declaration.
-
-        `inspect.signature` returns unordered function arguments.
-        `inspect.signature` does not return `cls` (or another name for reference to class) in the function arguments.
-
-        `__self__` is the class instance object. If class instance object is a class itself, so the method os static
-        method.
+        Arguments are fetched from the code object, so the source code is not needed. Bound class method passes
+        attributes access to the function, so its code object contains the reference to the class (e.g. `cls`) as well.
 
         References:
             - https://docs.python.org/3/reference/datamodel.html
@@ -196,26 +773,33 @@ class ClassMember:
         if self.type == ClassMemberTypes.DELETER:
             return self.get_property_arguments(self.method.fdel)
 
-        ordered_arguments = tuple(inspect.signature(function).parameters)
-        first_argument, *_ = function.__code__.co_varnames
-
-        if hasattr(function, ClassMemberMagicMethodNames.SELF) and function.__self__ == self.class_:
-            return (first_argument, ) + ordered_arguments
-
-        return ordered_arguments
+        return get_code_arguments(code=function.__code__)
 
     def get_type(self):
         """
         Get class member type.
 
         Variants are the followings: method, static method, class method.
+
+        The type is got from the descriptor that is stored in the class (or its parent) dictionary without triggering
+        descriptor protocol, so the source code is not needed. Class dictionary is looked up first, since members are
+        usually introspected from the class that defines them.
         """
-        method_source_code = inspect.getsource(self.method)
+        member = self.class_.__dict__.get(self.name, NOT_FOUND)
+
+        if member is NOT_FOUND:
+            import inspect
+
+            member = inspect.getattr_static(self.class_, self.name, self.object_)
+        member_type = getattr(member, ClassMemberMagicMethodNames.MEMBER_TYPE, None)
 
-        if COMMERCIAL_AT_SYMBOL + ClassMemberTypes.CLASS_METHOD in method_source_code:
+        if member_type is not None:
+            return member_type
+
+        if isinstance(member, classmethod):
             return ClassMemberTypes.CLASS_METHOD
 
-        if COMMERCIAL_AT_SYMBOL + ClassMemberTypes.STATIC_METHOD in method_source_code:
+        if isinstance(member, staticmethod):
             return ClassMemberTypes.STATIC_METHOD
 
         return ClassMemberTypes.METHOD
@@ -229,32 +813,31 @@ class ClassMember:
         if isinstance(self.object_, property):
             return AccessModifierTypes.PUBLIC
 
-        if self.object_.__name__ == 'private_wrapper':
-            return AccessModifierTypes.PRIVATE
+        return getattr(self.object_, ClassMemberMagicMethodNames.ACCESS_TYPE, AccessModifierTypes.PUBLIC)
 
-        if self.object_.__name__ == 'protected_wrapper':
-            return AccessModifierTypes.PROTECTED
 
-        return AccessModifierTypes.PUBLIC
+def is_method(object_):
+    """
+    Return true if the object is the class member that is called, i.e. method, static method, class method.
+    """
+    return isinstance(object_, METHODS_TYPES) or hasattr(object_, ClassMemberMagicMethodNames.ACCESS_TYPE)
 
 
-def get_class_members(class_):
+def create_class_members(class_, members):
     """
-    Get a list of the class members like functions, properties, etc.
+    Create class members from the pairs of names and objects, methods go first, properties follow.
     """
     inspected_members = {}
 
-    class_members_ = \
-        inspect.getmembers(class_, predicate=inspect.isfunction) + \
-        inspect.getmembers(class_, predicate=inspect.ismethod)
-
-    for member_name, member_object in class_members_:
-        member = ClassMember(name=member_name, object_=member_object, class_=class_)
-        inspected_members[member.unique_name] = member
+    for member_name, member_object in members:
+        if is_method(member_object):
+            member = ClassMember(name=member_name, object_=member_object, class_=class_)
+            inspected_members[member.unique_name] = member
 
-    class_properties = inspect.getmembers(class_, predicate=isprop)
+    for property_name, property_object in members:
+        if not isprop(property_object):
+            continue
 
-    for property_name, property_object in class_properties:
         member = \
             ClassMember(name=property_name, object_=property_object, class_=class_, type_=ClassMemberTypes.GETTER)
         inspected_members[member.unique_name] = member
@@ -272,16 +855,149 @@ def get_class_members(class_):
     return inspected_members
 
 
+def compute_class_own_members(class_):
+    """
+    Compute members defined by the class itself, without inherited ones.
+
+    Only the class dictionary is browsed, so the cost does not depend on the number of members inherited from `object`
+    and the source code is not needed (e.g. classes created by `type` or factories).
+    """
+    members = []
+
+    for name in class_.__dict__:
+        try:
+            members.append((name, getattr(class_, name)))
+        except AttributeError:
+            continue
+
+    return create_class_members(class_=class_, members=members)
+
+
+def get_class_own_members(class_):
+    """
+    Get members defined by the class itself, computed once per class.
+    """
+    return CLASS_OWN_MEMBERS_CACHE.get(class_, compute_class_own_members)
+
+
+def merge_class_members(class_, class_own_members):
+    """
+    Merge members of the class and members of its parents.
+
+    Own members of the parents are merged in reversed method resolution order, a member overrides the members
+    with the same name defined by the parents before, so diamond-shaped hierarchies are resolved the same way
+    attributes are looked up. Own members of the parents are computed once per parent and shared by all the classes
+    inheriting from them, parents are expected not to be changed after they are introspected.
+    """
+    class_members = {}
+
+    for ancestor in reversed(class_.__mro__):
+        if ancestor is object:
+            continue
+
+        class_members = {
+            unique_name: member for unique_name, member in class_members.items()
+            if member.name not in ancestor.__dict__
+        }
+
+        if ancestor is class_:
+            class_members.update(class_own_members)
+        else:
+            class_members.update(get_class_own_members(class_=ancestor))
+
+    return class_members
+
+
+def get_class_members(class_):
+    """
+    Get class members like functions, properties, etc., including inherited ones.
+
+    Own members of the class are computed every time, since the class could be changed before it is checked
+    (e.g. by decorators).
+    """
+    return merge_class_members(class_=class_, class_own_members=compute_class_own_members(class_=class_))
+
+
+def compute_interface_members(interface):
+    """
+    Compute flattened members of the interface, including members of interfaces it extends.
+    """
+    return merge_class_members(class_=interface, class_own_members=get_class_own_members(class_=interface))
+
+
+def get_interface_members(interface):
+    """
+    Get flattened members of the interface, computed once per interface.
+
+    Every interface in the hierarchy is introspected once, its own members table is reused by all the interfaces
+    extending it. Interfaces are expected not to be changed after they are defined.
+    """
+    return INTERFACE_MEMBERS_CACHE.get(interface, compute_interface_members)
+
+
+def get_class_methods(class_):
+    """
+    Get functions of the methods and properties accessors the class defines itself.
+
+    Functions of class and static methods and functions under possible decorators chains are included.
+    """
+    methods = []
+
+    for member in class_.__dict__.values():
+        functions = (member.fget, member.fset, member.fdel) if isinstance(member, property) else (member,)
+
+        for function in functions:
+            method = find_decorated_method(function=function) if function is not None else None
+
+            if isinstance(method, types.FunctionType):
+                methods.append(method)
+
+    return methods
+
+
+def get_nested_codes(code):
+    """
+    Get the code object and code objects of its nested functions, lambdas, comprehensions and classes, recursively.
+    """
+    codes = [code]
+
+    for constant in code.co_consts:
+        if isinstance(constant, types.CodeType):
+            codes.extend(get_nested_codes(code=constant))
+
+    return codes
+
+
+def compute_class_methods_codes_identifiers(class_):
+    """
+    Compute identifiers of code objects of the methods defined by the class itself, under possible decorators chains.
+
+    Code objects nested in the methods (e.g. of lambdas, inner functions and comprehensions) are included, as they are
+    the code of the class as well.
+
+    Identifiers are kept instead of code objects, as code objects of different methods could be equal. Code objects
+    are kept alive by the methods in the class dictionary, so identifiers are not reused while the class is alive.
+    """
+    return frozenset(
+        id(code) for method in get_class_methods(class_=class_) for code in get_nested_codes(code=method.__code__)
+    )
+
+
+def get_class_methods_codes_identifiers(class_):
+    """
+    Get identifiers of code objects of the methods defined by the class itself, computed once per class.
+    """
+    return CLASS_METHODS_CODES_CACHE.get(class_, compute_class_methods_codes_identifiers)
+
+
 def get_method_class_by_frame(frame):
     """
     Get method's class by method's caller frame.
 
-    Get method's caller frame items (in example {'Tesla': <object ...>}) and method's caller name.
-    Browse all items in loop. If method's caller contains a member with method's caller name —
-    we have found the class (`Tesla`) that contains the method (`run`) that calls a method (`start_engine`)
-    with accessibility level.
-    Check if founded method code is the code from frame (`start_engine` caller frame). If they are equal,
-    method class is pointed as latest. Latest is returned, else None.
+    Caller's code object qualified name (e.g. `Tesla.run` or `Tesla.run.<locals>.<lambda>`) names the class that
+    contains the method (`run`) that calls a method (`start_engine`) with accessibility level, so the class is looked
+    up by its qualified name in the caller frame's globals. The class is returned only if the caller's code object is
+    the code of one of its methods or nested in one of them (e.g. lambda, inner function or comprehension), else None.
 
     # services/generic.py
     class Car:
@@ -297,9 +1013,8 @@ def get_method_class_by_frame(frame):
             car = Car()
             return car.start_engine()
 
-    Latest object exists because if `Car` and `Tesla` will be in one file, both of these classes
-    could have the same method that call protected method and function won't understand
-    the real caller.
+    Code objects are compared, because if `Car` and `Tesla` will be in one file, both of these classes could have the
+    same method that call protected method and names only won't tell the real caller.
 
     # __main__.py
     class Car:
@@ -315,21 +1030,127 @@ def get_method_class_by_frame(frame):
 
         def run(self):
             return self.start_engine()
+
+    Found class is cached by the code object, so the class is looked up only once per calling code. Code objects
+    of different functions could be equal, so the cache is keyed by code object identity. Both code object and class
+    are referenced weakly, so the cache does not keep classes created at runtime alive.
     """
-    latest_object = None
+    method_code = frame.f_code
+    class_reference = METHOD_CLASS_BY_CODE_CACHE.lookup(method_code)
 
-    for name, object_ in frame.f_globals.items():
+    if class_reference is not NOT_CACHED:
+        class_ = class_reference()
 
-        try:
-            class_method = object_.__dict__.get(frame.f_code.co_name)
+        if class_ is not None:
+            return class_
 
-            if class_method is not None:
-                method = find_decorated_method(function=class_method)
+    return get_method_class_by_code(method_code=method_code, globals_=frame.f_globals)
 
-                if method.__code__ is frame.f_code:
-                    latest_object = object_
 
-        except (KeyError, AttributeError):
-            pass
+def get_method_class_by_code(method_code, globals_):
+    """
+    Get class of the method the code belongs to by the globals of the method's module, see `get_method_class_by_frame`.
+
+    If the class is not found by the code's qualified name (e.g. the class is created by `type` or defined inside
+    a function and put to the globals after, the method is created by a factory function) or code objects have no
+    qualified name (before Python 3.11), all the classes of the globals are browsed and the latest one, that contains
+    the code, is found.
+
+    Found class is cached, so it is used to fill the cache ahead of the calls as well.
+    """
+    qualified_name = getattr(method_code, 'co_qualname', None)
+    class_ = None
+
+    if qualified_name is not None:
+        class_ = find_method_class_by_qualified_name(
+            method_code=method_code, qualified_name=qualified_name, globals_=globals_,
+        )
+
+    if class_ is None:
+        class_ = find_method_class_in_globals(method_code=method_code, globals_=globals_)
+
+    if class_ is not None:
+        METHOD_CLASS_BY_CODE_CACHE.set(method_code, weakref.ref(class_))
+
+    return class_
+
+
+def find_method_class_by_qualified_name(method_code, qualified_name, globals_):
+    """
+    Find class of the method the code belongs to by the code's qualified name, None if it is not found.
+
+    Qualified name of the class is everything before the method name, the method name is the last name before the
+    first `<locals>` (e.g. `Car` in `Car.run.<locals>.<lambda>`). Classes defined inside functions are not reachable
+    from the globals by the qualified name, so they are not found.
+    """
+    class_qualified_name = qualified_name.partition('.<locals>.')[0].rpartition('.')[0]
+
+    if not class_qualified_name:
+        return None
+
+    class_names = class_qualified_name.split('.')
+    class_ = globals_.get(class_names[0])
+
+    for class_name in class_names[1:]:
+        class_ = getattr(class_, '__dict__', {}).get(class_name)
+
+    if isinstance(class_, type) and does_class_contain_code(class_=class_, code=method_code):
+        return class_
+
+    return None
+
+
+def find_method_class_in_globals(method_code, globals_):
+    """
+    Find the latest class, that contains the code in its methods, among the globals and classes nested in them.
+
+    None is returned if the class is not found.
+    """
+    latest_class = None
+
+    for class_ in get_classes_with_nested_classes(objects=list(globals_.values())):
+        if does_class_contain_code(class_=class_, code=method_code):
+            latest_class = class_
+
+    return latest_class
+
+
+def get_classes_with_nested_classes(objects):
+    """
+    Get classes among the objects and classes nested in them (e.g. `Garage.Car`), recursively.
+
+    Only classes defined in the class body are nested, classes referenced by the class attributes are not.
+    """
+    classes = []
+
+    for object_ in objects:
+        if not isinstance(object_, type):
+            continue
+
+        classes.append(object_)
+        classes.extend(get_classes_with_nested_classes(objects=[
+            member for name, member in vars(object_).items()
+            if isinstance(member, type) and member.__qualname__ == object_.__qualname__ + '.' + name
+        ]))
+
+    return classes
+
+
+def does_class_contain_code(class_, code):
+    """
+    Check if the code is the code of one of the class methods or nested in one of them.
+
+    Methods could be added to the class or replaced after identifiers of its code objects are cached. So if the code
+    is not among them, but the class member named as the code has the code, identifiers are computed again.
+    """
+    if id(code) in get_class_methods_codes_identifiers(class_=class_):
+        return True
+
+    member = class_.__dict__.get(code.co_name)
+
+    if member is None or getattr(find_decorated_method(function=member), '__code__', None) is not code:
+        return False
+
+    CLASS_METHODS_CODES_CACHE.set(class_, compute_class_methods_codes_identifiers(class_=class_))
 
-    return latest_object
+    return True
@@ -0,0 +1,108 @@
+"""
+Provide warming accessify caches up and freezing them before forking worker processes.
+"""
+import gc
+import types
+
+from accessify.dispatch import INTERFACE_DISPATCHERS
+from accessify.registry import INTERFACES_REGISTRY
+from accessify.utils import (
+    CACHES,
+    ClassMemberMagicMethodNames,
+    get_class_methods,
+    get_class_own_members,
+    get_interface_members,
+    get_method_class_by_code,
+    get_nested_codes,
+)
+
+
+def get_module_classes(module):
+    """
+    Get classes defined by the module itself, without imported ones.
+    """
+    return [
+        object_ for object_ in vars(module).values()
+        if isinstance(object_, type) and object_.__module__ == module.__name__
+    ]
+
+
+def warm_members(members):
+    """
+    Compute and cache arguments and signatures of the class members, members without code objects are skipped.
+    """
+    for member in members.values():
+        if not member.has_code():
+            continue
+
+        member.get_signature()
+        member.get_signature(strict=True)
+
+
+def warm_class(class_):
+    """
+    Compute and cache everything accessify needs for the class at runtime.
+
+    Caches are: members tables of the class and interfaces it implements, their signatures, interfaces the class
+    provides, implementations dispatchers resolve for the class and classes of the methods and their nested code (e.g.
+    lambdas), that call members with accessibility level, by their code.
+    """
+    warm_members(members=get_class_own_members(class_=class_))
+
+    for interface in getattr(class_, ClassMemberMagicMethodNames.IMPLEMENTS, ()):
+        warm_members(members=get_interface_members(interface=interface))
+
+    INTERFACES_REGISTRY.get_provided_interfaces(class_=class_)
+
+    for dispatcher in list(INTERFACE_DISPATCHERS):
+        dispatcher.dispatch(class_=class_)
+
+    for method in get_class_methods(class_=class_):
+        for method_code in get_nested_codes(code=method.__code__):
+            get_method_class_by_code(method_code=method_code, globals_=method.__globals__)
+
+
+def warm(modules_or_classes):
+    """
+    Eagerly build accessify caches for the classes and classes defined by the modules.
+
+    Supposed to be called in the master process before forking workers, so workers start with warm caches.
+
+        import accessify
+        from app import models, services
+
+        accessify.warm([models, services])
+        accessify.freeze()
+    """
+    for module_or_class in modules_or_classes:
+        if isinstance(module_or_class, types.ModuleType):
+            classes = get_module_classes(module=module_or_class)
+        else:
+            classes = [module_or_class]
+
+        for class_ in classes:
+            warm_class(class_=class_)
+
+
+def freeze():
+    """
+    Freeze accessify caches and move all the objects tracked by the garbage collector to the permanent generation.
+
+    Frozen caches are never written again, items cached after are put to the new tables. So the memory of the caches
+    (and of the objects frozen by `gc.freeze`) is kept shared between the forked processes instead of being copied
+    on the first write.
+    """
+    for cache in list(CACHES):
+        cache.freeze()
+
+    gc.freeze()
+
+
+def unfreeze():
+    """
+    Unfreeze accessify caches and move all the objects in the permanent generation back to the oldest generation.
+    """
+    for cache in list(CACHES):
+        cache.unfreeze()
+
+    gc.unfreeze()
@@ -0,0 +1,47 @@
+"""
+Provide benchmark of guarded coroutine members awaited in a tight event loop.
+
+Run it with `python -m benchmarks.asynchronous`.
+"""
+import asyncio
+import time
+
+from accessify import (
+    private,
+    protected,
+)
+
+AWAITS_NUMBER = 200000
+
+
+class Car:
+
+    async def public_start_engine(self):
+        return 'Engine sound.'
+
+    @private
+    async def private_start_engine(self):
+        return 'Engine sound.'
+
+    @protected
+    async def protected_start_engine(self):
+        return 'Engine sound.'
+
+    async def run(self, member_name):
+        member = getattr(self, member_name)
+        started_at = time.perf_counter()
+
+        for _ in range(AWAITS_NUMBER):
+            await member()
+
+        return time.perf_counter() - started_at
+
+
+if __name__ == '__main__':
+    car = Car()
+
+    for member_name in ('public_start_engine', 'private_start_engine', 'protected_start_engine'):
+        elapsed = asyncio.run(car.run(member_name))
+        print('{name:<24} {nanoseconds:>8.0f} ns per await'.format(
+            name=member_name, nanoseconds=elapsed / AWAITS_NUMBER * 1e9,
+        ))
@@ -0,0 +1,69 @@
+"""
+Provide benchmark of guarded calls checked by the wrappers and by the checks compiled by the import hook.
+
+Run it with `python -m benchmarks.compiler`. Reports time per allowed call of the private method for a plain method,
+the wrapper and the compiled check.
+"""
+import ast
+import timeit
+
+from accessify.compiler import transform
+
+CALLS_NUMBER = 200000
+REPEATS_NUMBER = 5
+
+CARS_SOURCE = '''
+from accessify import private
+
+
+class Car:
+
+    def start_engine(self):
+        pass
+
+    def run(self):
+        self.start_engine()
+
+
+class GuardedCar:
+
+    @private
+    def start_engine(self):
+        pass
+
+    def run(self):
+        self.start_engine()
+'''
+
+
+def load_cars(compiled):
+    """
+    Load cars module namespace from the source, compiled with access checks or not.
+    """
+    tree = ast.parse(CARS_SOURCE)
+
+    if compiled:
+        tree = transform(tree=tree)
+
+    namespace = {'__name__': 'cars'}
+    exec(compile(tree, 'cars.py', 'exec'), namespace)
+
+    return namespace
+
+
+def measure(car):
+    """
+    Measure the best time per call of the car's private method from the car's own method, in nanoseconds.
+    """
+    return min(timeit.repeat(car.run, number=CALLS_NUMBER, repeat=REPEATS_NUMBER)) / CALLS_NUMBER * 1e9
+
+
+if __name__ == '__main__':
+    cars, compiled_cars = load_cars(compiled=False), load_cars(compiled=True)
+
+    for name, car in (
+        ('plain method', cars['Car']()),
+        ('wrapper', cars['GuardedCar']()),
+        ('compiled check', compiled_cars['GuardedCar']()),
+    ):
+        print('{name:>15}: {time_per_call:>7.0f} ns per call'.format(name=name, time_per_call=measure(car)))
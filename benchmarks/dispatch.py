@@ -0,0 +1,58 @@
+"""
+Provide benchmark of dispatching calls by interfaces as the number of handler classes grows.
+
+Run it with `python -m benchmarks.dispatch`. Time per call should stay flat.
+"""
+import time
+
+from accessify import (
+    dispatch,
+    implements,
+)
+
+HANDLERS_CLASSES_NUMBERS = (10, 100, 1000, 5000)
+CALLS_NUMBER = 200000
+
+
+def create_handlers_classes(number):
+    """
+    Create interfaces, handler classes implementing them and the function dispatching by the interfaces.
+    """
+    @dispatch
+    def handle(handler):
+        return None
+
+    classes = []
+
+    for index in range(number):
+        interface = type('HandlerInterface' + str(index), (), {})
+        handle.register(interface, lambda handler, index=index: index)
+        classes.append(implements(interface)(type('Handler' + str(index), (), {})))
+
+    return handle, classes
+
+
+def measure(number):
+    """
+    Measure nanoseconds per dispatched call.
+    """
+    handle, classes = create_handlers_classes(number)
+    handlers = [class_() for class_ in classes]
+    handlers_number = len(handlers)
+
+    for handler in handlers:
+        handle(handler)
+
+    started_at = time.perf_counter()
+
+    for index in range(CALLS_NUMBER):
+        handle(handlers[index % handlers_number])
+
+    return (time.perf_counter() - started_at) / CALLS_NUMBER * 1e9
+
+
+if __name__ == '__main__':
+    for number in HANDLERS_CLASSES_NUMBERS:
+        print('{number:>5} handler classes: {nanoseconds:>6.0f} ns per call'.format(
+            number=number, nanoseconds=measure(number),
+        ))
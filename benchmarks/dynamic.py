@@ -0,0 +1,68 @@
+"""
+Provide benchmark of checking classes created at runtime by `type` (e.g. generated from schemas).
+
+Run it with `python -m benchmarks.dynamic`. Both `implements` and `accessify` should check at least 10 000 classes
+per second.
+"""
+import time
+
+from accessify import (
+    accessify,
+    implements,
+    private,
+)
+
+CLASSES_NUMBER = 20000
+
+
+def save(self, using=None):
+    pass
+
+
+def delete(self):
+    pass
+
+
+def validate(self):
+    pass
+
+
+def key(self):
+    return 'key'
+
+
+RecordInterface = type('RecordInterface', (), {'save': save, 'delete': delete, 'key': property(key)})
+
+
+def create_class(index):
+    """
+    Create the class the same way classes generated from schemas are created.
+    """
+    return type('Record' + str(index), (), {
+        'save': save,
+        'delete': delete,
+        'validate': private(validate),
+        'key': property(key),
+        'table_name': 'records_' + str(index),
+    })
+
+
+def measure(check):
+    """
+    Measure classes created and checked per second.
+    """
+    started_at = time.perf_counter()
+
+    for index in range(CLASSES_NUMBER):
+        check(create_class(index))
+
+    return CLASSES_NUMBER / (time.perf_counter() - started_at)
+
+
+if __name__ == '__main__':
+    for name, check in (
+        ('type', lambda class_: class_),
+        ('type + implements', implements(RecordInterface)),
+        ('type + accessify', accessify),
+    ):
+        print('{name:>18}: {classes:>8.0f} classes per second'.format(name=name, classes=measure(check)))
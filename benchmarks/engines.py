@@ -0,0 +1,76 @@
+"""
+Provide benchmark of per-call overhead of the enforcement engines.
+
+Run it with `python -m benchmarks.engines`. Reports time per allowed call of the private method for every engine
+available on the running Python version, of the call inside the trusted block and their overhead over the plain
+method.
+"""
+import timeit
+
+from accessify import (
+    private,
+    set_engine,
+    trusted,
+)
+from accessify.engines import (
+    ENGINES,
+    EngineNames,
+)
+from accessify.monitoring import is_monitoring_supported
+
+CALLS_NUMBER = 200000
+REPEATS_NUMBER = 5
+
+
+class Car:
+
+    def start_engine(self):
+        pass
+
+    def run(self):
+        self.start_engine()
+
+
+class GuardedCar:
+
+    @private
+    def start_engine(self):
+        pass
+
+    def run(self):
+        self.start_engine()
+
+
+def measure(car):
+    """
+    Measure the best time per call of the car's private method from the car's own method, in nanoseconds.
+    """
+    return min(timeit.repeat(car.run, number=CALLS_NUMBER, repeat=REPEATS_NUMBER)) / CALLS_NUMBER * 1e9
+
+
+def report(name, time_per_call, plain_time_per_call):
+    """
+    Print time per call and its overhead over the plain method.
+    """
+    print('{name:>10}: {time_per_call:>7.0f} ns per call, {overhead:>7.0f} ns overhead'.format(
+        name=name, time_per_call=time_per_call, overhead=time_per_call - plain_time_per_call,
+    ))
+
+
+if __name__ == '__main__':
+    plain_time_per_call = measure(Car())
+    guarded_car = GuardedCar()
+
+    print('{name:>10}: {time_per_call:>7.0f} ns per call'.format(name='plain', time_per_call=plain_time_per_call))
+
+    for engine_name in ENGINES:
+        if engine_name == EngineNames.MONITORING and not is_monitoring_supported():
+            continue
+
+        set_engine(engine_name)
+        report(name=engine_name, time_per_call=measure(guarded_car), plain_time_per_call=plain_time_per_call)
+
+    set_engine(EngineNames.FRAME)
+
+    with trusted():
+        report(name='trusted', time_per_call=measure(guarded_car), plain_time_per_call=plain_time_per_call)
@@ -0,0 +1,63 @@
+"""
+Provide benchmark of memory used by accessify while classes are created at runtime and discarded.
+
+Run it with `python -m benchmarks.memory`. Traced memory should stay flat.
+"""
+import gc
+import time
+import tracemalloc
+
+from accessify import (
+    implements,
+    private,
+    provides,
+    warm,
+)
+
+CLASSES_NUMBER = 100000
+REPORT_EVERY_CLASSES_NUMBER = 10000
+
+
+class ModelInterface:
+
+    def save(self):
+        pass
+
+
+def create_class(index):
+    """
+    Create the class implementing the interface created at runtime and fill accessify caches with them.
+    """
+    tenant_model_interface = type('TenantModelInterface' + str(index), (ModelInterface,), {'delete': lambda self: None})
+
+    @implements(tenant_model_interface)
+    class TenantModel:
+
+        @private
+        def validate(self):
+            pass
+
+        def save(self):
+            pass
+
+        def delete(self):
+            pass
+
+    warm([TenantModel])
+    provides(TenantModel(), ModelInterface)
+
+
+if __name__ == '__main__':
+    tracemalloc.start()
+    started_at = time.perf_counter()
+
+    for index in range(1, CLASSES_NUMBER + 1):
+        create_class(index)
+
+        if index % REPORT_EVERY_CLASSES_NUMBER == 0:
+            gc.collect()
+            gc.collect()
+
+            print('{index:>6} classes: {memory:>8.1f} KiB traced, {seconds:>6.1f} s'.format(
+                index=index, memory=tracemalloc.get_traced_memory()[0] / 1024, seconds=time.perf_counter() - started_at,
+            ))
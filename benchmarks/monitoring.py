@@ -0,0 +1,64 @@
+"""
+Provide benchmark of guarded calls checked by the wrappers and by the monitoring engine.
+
+Run it with `python -m benchmarks.monitoring` on Python 3.12 or later. Reports time per allowed call of the private
+method for a plain method, the wrapper, the enabled and the disabled monitoring engine.
+"""
+import sys
+import timeit
+
+from accessify import (
+    disable_monitoring,
+    enable_monitoring,
+    private,
+    uninstall_monitoring,
+)
+from accessify.monitoring import is_monitoring_supported
+
+CALLS_NUMBER = 200000
+REPEATS_NUMBER = 5
+
+
+class Car:
+
+    def start_engine(self):
+        pass
+
+    def run(self):
+        self.start_engine()
+
+
+class GuardedCar:
+
+    @private
+    def start_engine(self):
+        pass
+
+    def run(self):
+        self.start_engine()
+
+
+def measure(car):
+    """
+    Measure the best time per call of the car's private method from the car's own method, in nanoseconds.
+    """
+    return min(timeit.repeat(car.run, number=CALLS_NUMBER, repeat=REPEATS_NUMBER)) / CALLS_NUMBER * 1e9
+
+
+if __name__ == '__main__':
+    if not is_monitoring_supported():
+        sys.exit('Monitoring engine requires Python 3.12 or later.')
+
+    car, guarded_car = Car(), GuardedCar()
+    results = [('plain method', measure(car)), ('wrapper', measure(guarded_car))]
+
+    enable_monitoring()
+    results.append(('monitoring enabled', measure(guarded_car)))
+
+    disable_monitoring()
+    results.append(('monitoring disabled', measure(guarded_car)))
+
+    uninstall_monitoring()
+
+    for name, time_per_call in results:
+        print('{name:>20}: {time_per_call:>7.0f} ns per call'.format(name=name, time_per_call=time_per_call))
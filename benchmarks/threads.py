@@ -0,0 +1,93 @@
+"""
+Provide stress benchmark of accessibility levels used from multiple threads.
+
+Run it with `python -m benchmarks.threads`. On free-threaded builds of CPython, calls per second should grow with
+the number of threads instead of flattening out because of lock contention.
+"""
+import sys
+import threading
+import time
+
+from accessify import (
+    private,
+    protected,
+)
+from accessify.errors import InaccessibleDueToItsProtectionLevelException
+
+THREADS_NUMBERS = (1, 2, 4, 8, 16, 32)
+CALLS_PER_THREAD_NUMBER = 20000
+
+
+class Car:
+
+    @private
+    def start_engine(self):
+        return 'Engine sound.'
+
+    @protected
+    def stop_engine(self):
+        return 'Engine has been stopped.'
+
+    def run(self):
+        self.start_engine()
+        self.stop_engine()
+
+
+class Tesla:
+
+    def run(self):
+        try:
+            Car().start_engine()
+        except InaccessibleDueToItsProtectionLevelException:
+            return
+
+        raise AssertionError('Private member is accessible outside the class.')
+
+
+def work(calls_number):
+    """
+    Do allowed and denied guarded calls.
+    """
+    car, tesla = Car(), Tesla()
+
+    for index in range(calls_number):
+        car.run()
+
+        if index % 100 == 0:
+            tesla.run()
+
+
+def measure(threads_number):
+    """
+    Measure guarded calls per second made from the number of threads.
+    """
+    barrier = threading.Barrier(threads_number + 1)
+
+    def worker():
+        barrier.wait()
+        work(CALLS_PER_THREAD_NUMBER)
+
+    threads = [threading.Thread(target=worker) for _ in range(threads_number)]
+
+    for thread in threads:
+        thread.start()
+
+    barrier.wait()
+    started_at = time.perf_counter()
+
+    for thread in threads:
+        thread.join()
+
+    elapsed = time.perf_counter() - started_at
+
+    return threads_number * CALLS_PER_THREAD_NUMBER * 2 / elapsed
+
+
+if __name__ == '__main__':
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print('Python {version}, GIL enabled: {gil}'.format(version=sys.version.split()[0], gil=is_gil_enabled))
+
+    for threads_number in THREADS_NUMBERS:
+        print('{threads:>3} threads: {calls:>12,.0f} guarded calls per second'.format(
+            threads=threads_number, calls=measure(threads_number),
+        ))
@@ -0,0 +1,80 @@
+"""
+Provide benchmark of memory used by accessibility level wrappers.
+
+Run it with `python -m benchmarks.wrappers`. Reports traced memory of guarded methods and memory `accessify` adds to classes.
+"""
+import gc
+import tracemalloc
+
+from accessify import (
+    accessify,
+    private,
+    protected,
+)
+
+GUARDED_METHODS_NUMBER = 100000
+GUARDED_METHODS_PER_CLASS_NUMBER = 10
+
+
+def create_functions():
+    """
+    Create plain functions to be guarded, so their own memory is not measured.
+    """
+    functions = []
+
+    for index in range(GUARDED_METHODS_NUMBER):
+        def function(self):
+            pass
+
+        function.__name__ = function.__qualname__ = 'method' + str(index)
+        functions.append(function)
+
+    return functions
+
+
+def measure(create):
+    """
+    Measure traced memory allocated by the creating function, in bytes.
+    """
+    gc.collect()
+    memory_before, _ = tracemalloc.get_traced_memory()
+    created = create()
+    gc.collect()
+    memory_after, _ = tracemalloc.get_traced_memory()
+
+    return created, memory_after - memory_before
+
+
+if __name__ == '__main__':
+    tracemalloc.start()
+    functions = create_functions()
+
+    wrappers, wrappers_memory = measure(lambda: [
+        (private if index % 2 else protected)(function) for index, function in enumerate(functions)
+    ])
+
+    def create_classes(decorate):
+        return [
+            decorate(type('Class' + str(index), (), {
+                wrapper.__name__: wrapper for wrapper in wrappers[index:index + GUARDED_METHODS_PER_CLASS_NUMBER]
+            }))
+            for index in range(0, GUARDED_METHODS_NUMBER, GUARDED_METHODS_PER_CLASS_NUMBER)
+        ]
+
+    _, plain_classes_memory = measure(lambda: create_classes(decorate=lambda class_: class_))
+    classes, classes_memory = measure(lambda: create_classes(decorate=accessify))
+    classes_memory -= plain_classes_memory
+
+    instances = [class_() for class_ in classes]
+    dir(instances[0])
+
+    print('{number} guarded methods: {memory:>8.1f} KiB of wrappers, {per_method:>5.0f} B per method'.format(
+        number=GUARDED_METHODS_NUMBER,
+        memory=wrappers_memory / 1024,
+        per_method=wrappers_memory / GUARDED_METHODS_NUMBER,
+    ))
+    print('{number} accessified classes: {memory:>8.1f} KiB of accessify overhead, {per_class:>5.0f} B per class'.format(
+        number=len(classes),
+        memory=classes_memory / 1024,
+        per_class=classes_memory / len(classes),
+    ))
@@ -56,12 +56,29 @@ class CarWithPrivateCustomDecoratorEngine:
         return self.start_engine('electric', 'S', company='Tesla')
 
 
+class Engine:
+
+    def start_engine(self, type_, model, company='Tesla'):
+        return ENGINE_HAS_BEEN_STARTED_RESPONSE.format(type_=type_, model=model, company=company)
+
+
+class CarWithPrivateSuperCallEngine(Engine):
+
+    @private
+    def start_engine(self, type_, model, company='Tesla'):
+        return super().start_engine(type_, model, company=company)
+
+    def run(self):
+        return self.start_engine('electric', 'S', company='Tesla')
+
+
 @pytest.mark.parametrize(
     "class_", [
         CarWithPrivateEngine,
         CarWithPrivateStaticMethodEngine,
         CarWithPrivateClassMethodEngine,
         CarWithPrivateCustomDecoratorEngine,
+        CarWithPrivateSuperCallEngine,
 ])
 def test_private_access_with_decorators(class_, enable_accessify):
     """
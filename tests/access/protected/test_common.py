@@ -103,3 +103,27 @@ def test_protected_access_through_caller_object(enable_accessify):
         tesla.run()
 
     assert expected_error_message == error.value.message
+
+
+def test_protected_access_inside_methods_added_to_class(enable_accessify, monkeypatch):
+    """
+    Case: access to the protected member inside the method, that replaces member's class method, and inside
+        the method added to member's class, after the access has been checked.
+    Expect: protected member is accessible.
+    """
+    car = CarWithProtectedEngine()
+    expected_result = ENGINE_HAS_BEEN_STARTED_RESPONSE.format(type_='electric', model='S', company='Tesla')
+
+    assert expected_result == car.run()
+
+    def run(self):
+        return self.start_engine('electric', 'S', company='Tesla')
+
+    def drive(self):
+        return self.start_engine('electric', 'S', company='Tesla')
+
+    monkeypatch.setattr(CarWithProtectedEngine, 'run', run)
+    monkeypatch.setattr(CarWithProtectedEngine, 'drive', drive, raising=False)
+
+    assert expected_result == car.run()
+    assert expected_result == car.drive()
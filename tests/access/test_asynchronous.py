@@ -0,0 +1,85 @@
+"""
+Provide tests for accessibility levels of coroutine, asynchronous generator and generator members.
+"""
+import asyncio
+
+import pytest
+from accessify.access import (
+    private,
+    protected,
+)
+from accessify.errors import (
+    INACCESSIBLE_DUE_TO_ITS_PROTECTION_LEVEL_EXCEPTION_MESSAGE,
+    InaccessibleDueToItsProtectionLevelException,
+)
+
+
+class Car:
+
+    @private
+    async def start_engine(self):
+        await asyncio.sleep(0)
+        return 'Engine sound.'
+
+    @protected
+    async def gears(self):
+        for gear in range(1, 4):
+            yield gear
+
+    @private
+    def wheels(self):
+        yield from range(4)
+
+    async def run(self):
+        return await self.start_engine(), [gear async for gear in self.gears()], list(self.wheels())
+
+
+class Tesla:
+
+    async def run(self):
+        car = Car()
+        return await car.start_engine()
+
+
+def test_coroutine_function_access_inside_class(enable_accessify):
+    """
+    Case: access to the private coroutine, protected asynchronous generator and private generator inside the class.
+    Expect: members are accessible.
+    """
+    assert ('Engine sound.', [1, 2, 3], [0, 1, 2, 3]) == asyncio.run(Car().run())
+
+
+def test_coroutine_function_access_through_caller_object(enable_accessify):
+    """
+    Case: access to the private coroutine through member's class object in another class coroutine.
+    Expect: inaccessible due to its protection level error message.
+    """
+    expected_error_message = INACCESSIBLE_DUE_TO_ITS_PROTECTION_LEVEL_EXCEPTION_MESSAGE.format(
+        class_name=Car.__name__, class_method_name='start_engine',
+    )
+
+    with pytest.raises(InaccessibleDueToItsProtectionLevelException) as error:
+        asyncio.run(Tesla().run())
+
+    assert expected_error_message == error.value.message
+
+
+@pytest.mark.parametrize('member_name', ['start_engine', 'gears', 'wheels'])
+def test_access_checked_on_call(member_name, enable_accessify):
+    """
+    Case: call the private or protected coroutine, asynchronous generator or generator through member's class object.
+    Expect: inaccessible due to its protection level error is raised by the call, before awaiting or iterating.
+    """
+    with pytest.raises(InaccessibleDueToItsProtectionLevelException):
+        getattr(Car(), member_name)()
+
+
+def test_coroutine_function_introspection():
+    """
+    Case: introspect the private coroutine.
+    Expect: coroutine function is recognized as coroutine function, other members are not.
+    """
+    assert asyncio.iscoroutinefunction(Car.start_engine)
+    assert asyncio.iscoroutinefunction(Car().start_engine)
+    assert not asyncio.iscoroutinefunction(Car.gears)
+    assert not asyncio.iscoroutinefunction(Car.wheels)
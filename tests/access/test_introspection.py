@@ -0,0 +1,113 @@
+"""
+Provide tests for introspection of members with accessibility levels.
+"""
+import inspect
+
+import pytest
+from accessify.access import (
+    accessify,
+    private,
+    protected,
+)
+from accessify.utils import (
+    AccessModifierTypes,
+    ClassMemberTypes,
+    find_decorated_method,
+)
+from tests.utils import custom_decorator
+
+
+class Car:
+
+    @private
+    def start_engine(self, type_, model, company='Tesla'):
+        pass
+
+    @protected
+    @staticmethod
+    def stop_engine(force=False):
+        pass
+
+    @private
+    @classmethod
+    @custom_decorator
+    def create(cls, model):
+        pass
+
+
+@pytest.mark.parametrize('member_name, access_type, member_type', [
+    ('start_engine', AccessModifierTypes.PRIVATE, ClassMemberTypes.METHOD),
+    ('stop_engine', AccessModifierTypes.PROTECTED, ClassMemberTypes.STATIC_METHOD),
+    ('create', AccessModifierTypes.PRIVATE, ClassMemberTypes.CLASS_METHOD),
+])
+def test_access_wrapper_attributes(member_name, access_type, member_type):
+    """
+    Case: get attributes of the accessibility level wrapper.
+    Expect: wrapper exposes access modifier type, class that owns the member, wrapped member and decorated method.
+    """
+    wrapper = Car.__dict__[member_name]
+
+    assert access_type == wrapper.__access_type__
+    assert member_type == wrapper.__member_type__
+    assert Car is wrapper.__owner__
+    assert member_name == wrapper.__decorated_method__.__name__
+    assert wrapper.__decorated_method__ is find_decorated_method(function=wrapper)
+    assert wrapper.__decorated_method__ is find_decorated_method(function=Car().__getattribute__(member_name))
+
+
+def test_access_wrapper_wraps_static_and_class_methods():
+    """
+    Case: get wrapped member of the accessibility level wrapper of static and class methods.
+    Expect: wrapped member is the static or class method object itself.
+    """
+    assert isinstance(Car.__dict__['stop_engine'].__wrapped__, staticmethod)
+    assert isinstance(Car.__dict__['create'].__wrapped__, classmethod)
+
+
+def test_access_wrapper_signature():
+    """
+    Case: get signature of the accessibility level wrapper and its bound method.
+    Expect: signature of the wrapped method.
+    """
+    assert ['self', 'type_', 'model', 'company'] == list(inspect.signature(Car.start_engine).parameters)
+    assert ['type_', 'model', 'company'] == list(inspect.signature(Car().start_engine).parameters)
+
+
+def test_access_wrapper_is_compact():
+    """
+    Case: get attributes of the accessibility level wrapper set to the function by other decorators.
+    Expect: wrapper has no attributes dictionary of its own, attributes are read from the function.
+    """
+    def start_engine(self):
+        pass
+
+    start_engine.alters_data = True
+    wrapper = private(start_engine)
+
+    assert start_engine.__dict__ is wrapper.__dict__
+    assert wrapper.alters_data
+    assert 'start_engine' == wrapper.__name__
+    assert start_engine.__qualname__ == wrapper.__qualname__
+    assert __name__ == wrapper.__module__
+
+
+def test_accessify_hides_members_with_accessibility_levels():
+    """
+    Case: get names of members of the instance of the accessified class and its subclass.
+    Expect: members with accessibility levels, including inherited ones, are hidden, instance attributes are shown.
+    """
+    @accessify
+    class Tesla(Car):
+
+        @private
+        def charge(self):
+            pass
+
+    tesla = Tesla()
+    tesla.battery = 100
+
+    assert 'battery' in dir(tesla)
+    assert 'charge' not in dir(tesla)
+    assert 'start_engine' not in dir(tesla)
+    assert 'stop_engine' not in dir(tesla)
+    assert 'start_engine' in dir(Car())
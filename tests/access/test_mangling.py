@@ -0,0 +1,228 @@
+"""
+Provide tests for private members renamed to mangled names by accessify.
+"""
+import dis
+
+import pytest
+from accessify import (
+    accessify,
+    set_engine,
+)
+from accessify.access import (
+    AccessWrapper,
+    private,
+    protected,
+)
+from accessify.audit import (
+    disable_audit,
+    enable_audit,
+)
+from accessify.engines import EngineNames
+from accessify.errors import (
+    INACCESSIBLE_DUE_TO_ITS_PROTECTION_LEVEL_EXCEPTION_MESSAGE,
+    InaccessibleDueToItsProtectionLevelException,
+)
+
+
+@accessify(mangle=True)
+class Car:
+
+    @private
+    def start_engine(self):
+        return 'Engine sound.'
+
+    @protected
+    def stop_engine(self):
+        return 'Engine has been stopped.'
+
+    @private
+    @classmethod
+    def create(cls):
+        return cls
+
+    @private
+    @staticmethod
+    def horn():
+        return 'Horn sound.'
+
+    @property
+    def sound(self):
+        return self.start_engine()
+
+    def run(self):
+        return [self.start_engine(), self.stop_engine(), self.create(), self.horn(), self.sound]
+
+    def run_nested(self):
+        start = lambda: self.start_engine()
+        return [start()] + [self.horn() for _ in range(1)]
+
+
+def close():
+    return 'Module has been closed.'
+
+
+def shutdown(self):
+    return self.close()
+
+
+class Connection:
+
+    shutdown = shutdown
+
+    def close(self):
+        return 'Connection has been closed.'
+
+
+@accessify(mangle=True)
+class Session:
+
+    shutdown = shutdown
+
+    def __init__(self):
+        self.connection = Connection()
+
+    @private
+    def close(self):
+        return 'Session has been closed.'
+
+    @staticmethod
+    def close_connection(self):
+        return self.close()
+
+    def run(self):
+        return [
+            self.close(),
+            self.connection.close(),
+            close(),
+            (lambda self: self.close())(self.connection),
+            self.close_connection(self.connection),
+        ]
+
+
+class Tesla(Car):
+
+    def run(self):
+        return self.start_engine()
+
+
+class Toyota(Car):
+    pass
+
+
+def get_error_message(class_name, class_method_name):
+    """
+    Get inaccessible due to its protection level error message.
+    """
+    return INACCESSIBLE_DUE_TO_ITS_PROTECTION_LEVEL_EXCEPTION_MESSAGE.format(
+        class_name=class_name, class_method_name=class_method_name,
+    )
+
+
+def get_loaded_attributes(function):
+    """
+    Get names of the attributes the function loads.
+    """
+    return [
+        instruction.argval for instruction in dis.get_instructions(function)
+        if instruction.opname in ('LOAD_ATTR', 'LOAD_METHOD')
+    ]
+
+
+def test_mangling_renames_private_members_references():
+    """
+    Case: mangle private members of the class.
+    Expect: private members are put under mangled names without wrappers and the class methods reference them,
+        wrappers are kept under original names.
+    """
+    assert isinstance(Car.__dict__['start_engine'], AccessWrapper)
+    assert Car.__dict__['start_engine'].__wrapped__ is Car.__dict__['_Car__start_engine']
+    assert isinstance(Car.__dict__['stop_engine'], AccessWrapper)
+    assert '_Car__stop_engine' not in Car.__dict__
+
+    assert ['_Car__start_engine', 'stop_engine', '_Car__create', '_Car__horn', 'sound'] == get_loaded_attributes(
+        function=Car.run,
+    )
+    assert 'start_engine' not in dir(Car())
+
+
+def test_mangled_access_inside_class(enable_accessify):
+    """
+    Case: access to the mangled private members inside member's class, its property, lambda and comprehension.
+    Expect: members are accessible.
+    """
+    assert ['Engine sound.', 'Engine has been stopped.', Car, 'Horn sound.', 'Engine sound.'] == Car().run()
+    assert ['Engine sound.', 'Horn sound.'] == Car().run_nested()
+
+
+def test_mangling_keeps_globals_and_other_objects_attributes(enable_accessify):
+    """
+    Case: mangle the private member, the name of which is also the name of the global, the attribute of another
+        object, the attribute of the lambda argument and the attribute of the static method argument named as receiver.
+    Expect: only the private member loaded from the receiver is renamed, other names are kept.
+    """
+    assert [
+        'Session has been closed.',
+        'Connection has been closed.',
+        'Module has been closed.',
+        'Connection has been closed.',
+        'Connection has been closed.',
+    ] == Session().run()
+    assert [
+        '_Session__close', 'connection', 'close', 'connection', 'close_connection', 'connection',
+    ] == get_loaded_attributes(function=Session.run)
+
+
+def test_mangling_keeps_functions_shared_with_other_classes(enable_accessify):
+    """
+    Case: mangle the private member loaded in the function, that is set to the class and to another class.
+    Expect: the function is copied for the class, the function another class uses is kept.
+    """
+    assert 'Session has been closed.' == Session().shutdown()
+    assert 'Connection has been closed.' == Connection().shutdown()
+    assert ['_Session__close'] == get_loaded_attributes(function=Session.shutdown)
+    assert ['close'] == get_loaded_attributes(function=shutdown)
+
+
+def test_mangled_access_outside_class(enable_accessify):
+    """
+    Case: access to the mangled private members outside member's class, inside child class and inside member's class
+        method child class inherits.
+    Expect: inaccessible due to its protection level error message.
+    """
+    for call, class_method_name in (
+        (lambda: Car().start_engine(), 'start_engine'),
+        (lambda: Car().horn(), 'horn'),
+        (lambda: Car().create(), 'create'),
+        (lambda: Tesla().run(), 'start_engine'),
+        (lambda: Toyota().run(), 'start_engine'),
+    ):
+        with pytest.raises(InaccessibleDueToItsProtectionLevelException) as error:
+            call()
+
+        assert get_error_message(class_name=Car.__name__, class_method_name=class_method_name) == error.value.message
+
+
+def test_mangled_access_outside_class_without_checks(enable_accessify):
+    """
+    Case: access to the mangled private member outside member's class with the engine that does not check access
+        and with audit mode.
+    Expect: member is accessible, audit mode records the violation.
+    """
+    set_engine(EngineNames.NONE)
+
+    try:
+        assert 'Engine sound.' == Car().start_engine()
+    finally:
+        set_engine(EngineNames.FRAME)
+
+    batches = []
+    enable_audit(sink=batches.append)
+
+    try:
+        assert 'Engine sound.' == Car().start_engine()
+    finally:
+        disable_audit()
+
+    assert [('Car', 'start_engine')] == [
+        (violation.class_name, violation.class_method_name) for batch in batches for violation in batch
+    ]
@@ -0,0 +1,133 @@
+"""
+Provide tests for accessify caches and registries not keeping classes created at runtime alive.
+"""
+import gc
+import sys
+import tracemalloc
+import weakref
+
+from accessify import (
+    dispatch,
+    implements,
+    private,
+    provides,
+    warm,
+)
+from accessify.audit import AccessViolationsAuditor
+
+WARMING_UP_CLASSES_NUMBER = 1000
+DISCARDED_CLASSES_NUMBER = 1000
+MAXIMUM_MEMORY_GROWTH_PER_CLASS_BYTES = 64
+
+
+class CarInterface:
+
+    def run(self):
+        pass
+
+
+@dispatch
+def describe(object_):
+    return 'unknown'
+
+
+@describe.register(CarInterface)
+def describe_car(car):
+    return 'car'
+
+
+def create_class():
+    """
+    Create the class implementing the interface created at runtime and fill all accessify caches with them.
+    """
+    class TenantCarInterface(CarInterface):
+
+        def park(self):
+            pass
+
+    @implements(TenantCarInterface)
+    class TenantCar:
+
+        @private
+        def start_engine(self):
+            return 'Engine sound.'
+
+        def run(self):
+            return self.start_engine()
+
+        def park(self):
+            pass
+
+    globals()['TenantCar'] = TenantCar
+
+    try:
+        warm([TenantCar])
+
+        assert 'Engine sound.' == TenantCar().run()
+        assert provides(TenantCar(), CarInterface)
+        assert 'car' == describe(TenantCar())
+
+    finally:
+        del globals()['TenantCar']
+
+    return TenantCar
+
+
+def collect_garbage():
+    """
+    Collect the garbage until there is nothing to collect.
+
+    Values of weak key dictionaries are released when their keys are collected, so objects they reference are
+    collected by the next collection.
+    """
+    while gc.collect():
+        pass
+
+
+def create_and_discard_classes(number):
+    """
+    Create the number of classes, discard them and collect the garbage.
+    """
+    for _ in range(number):
+        create_class()
+
+    collect_garbage()
+
+
+def test_classes_are_not_kept_alive(enable_accessify):
+    """
+    Case: create the class, fill all accessify caches and audit violations with it and discard the class.
+    Expect: the class and its interface are garbage collected.
+    """
+    class_ = create_class()
+    class_reference = weakref.ref(class_)
+    interface_reference = weakref.ref(next(iter(class_.__implements__)))
+
+    auditor = AccessViolationsAuditor(sink=lambda violations: None)
+    auditor.record(class_name=class_.__name__, method=class_.run, caller_frame=sys._getframe())
+
+    del class_
+    collect_garbage()
+
+    assert class_reference() is None
+    assert interface_reference() is None
+
+
+def test_memory_is_flat(enable_accessify):
+    """
+    Case: create and discard a lot of classes.
+    Expect: memory does not grow.
+    """
+    tracemalloc.start()
+
+    try:
+        create_and_discard_classes(number=WARMING_UP_CLASSES_NUMBER)
+        memory_before, _ = tracemalloc.get_traced_memory()
+
+        create_and_discard_classes(number=DISCARDED_CLASSES_NUMBER)
+        memory_after, _ = tracemalloc.get_traced_memory()
+
+    finally:
+        tracemalloc.stop()
+
+    assert memory_after - memory_before < DISCARDED_CLASSES_NUMBER * MAXIMUM_MEMORY_GROWTH_PER_CLASS_BYTES
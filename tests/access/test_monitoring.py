@@ -0,0 +1,223 @@
+"""
+Provide tests for accessibility levels enforced by the monitoring engine.
+"""
+import functools
+
+import pytest
+from accessify import accessify
+from accessify.access import (
+    AccessWrapper,
+    private,
+    protected,
+)
+from accessify.errors import (
+    INACCESSIBLE_DUE_TO_ITS_PROTECTION_LEVEL_EXCEPTION_MESSAGE,
+    InaccessibleDueToItsProtectionLevelException,
+    MonitoringIsNotAvailableException,
+)
+from accessify.monitoring import (
+    MONITORING_ENGINE,
+    disable_monitoring,
+    enable_monitoring,
+    is_monitoring_supported,
+    uninstall_monitoring,
+)
+
+requires_monitoring = pytest.mark.skipif(not is_monitoring_supported(), reason='sys.monitoring is not available')
+
+
+def decorator(function):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        return function(*args, **kwargs)
+    return wrapper
+
+
+@accessify
+class Car:
+
+    @private
+    def start_engine(self):
+        return 'Engine sound.'
+
+    @protected
+    def stop_engine(self):
+        return 'Engine has been stopped.'
+
+    @private
+    @classmethod
+    def create(cls):
+        return cls
+
+    @private
+    @staticmethod
+    def horn():
+        return 'Horn sound.'
+
+    @private
+    @decorator
+    def lights(self):
+        return 'Lights are on.'
+
+    def run(self):
+        return self.start_engine() + ' ' + self.stop_engine()
+
+    def run_create(self):
+        return self.create()
+
+
+class Tesla(Car):
+
+    def run(self):
+        return self.start_engine()
+
+    def run_protected(self):
+        return self.stop_engine()
+
+
+@pytest.fixture
+def monitoring(enable_accessify):
+    """
+    Enforce accessibility levels by the monitoring engine during the test.
+    """
+    enable_monitoring()
+    yield
+    uninstall_monitoring()
+
+
+def get_error_message(class_name, class_method_name):
+    """
+    Get inaccessible due to its protection level error message.
+    """
+    return INACCESSIBLE_DUE_TO_ITS_PROTECTION_LEVEL_EXCEPTION_MESSAGE.format(
+        class_name=class_name, class_method_name=class_method_name,
+    )
+
+
+@requires_monitoring
+def test_monitoring_unwraps_methods(monitoring):
+    """
+    Case: enable the monitoring engine.
+    Expect: methods and class methods are unwrapped, static methods and decorated methods keep wrappers.
+    """
+    assert not isinstance(Car.__dict__['start_engine'], AccessWrapper)
+    assert not isinstance(Car.__dict__['stop_engine'], AccessWrapper)
+    assert not isinstance(Car.__dict__['create'], AccessWrapper)
+    assert isinstance(Car.__dict__['horn'], AccessWrapper)
+    assert isinstance(Car.__dict__['lights'], AccessWrapper)
+    assert 'private' == Car.__dict__['start_engine'].__access_type__
+
+
+@requires_monitoring
+def test_monitoring_access_inside_class(monitoring):
+    """
+    Case: access to the private and protected members inside member's class and protected member in child class.
+    Expect: members are accessible.
+    """
+    assert 'Engine sound. Engine has been stopped.' == Car().run()
+    assert Car is Car().run_create()
+    assert 'Engine has been stopped.' == Tesla().run_protected()
+
+
+@requires_monitoring
+def test_monitoring_access_outside_class(monitoring):
+    """
+    Case: access to the private and protected members and private class member outside member's class.
+    Expect: inaccessible due to its protection level error message.
+    """
+    for call, class_method_name in (
+        (lambda: Car().start_engine(), 'start_engine'),
+        (lambda: Car().stop_engine(), 'stop_engine'),
+        (lambda: Car.create(), 'create'),
+    ):
+        with pytest.raises(InaccessibleDueToItsProtectionLevelException) as error:
+            call()
+
+        assert get_error_message(class_name=Car.__name__, class_method_name=class_method_name) == error.value.message
+
+
+@requires_monitoring
+def test_monitoring_private_access_in_child_class(monitoring):
+    """
+    Case: access to the private member of the parent class inside child class.
+    Expect: inaccessible due to its protection level error message with the parent class name.
+    """
+    with pytest.raises(InaccessibleDueToItsProtectionLevelException) as error:
+        Tesla().run()
+
+    assert get_error_message(class_name=Car.__name__, class_method_name='start_engine') == error.value.message
+
+
+@requires_monitoring
+def test_monitoring_hides_unwrapped_members(monitoring):
+    """
+    Case: get names of the accessified class instance members with the monitoring engine enabled.
+    Expect: unwrapped members with accessibility levels are not listed.
+    """
+    names = dir(Car())
+
+    assert 'run' in names
+    assert 'start_engine' not in names
+    assert 'stop_engine' not in names
+
+
+@requires_monitoring
+def test_monitoring_guards_classes_created_after_enabling(monitoring):
+    """
+    Case: create class with private member after enabling the monitoring engine, access to the member outside class.
+    Expect: member is unwrapped and inaccessible due to its protection level error message.
+    """
+    class Truck:
+
+        @private
+        def start_engine(self):
+            return 'Engine sound.'
+
+    assert not isinstance(Truck.__dict__['start_engine'], AccessWrapper)
+
+    with pytest.raises(InaccessibleDueToItsProtectionLevelException):
+        Truck().start_engine()
+
+
+@requires_monitoring
+def test_monitoring_disable(monitoring):
+    """
+    Case: disable the monitoring engine, access to the private member outside class, then enable it again.
+    Expect: member is accessible while the engine is disabled and inaccessible after it is enabled again.
+    """
+    disable_monitoring()
+
+    assert not MONITORING_ENGINE.is_enabled
+    assert 'Engine sound.' == Car().start_engine()
+
+    enable_monitoring()
+
+    with pytest.raises(InaccessibleDueToItsProtectionLevelException):
+        Car().start_engine()
+
+
+@requires_monitoring
+def test_monitoring_uninstall(enable_accessify):
+    """
+    Case: enable the monitoring engine, then uninstall it, access to the private member outside class.
+    Expect: wrappers are put back and member is inaccessible due to its protection level error message.
+    """
+    enable_monitoring()
+    uninstall_monitoring()
+
+    assert not MONITORING_ENGINE.is_installed
+    assert isinstance(Car.__dict__['start_engine'], AccessWrapper)
+    assert '__access_type__' not in vars(Car.__dict__['start_engine'].__wrapped__)
+
+    with pytest.raises(InaccessibleDueToItsProtectionLevelException):
+        Car().start_engine()
+
+
+@pytest.mark.skipif(is_monitoring_supported(), reason='sys.monitoring is available')
+def test_monitoring_is_not_supported():
+    """
+    Case: enable the monitoring engine on Python version without sys.monitoring.
+    Expect: monitoring is not available exception.
+    """
+    with pytest.raises(MonitoringIsNotAvailableException):
+        enable_monitoring()
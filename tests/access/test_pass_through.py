@@ -0,0 +1,121 @@
+"""
+Provide tests for frames of pass-through decorators skipped when the caller is resolved.
+"""
+import functools
+
+import pytest
+from accessify import (
+    pass_through,
+    private,
+    protected,
+    remove_pass_through,
+    set_engine,
+)
+from accessify.engines import EngineNames
+from accessify.errors import (
+    INACCESSIBLE_DUE_TO_ITS_PROTECTION_LEVEL_EXCEPTION_MESSAGE,
+    InaccessibleDueToItsProtectionLevelException,
+)
+
+
+def retry(function):
+    """
+    Retry the function call once if it raises the runtime error.
+    """
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        try:
+            return function(*args, **kwargs)
+        except RuntimeError:
+            return function(*args, **kwargs)
+
+    return wrapper
+
+
+class Traced:
+    """
+    Provide class-based decorator that traces the function calls.
+    """
+
+    def __init__(self, function):
+        """
+        Constructor.
+        """
+        self.function = function
+        self.calls_number = 0
+
+    def __get__(self, instance, owner=None):
+        """
+        Bind the decorator to the class object.
+        """
+        return functools.partial(self, instance)
+
+    def __call__(self, *args, **kwargs):
+        """
+        Trace the call and call the function.
+        """
+        self.calls_number += 1
+        return self.function(*args, **kwargs)
+
+
+class Car:
+
+    @retry
+    @private
+    def start_engine(self):
+        return 'Engine sound.'
+
+    @Traced
+    @protected
+    def stop_engine(self):
+        return 'Engine has been stopped.'
+
+    def run(self):
+        return [self.start_engine(), self.stop_engine()]
+
+
+@pytest.fixture(params=(EngineNames.FRAME, EngineNames.CODE_SET))
+def pass_through_decorators(request, enable_accessify):
+    """
+    Trust the decorators to pass calls through during the test under the engine.
+    """
+    set_engine(request.param)
+    pass_through(retry)
+    pass_through(Traced)
+
+    yield
+
+    remove_pass_through(retry)
+    remove_pass_through(Traced)
+    set_engine(EngineNames.FRAME)
+
+
+def test_access_inside_class_through_decorators(pass_through_decorators):
+    """
+    Case: access to the private and protected members, wrapped by pass-through decorators, inside member's class.
+    Expect: members are accessible.
+    """
+    assert ['Engine sound.', 'Engine has been stopped.'] == Car().run()
+
+
+def test_access_outside_class_through_decorators(pass_through_decorators):
+    """
+    Case: access to the private member, wrapped by pass-through decorator, outside member's class.
+    Expect: inaccessible due to its protection level error message.
+    """
+    with pytest.raises(InaccessibleDueToItsProtectionLevelException) as error:
+        Car().start_engine()
+
+    assert INACCESSIBLE_DUE_TO_ITS_PROTECTION_LEVEL_EXCEPTION_MESSAGE.format(
+        class_name=Car.__name__, class_method_name='start_engine',
+    ) == error.value.message
+
+
+def test_access_inside_class_through_decorators_not_passed_through(enable_accessify):
+    """
+    Case: access to the private member, wrapped by the decorator that is not trusted to pass calls through, inside
+        member's class.
+    Expect: inaccessible due to its protection level error message, as the caller is the decorator's wrapper.
+    """
+    with pytest.raises(InaccessibleDueToItsProtectionLevelException):
+        Car().run()
@@ -0,0 +1,76 @@
+"""
+Provide tests for pickling members with accessibility levels.
+"""
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from accessify.access import (
+    private,
+    protected,
+)
+from accessify.utils import AccessModifierTypes
+
+
+class Car:
+
+    @private
+    def start_engine(self):
+        return 'Engine sound.'
+
+    @protected
+    @staticmethod
+    def stop_engine():
+        return 'Engine has been stopped.'
+
+    @private
+    @classmethod
+    def create(cls):
+        return cls()
+
+    def run(self):
+        return self.start_engine()
+
+
+def get_member_metadata(member):
+    """
+    Get metadata of the member unpickled in the worker process.
+    """
+    return member.__module__, member.__qualname__, member.__access_type__
+
+
+@pytest.mark.parametrize('member_name', ['start_engine', 'stop_engine', 'create'])
+def test_pickle_member(member_name):
+    """
+    Case: pickle the private or protected member of the class.
+    Expect: member is pickled by the qualified name and unpickled to the same object.
+    """
+    member = getattr(Car, member_name)
+
+    assert __name__ == member.__module__
+    assert 'Car.' + member_name == member.__qualname__
+    assert member_name == member.__name__
+    assert member is pickle.loads(pickle.dumps(member))
+
+
+def test_pickle_bound_member():
+    """
+    Case: pickle the private member bound to the class object.
+    Expect: member is pickled by the name and keeps the accessibility level after unpickling.
+    """
+    member = pickle.loads(pickle.dumps(Car().start_engine))
+
+    assert AccessModifierTypes.PRIVATE == member.__access_type__
+    assert Car.start_engine.__wrapped__ is member.__func__.__wrapped__
+
+
+def test_send_member_to_process_pool():
+    """
+    Case: send the private and protected members to the process pool worker.
+    Expect: members are unpickled in the worker with the same metadata.
+    """
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        assert [
+            (__name__, 'Car.start_engine', AccessModifierTypes.PRIVATE),
+            (__name__, 'Car.stop_engine', AccessModifierTypes.PROTECTED),
+        ] == list(executor.map(get_member_metadata, [Car.start_engine, Car.stop_engine]))
@@ -0,0 +1,97 @@
+"""
+Provide tests for accessibility levels used from multiple threads.
+"""
+import threading
+
+from accessify.access import (
+    private,
+    protected,
+)
+from accessify.errors import InaccessibleDueToItsProtectionLevelException
+from accessify.utils import CopyOnWriteCache
+
+THREADS_NUMBER = 32
+CALLS_PER_THREAD_NUMBER = 200
+
+
+class Car:
+
+    @private
+    def start_engine(self):
+        return 'Engine sound.'
+
+    @protected
+    def stop_engine(self):
+        return 'Engine has been stopped.'
+
+    def run(self):
+        return self.start_engine() + ' ' + self.stop_engine()
+
+
+def run_in_threads(target):
+    """
+    Run the target in the threads those start simultaneously, return errors raised by the target.
+    """
+    barrier = threading.Barrier(THREADS_NUMBER)
+    errors = []
+
+    def worker():
+        barrier.wait()
+
+        try:
+            target()
+        except Exception as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=worker) for _ in range(THREADS_NUMBER)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    return errors
+
+
+def test_access_from_threads(enable_accessify):
+    """
+    Case: access to the private and protected members inside and outside member's class from multiple threads.
+    Expect: members are accessible inside the class and inaccessible outside the class in every thread.
+    """
+    def target():
+        car = Car()
+
+        for _ in range(CALLS_PER_THREAD_NUMBER):
+            assert 'Engine sound. Engine has been stopped.' == car.run()
+
+            try:
+                car.start_engine()
+            except InaccessibleDueToItsProtectionLevelException:
+                pass
+            else:
+                raise AssertionError('Private member is accessible outside the class.')
+
+    assert [] == run_in_threads(target)
+
+
+def test_copy_on_write_cache_from_threads():
+    """
+    Case: write to and read from the copy-on-write cache from multiple threads.
+    Expect: every written value is cached and read back.
+    """
+    class Key:
+        pass
+
+    cache = CopyOnWriteCache()
+    keys = [Key() for _ in range(THREADS_NUMBER * CALLS_PER_THREAD_NUMBER)]
+    counter = iter(range(THREADS_NUMBER * CALLS_PER_THREAD_NUMBER))
+
+    def target():
+        for _ in range(CALLS_PER_THREAD_NUMBER):
+            index = next(counter)
+            cache.set(keys[index], str(index))
+            assert str(index) == cache.lookup(keys[index])
+
+    assert [] == run_in_threads(target)
+    assert THREADS_NUMBER * CALLS_PER_THREAD_NUMBER == len(cache)
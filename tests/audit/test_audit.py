@@ -0,0 +1,160 @@
+"""
+Provide tests for audit enforcement mode that records accessibility levels violations instead of raising.
+"""
+import sys
+import threading
+import time
+
+from accessify.access import (
+    private,
+    protected,
+)
+from accessify.audit import (
+    AUDIT_SINK_FAILURE_MESSAGE,
+    AccessViolationsAuditor,
+    FileSink,
+    disable_audit,
+    enable_audit,
+)
+from accessify.errors import INACCESSIBLE_DUE_TO_ITS_PROTECTION_LEVEL_EXCEPTION_MESSAGE
+from tests.utils import ENGINE_HAS_BEEN_STARTED_RESPONSE
+
+
+class Car:
+
+    @private
+    def start_engine(self, type_, model, company='Tesla'):
+        return ENGINE_HAS_BEEN_STARTED_RESPONSE.format(type_=type_, model=model, company=company)
+
+    @protected
+    def stop_engine(self):
+        return 'Engine has been stopped.'
+
+
+class Tesla:
+
+    @staticmethod
+    def run():
+        car = Car()
+        return car.start_engine('electric', 'S', company='Tesla')
+
+
+def test_audit_records_violation_instead_of_raising(enable_accessify):
+    """
+    Case: access to the private member through member's class object in another class with enabled audit mode.
+    Expect: private member is accessible, violation is passed to the sink once per caller code and member.
+    """
+    batches = []
+    enable_audit(sink=batches.append)
+
+    try:
+        for _ in range(3):
+            assert ENGINE_HAS_BEEN_STARTED_RESPONSE.format(
+                type_='electric', model='S', company='Tesla',
+            ) == Tesla.run()
+
+        assert 'Engine has been stopped.' == Car().stop_engine()
+
+    finally:
+        disable_audit()
+
+    violations = [violation for batch in batches for violation in batch]
+
+    assert [
+        ('Car', 'start_engine', 'run'),
+        ('Car', 'stop_engine', 'test_audit_records_violation_instead_of_raising'),
+    ] == [
+        (violation.class_name, violation.class_method_name, violation.caller_code.co_name) for violation in violations
+    ]
+
+    expected_message = INACCESSIBLE_DUE_TO_ITS_PROTECTION_LEVEL_EXCEPTION_MESSAGE.format(
+        class_name='Car', class_method_name='start_engine',
+    )
+
+    assert violations[0].message.startswith(expected_message + ' (called from run in ')
+
+
+def start_engine():
+    pass
+
+
+def stop_engine():
+    pass
+
+
+def test_audit_ring_buffer_drops_oldest_violations():
+    """
+    Case: record more violations than the ring buffer capacity without flushing.
+    Expect: the oldest violations are dropped, the newest are passed to the sink by batches.
+    """
+    batches = []
+    auditor = AccessViolationsAuditor(sink=batches.append, capacity=3, batch_size=2)
+
+    def make_method(name):
+        def method():
+            pass
+        method.__name__ = name
+        return method
+
+    for index in range(5):
+        auditor.record(class_name='Car', method=make_method('method_' + str(index)), caller_frame=sys._getframe())
+
+    auditor.flush()
+
+    assert [['method_2', 'method_3'], ['method_4']] == \
+        [[violation.class_method_name for violation in batch] for batch in batches]
+
+
+def test_audit_file_sink(tmpdir):
+    """
+    Case: pass violations to the file sink.
+    Expect: every violation is appended to the file as a separate line.
+    """
+    path = tmpdir.join('violations.log')
+    auditor = AccessViolationsAuditor(sink=FileSink(str(path)))
+
+    auditor.record(class_name='Car', method=start_engine, caller_frame=sys._getframe())
+    auditor.record(class_name='Car', method=stop_engine, caller_frame=sys._getframe())
+    auditor.record(class_name='Car', method=stop_engine, caller_frame=sys._getframe())
+    auditor.stop()
+
+    lines = path.read().splitlines()
+
+    assert 2 == len(lines)
+    assert lines[1].startswith('Car.stop_engine() is inaccessible due to its protection level')
+
+
+def test_audit_flusher_survives_sink_errors(caplog):
+    """
+    Case: the sink raises the error on the first flush.
+    Expect: the error is logged, the flushing thread keeps running and flushes violations recorded after.
+    """
+    batches = []
+    flushed = threading.Event()
+
+    def sink(violations):
+        if not batches:
+            batches.append(None)
+            raise OSError('Disk is full.')
+
+        batches.append([violation.class_method_name for violation in violations])
+        flushed.set()
+
+    auditor = AccessViolationsAuditor(sink=sink, batch_size=1, flush_interval=0.01)
+    auditor.start()
+
+    try:
+        auditor.record(class_name='Car', method=start_engine, caller_frame=sys._getframe())
+
+        while not batches:
+            time.sleep(0.01)
+
+        auditor.record(class_name='Car', method=stop_engine, caller_frame=sys._getframe())
+
+        assert flushed.wait(timeout=5)
+        assert auditor.flusher.is_alive()
+    finally:
+        auditor.stop()
+
+    assert [None, ['stop_engine']] == batches
+    assert AUDIT_SINK_FAILURE_MESSAGE in caplog.text
@@ -0,0 +1,257 @@
+"""
+Provide tests for the import hook that compiles accessibility level checks into the methods.
+"""
+import ast
+import sys
+import textwrap
+import types
+
+import pytest
+from accessify import (
+    implements,
+    set_engine,
+)
+from accessify.access import AccessWrapper
+from accessify.compiler import (
+    AccessChecksTransformer,
+    install_import_hook,
+    uninstall_import_hook,
+)
+from accessify.engines import EngineNames
+from accessify.errors import (
+    INACCESSIBLE_DUE_TO_ITS_PROTECTION_LEVEL_EXCEPTION_MESSAGE,
+    ImplementedInterfaceMemberHasIncorrectAccessModifierException,
+    InaccessibleDueToItsProtectionLevelException,
+)
+
+PACKAGE_NAME = 'compiled_cars'
+
+PACKAGE_SOURCE = '''
+"""
+Provide cars with compiled accessibility levels.
+"""
+from __future__ import annotations
+
+from accessify import accessify, private, protected
+
+
+@accessify
+class Car:
+
+    @private
+    def start_engine(self) -> str:
+        """
+        Start the engine.
+        """
+        return 'Engine sound.'
+
+    @protected
+    def stop_engine(self):
+        return 'Engine has been stopped.'
+
+    @private
+    @classmethod
+    def create(cls):
+        return cls
+
+    @private
+    @staticmethod
+    def horn():
+        return 'Horn sound.'
+
+    @private
+    def wheels(self):
+        yield from range(4)
+
+    @private
+    def __check(self):
+        return 'Checked.'
+
+    def run(self):
+        return [self.start_engine(), self.stop_engine(), self.create(), self.horn(), self.__check()]
+
+
+class Tesla(Car):
+
+    def run(self):
+        return self.start_engine()
+
+    def run_protected(self):
+        return self.stop_engine()
+
+
+class Driver:
+
+    def drive(self):
+        return Car().start_engine()
+'''
+
+
+@pytest.fixture
+def import_compiled_package(tmp_path, enable_accessify):
+    """
+    Write the package, install the import hook for it and provide importing of the package.
+    """
+    package_path = tmp_path / PACKAGE_NAME
+    package_path.mkdir()
+    (package_path / '__init__.py').write_text(PACKAGE_SOURCE)
+
+    sys.path.insert(0, str(tmp_path))
+    install_import_hook([PACKAGE_NAME])
+
+    def import_compiled_package():
+        sys.modules.pop(PACKAGE_NAME, None)
+        return __import__(PACKAGE_NAME)
+
+    yield import_compiled_package
+
+    uninstall_import_hook()
+    sys.path.remove(str(tmp_path))
+    sys.modules.pop(PACKAGE_NAME, None)
+
+
+def get_error_message(class_name, class_method_name):
+    """
+    Get inaccessible due to its protection level error message.
+    """
+    return INACCESSIBLE_DUE_TO_ITS_PROTECTION_LEVEL_EXCEPTION_MESSAGE.format(
+        class_name=class_name, class_method_name=class_method_name,
+    )
+
+
+def test_import_hook_compiles_methods(import_compiled_package):
+    """
+    Case: import the opted-in package.
+    Expect: methods and class methods are not wrapped and keep the access modifier type and the documentation,
+        static methods and generators keep wrappers.
+    """
+    cars = import_compiled_package()
+    members = cars.Car.__dict__
+
+    assert not isinstance(members['start_engine'], AccessWrapper)
+    assert not isinstance(members['stop_engine'], AccessWrapper)
+    assert not isinstance(members['create'], AccessWrapper)
+    assert isinstance(members['horn'], AccessWrapper)
+    assert isinstance(members['wheels'], AccessWrapper)
+
+    assert 'private' == members['start_engine'].__access_type__
+    assert 'protected' == members['stop_engine'].__access_type__
+    assert 'Start the engine.' == members['start_engine'].__doc__.strip()
+    assert 'start_engine' not in dir(cars.Car())
+
+
+def test_compiled_access_inside_class(import_compiled_package):
+    """
+    Case: access to the compiled private, protected and mangled private members inside member's class and
+        protected member in child class.
+    Expect: members are accessible.
+    """
+    cars = import_compiled_package()
+
+    assert ['Engine sound.', 'Engine has been stopped.', cars.Car, 'Horn sound.', 'Checked.'] == cars.Car().run()
+    assert 'Engine has been stopped.' == cars.Tesla().run_protected()
+
+
+def test_compiled_access_outside_class(import_compiled_package):
+    """
+    Case: access to the compiled members outside member's class and to the private member inside child class.
+    Expect: inaccessible due to its protection level error message.
+    """
+    cars = import_compiled_package()
+
+    for call, class_method_name in (
+        (cars.Driver().drive, 'start_engine'),
+        (cars.Tesla().run, 'start_engine'),
+        (lambda: cars.Car().stop_engine(), 'stop_engine'),
+        (lambda: cars.Car.create(), 'create'),
+    ):
+        with pytest.raises(InaccessibleDueToItsProtectionLevelException) as error:
+            call()
+
+        assert get_error_message(class_name='Car', class_method_name=class_method_name) == error.value.message
+
+
+def test_compiled_access_from_equal_code_of_another_function(import_compiled_package):
+    """
+    Case: access to the compiled private member from the function, the code object of which is equal to the code
+        object of member's class method, but is not the same object.
+    Expect: inaccessible due to its protection level error message.
+    """
+    cars = import_compiled_package()
+    run_code = cars.Car.run.__code__.replace()
+
+    assert run_code == cars.Car.run.__code__
+    assert id(run_code) not in cars.Car.__accessify_codes__
+
+    with pytest.raises(InaccessibleDueToItsProtectionLevelException) as error:
+        types.FunctionType(run_code, vars(cars))(cars.Car())
+
+    assert get_error_message(class_name='Car', class_method_name='start_engine') == error.value.message
+
+
+def test_compiled_access_follows_engine(import_compiled_package):
+    """
+    Case: access to the compiled private member outside member's class with the engine that does not check access.
+    Expect: private member is accessible.
+    """
+    cars = import_compiled_package()
+    set_engine(EngineNames.NONE)
+
+    try:
+        assert 'Engine sound.' == cars.Driver().drive()
+    finally:
+        set_engine(EngineNames.FRAME)
+
+
+def test_compiled_class_implements_interface(import_compiled_package):
+    """
+    Case: implement the interface with the compiled class, the interface member is public, the class member is private.
+    Expect: implemented interface member has incorrect access modifier exception.
+    """
+    cars = import_compiled_package()
+
+    class CarInterface:
+
+        def start_engine(self) -> str:
+            pass
+
+    with pytest.raises(ImplementedInterfaceMemberHasIncorrectAccessModifierException):
+        implements(CarInterface)(type('Car', (cars.Car,), {}))
+
+
+def test_compiled_bytecode_is_cached(import_compiled_package, monkeypatch):
+    """
+    Case: import the opted-in package twice.
+    Expect: compiled bytecode is written to the separate file in `__pycache__` and loaded without compiling again.
+    """
+    monkeypatch.setattr(sys, 'dont_write_bytecode', False)
+
+    cars = import_compiled_package()
+    cached_path = cars.__spec__.cached
+
+    assert '.opt-accessify' in cached_path
+
+    def transform_again(self, node):
+        raise AssertionError('Cached bytecode has not been used.')
+
+    monkeypatch.setattr(AccessChecksTransformer, 'visit_ClassDef', transform_again)
+
+    cars = import_compiled_package()
+
+    assert ['Engine sound.', 'Engine has been stopped.', cars.Car, 'Horn sound.', 'Checked.'] == cars.Car().run()
+
+
+def test_source_without_accessibility_levels_is_not_changed():
+    """
+    Case: transform the source, that has no accessibility level decorators.
+    Expect: source is not changed.
+    """
+    source = textwrap.dedent('''
+        class Car:
+
+            def run(self):
+                return 'Run.'
+    ''')
+    tree = ast.parse(source)
+
+    assert ast.dump(ast.parse(source)) == ast.dump(AccessChecksTransformer().visit(tree))
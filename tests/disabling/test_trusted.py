@@ -0,0 +1,153 @@
+"""
+Provide tests for trusted blocks of the code, accessibility levels are not checked inside.
+"""
+import asyncio
+import threading
+
+import pytest
+from accessify import (
+    private,
+    protected,
+    set_engine,
+    trusted,
+)
+from accessify.engines import EngineNames
+from accessify.errors import InaccessibleDueToItsProtectionLevelException
+from accessify.monitoring import is_monitoring_supported
+
+
+class Car:
+
+    @private
+    def start_engine(self):
+        return 'Engine sound.'
+
+    @protected
+    def stop_engine(self):
+        return 'Engine has been stopped.'
+
+
+@pytest.fixture(params=(
+    EngineNames.FRAME,
+    pytest.param(
+        EngineNames.MONITORING,
+        marks=pytest.mark.skipif(not is_monitoring_supported(), reason='sys.monitoring is not available'),
+    ),
+))
+def engine(request, enable_accessify):
+    """
+    Enforce accessibility levels by the engine during the test.
+    """
+    set_engine(request.param)
+    yield
+    set_engine(EngineNames.FRAME)
+
+
+def test_access_inside_trusted_block(engine):
+    """
+    Case: access to the private and protected members outside member's class inside the nested trusted blocks.
+    Expect: members are accessible inside the blocks, access is denied after the blocks are exited.
+    """
+    with trusted():
+        with trusted():
+            assert 'Engine sound.' == Car().start_engine()
+
+        assert 'Engine has been stopped.' == Car().stop_engine()
+
+    with pytest.raises(InaccessibleDueToItsProtectionLevelException):
+        Car().start_engine()
+
+
+def test_trusted_block_is_exited_on_exception(enable_accessify):
+    """
+    Case: raise the exception inside the trusted block.
+    Expect: access is denied after the block is exited.
+    """
+    with pytest.raises(ValueError):
+        with trusted():
+            raise ValueError
+
+    with pytest.raises(InaccessibleDueToItsProtectionLevelException):
+        Car().start_engine()
+
+
+def test_trusted_block_is_local_to_thread(enable_accessify):
+    """
+    Case: access to the private member outside member's class in another thread while the trusted block is entered.
+    Expect: access is denied in another thread.
+    """
+    errors = []
+
+    def start_engine():
+        try:
+            Car().start_engine()
+        except InaccessibleDueToItsProtectionLevelException as error:
+            errors.append(error)
+
+    with trusted():
+        thread = threading.Thread(target=start_engine)
+        thread.start()
+        thread.join()
+
+    assert 1 == len(errors)
+
+
+def test_trusted_block_is_local_to_asyncio_task(enable_accessify):
+    """
+    Case: access to the private member outside member's class in asyncio task, while another task is inside the
+        trusted block.
+    Expect: access is allowed in the trusted task and denied in another one.
+    """
+    async def start_engine_trusted(entered, accessed):
+        with trusted():
+            entered.set()
+            await accessed.wait()
+            return Car().start_engine()
+
+    async def start_engine(entered, accessed):
+        await entered.wait()
+
+        try:
+            return Car().start_engine()
+        except InaccessibleDueToItsProtectionLevelException:
+            return 'Denied.'
+        finally:
+            accessed.set()
+
+    async def main():
+        entered, accessed = asyncio.Event(), asyncio.Event()
+        return await asyncio.gather(start_engine_trusted(entered, accessed), start_engine(entered, accessed))
+
+    assert ['Engine sound.', 'Denied.'] == asyncio.run(main())
+
+
+def test_trusted_blocks_of_asyncio_tasks_are_exited_in_any_order(enable_accessify):
+    """
+    Case: enter the trusted blocks in two asyncio tasks and exit them in the order they are entered.
+    Expect: blocks are exited without errors, access is denied after the blocks are exited.
+    """
+    async def start_engine(entered, exit_):
+        with trusted():
+            entered.set()
+            await exit_.wait()
+            return Car().start_engine()
+
+    async def main():
+        first_entered, second_entered = asyncio.Event(), asyncio.Event()
+        first_exit, second_exit = asyncio.Event(), asyncio.Event()
+
+        first = asyncio.ensure_future(start_engine(first_entered, first_exit))
+        await first_entered.wait()
+        second = asyncio.ensure_future(start_engine(second_entered, second_exit))
+        await second_entered.wait()
+
+        first_exit.set()
+        first_result = await first
+        second_exit.set()
+
+        return [first_result, await second]
+
+    assert ['Engine sound.', 'Engine sound.'] == asyncio.run(main())
+
+    with pytest.raises(InaccessibleDueToItsProtectionLevelException):
+        Car().start_engine()
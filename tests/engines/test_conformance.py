@@ -0,0 +1,342 @@
+"""
+Provide conformance tests every enforcement engine passes.
+"""
+import pytest
+from accessify.access import (
+    private,
+    protected,
+)
+from accessify.engines import (
+    EngineNames,
+    get_engine,
+    set_engine,
+)
+from accessify.errors import (
+    INACCESSIBLE_DUE_TO_ITS_PROTECTION_LEVEL_EXCEPTION_MESSAGE,
+    EngineDoesNotExistException,
+    InaccessibleDueToItsProtectionLevelException,
+)
+from accessify.monitoring import is_monitoring_supported
+
+ENFORCING_ENGINES_NAMES = (EngineNames.FRAME, EngineNames.CODE_SET, EngineNames.MONITORING)
+
+
+class Car:
+
+    @private
+    def start_engine(self):
+        return 'Engine sound.'
+
+    @protected
+    def stop_engine(self):
+        return 'Engine has been stopped.'
+
+    @private
+    @classmethod
+    def create(cls):
+        return 'Car has been created.'
+
+    @private
+    @staticmethod
+    def horn():
+        return 'Horn sound.'
+
+    @property
+    def sound(self):
+        return self.start_engine()
+
+    def run(self):
+        return [self.start_engine(), self.stop_engine(), self.create(), self.horn()]
+
+    def run_nested(self):
+        def stop():
+            return self.stop_engine()
+
+        start = lambda: self.start_engine()
+        return [start(), stop()] + [self.horn() for _ in range(1)] + [self.sound]
+
+
+class Tesla(Car):
+
+    def run(self):
+        return self.start_engine()
+
+    def run_protected(self):
+        return self.stop_engine()
+
+    def run_protected_nested(self):
+        return (lambda: self.stop_engine())()
+
+
+class Driver:
+
+    def drive(self):
+        return Car().start_engine()
+
+    def drive_nested(self):
+        return (lambda: Car().start_engine())()
+
+
+def start_generated_engine(self):
+    return 'Engine sound.'
+
+
+def run_generated(self):
+    return self.start_engine()
+
+
+def create_drive():
+    """
+    Create the method to attach to the class.
+    """
+    def drive(self):
+        return self.start_engine()
+
+    return drive
+
+
+GeneratedCar = type('GeneratedCar', (), {'start_engine': private(start_generated_engine), 'run': run_generated})
+GeneratedCar.drive = create_drive()
+
+
+class Garage:
+
+    class Car:
+
+        @private
+        def start_engine(self):
+            return 'Engine sound.'
+
+        def run(self):
+            return (lambda: self.start_engine())()
+
+
+class Engine:
+    """
+    Provide the engine under test and violations it records, if it is audit engine.
+    """
+
+    def __init__(self, name):
+        """
+        Constructor.
+        """
+        self.name = name
+        self.batches = []
+
+    @property
+    def violations(self):
+        """
+        Get recorded violations as tuples of class name, method name and caller name.
+        """
+        return [
+            (violation.class_name, violation.class_method_name, violation.caller_code.co_name)
+            for batch in self.batches for violation in batch
+        ]
+
+    def assert_denied(self, call, expected_result, class_name, class_method_name, caller_name):
+        """
+        Assert the call is denied as the engine denies: raised, recorded or allowed if access is not checked.
+        """
+        if self.name in ENFORCING_ENGINES_NAMES:
+            with pytest.raises(InaccessibleDueToItsProtectionLevelException) as error:
+                call()
+
+            assert INACCESSIBLE_DUE_TO_ITS_PROTECTION_LEVEL_EXCEPTION_MESSAGE.format(
+                class_name=class_name, class_method_name=class_method_name,
+            ) == error.value.message
+
+            return
+
+        assert expected_result == call()
+
+        if self.name == EngineNames.AUDIT:
+            set_engine(EngineNames.NONE)
+
+            assert [(class_name, class_method_name, caller_name)] == self.violations
+
+
+@pytest.fixture(params=(
+    EngineNames.FRAME,
+    EngineNames.CODE_SET,
+    pytest.param(
+        EngineNames.MONITORING,
+        marks=pytest.mark.skipif(not is_monitoring_supported(), reason='sys.monitoring is not available'),
+    ),
+    EngineNames.AUDIT,
+    EngineNames.NONE,
+))
+def engine(request, enable_accessify):
+    """
+    Enforce accessibility levels by the engine during the test.
+    """
+    engine = Engine(name=request.param)
+
+    if engine.name == EngineNames.AUDIT:
+        set_engine(engine.name, sink=engine.batches.append)
+    else:
+        set_engine(engine.name)
+
+    yield engine
+
+    set_engine(EngineNames.FRAME)
+
+
+def test_engine_is_set(engine):
+    """
+    Case: set the engine.
+    Expect: the engine is the current one.
+    """
+    assert engine.name == get_engine()
+
+
+def test_access_inside_class(engine):
+    """
+    Case: access to the private and protected members, private class and static members inside member's class.
+    Expect: members are accessible.
+    """
+    assert ['Engine sound.', 'Engine has been stopped.', 'Car has been created.', 'Horn sound.'] == Car().run()
+
+
+def test_access_inside_nested_code_of_class(engine):
+    """
+    Case: access to the private and protected members inside lambda, inner function, comprehension and property of
+        member's class and inside lambda of the class nested in another class.
+    Expect: members are accessible.
+    """
+    assert ['Engine sound.', 'Engine has been stopped.', 'Horn sound.', 'Engine sound.'] == Car().run_nested()
+    assert 'Engine sound.' == Garage.Car().run()
+
+
+def test_access_inside_class_created_by_type(engine):
+    """
+    Case: access to the private member inside the method of the class created by `type` and inside the method
+        created by the factory function and attached to the class.
+    Expect: member is accessible.
+    """
+    assert 'Engine sound.' == GeneratedCar().run()
+    assert 'Engine sound.' == GeneratedCar().drive()
+
+
+def test_access_inside_methods_added_to_class_after_access(engine, monkeypatch):
+    """
+    Case: access to the private member inside the method attached to the class and inside the method replaced in the
+        class after the members are accessed inside the class.
+    Expect: member is accessible.
+    """
+    def drive(self):
+        return self.start_engine()
+
+    def run(self):
+        return [self.start_engine()]
+
+    car = Car()
+    car.run()
+
+    monkeypatch.setattr(Car, 'drive', drive, raising=False)
+    monkeypatch.setattr(Car, 'run', run)
+
+    assert 'Engine sound.' == car.drive()
+    assert ['Engine sound.'] == car.run()
+
+
+def test_protected_access_in_child_class(engine):
+    """
+    Case: access to the protected member of the parent class inside child class.
+    Expect: member is accessible.
+    """
+    assert 'Engine has been stopped.' == Tesla().run_protected()
+
+
+def test_private_access_in_child_class(engine):
+    """
+    Case: access to the private member of the parent class inside child class.
+    Expect: access is denied on behalf of the parent class.
+    """
+    engine.assert_denied(
+        call=Tesla().run,
+        expected_result='Engine sound.',
+        class_name=Car.__name__,
+        class_method_name='start_engine',
+        caller_name='run',
+    )
+
+
+def test_private_access_in_another_class(engine):
+    """
+    Case: access to the private member through member's class object in another class.
+    Expect: access is denied.
+    """
+    engine.assert_denied(
+        call=Driver().drive,
+        expected_result='Engine sound.',
+        class_name=Car.__name__,
+        class_method_name='start_engine',
+        caller_name='drive',
+    )
+
+
+def test_protected_access_in_nested_code_of_child_class(engine):
+    """
+    Case: access to the protected member of the parent class inside lambda of child class.
+    Expect: member is accessible.
+    """
+    assert 'Engine has been stopped.' == Tesla().run_protected_nested()
+
+
+def test_private_access_in_nested_code_of_another_class(engine):
+    """
+    Case: access to the private member through member's class object inside lambda of another class.
+    Expect: access is denied.
+    """
+    engine.assert_denied(
+        call=Driver().drive_nested,
+        expected_result='Engine sound.',
+        class_name=Car.__name__,
+        class_method_name='start_engine',
+        caller_name='<lambda>',
+    )
+
+
+def test_protected_access_outside_class(engine):
+    """
+    Case: access to the protected member through member's class object outside class.
+    Expect: access is denied.
+    """
+    def run():
+        return Car().stop_engine()
+
+    engine.assert_denied(
+        call=run,
+        expected_result='Engine has been stopped.',
+        class_name=Car.__name__,
+        class_method_name='stop_engine',
+        caller_name='run',
+    )
+
+
+def test_private_class_member_access_outside_class(engine):
+    """
+    Case: access to the private class member through member's class object outside class.
+    Expect: access is denied.
+    """
+    def run():
+        return Car().create()
+
+    engine.assert_denied(
+        call=run,
+        expected_result='Car has been created.',
+        class_name=Car.__name__,
+        class_method_name='create',
+        caller_name='run',
+    )
+
+
+def test_set_engine_that_does_not_exist():
+    """
+    Case: set the engine that does not exist.
+    Expect: engine does not exist exception, the current engine is kept.
+    """
+    with pytest.raises(EngineDoesNotExistException):
+        set_engine('bytecode')
+
+    assert EngineNames.FRAME == get_engine()
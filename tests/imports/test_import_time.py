@@ -0,0 +1,58 @@
+"""
+Provide tests for modules imported by importing accessify.
+"""
+import subprocess
+import sys
+
+HEAVY_MODULES_NAMES = (
+    'ast',
+    'copy',
+    'dis',
+    'enum',
+    'importlib',
+    'inspect',
+    'json',
+    'logging',
+    'tokenize',
+)
+
+
+def get_imported_modules_names(code):
+    """
+    Get names of the modules imported by the code run in the fresh interpreter, reported by `python -X importtime`.
+    """
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code], capture_output=True, text=True, check=True,
+    )
+
+    return {
+        line.rsplit('|', 1)[-1].strip() for line in process.stderr.splitlines() if line.startswith('import time:')
+    }
+
+
+def test_import_does_not_import_heavy_modules(enable_accessify):
+    """
+    Case: import accessify in the fresh interpreter.
+    Expect: heavy modules needed only by introspection are not imported.
+    """
+    imported_modules_names = get_imported_modules_names(code='import accessify')
+
+    assert 'accessify' in imported_modules_names
+    assert set() == imported_modules_names.intersection(HEAVY_MODULES_NAMES)
+
+
+def test_introspection_is_imported_on_first_implements(enable_accessify):
+    """
+    Case: implement interface in the fresh interpreter.
+    Expect: introspection modules are imported on the first implements call.
+    """
+    imported_modules_names = get_imported_modules_names(
+        code='import accessify\n'
+             'class CarInterface:\n'
+             '    def run(self): pass\n'
+             '@accessify.implements(CarInterface)\n'
+             'class Car:\n'
+             '    def run(self): pass\n',
+    )
+
+    assert 'inspect' in imported_modules_names
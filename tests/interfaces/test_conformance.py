@@ -0,0 +1,111 @@
+"""
+Provide tests for getting all differences between the class and the interfaces it implements.
+"""
+import pytest
+from accessify.access import private
+from accessify.errors import ClassDoesNotConformToInterfacesException
+from accessify.interfaces import (
+    get_interfaces_conformance_diff,
+    implements,
+    throws,
+)
+
+
+class HumanDoesNotExistError(Exception):
+    pass
+
+
+class HumanBasicsInterface:
+
+    @throws(HumanDoesNotExistError)
+    def love(self, who):
+        pass
+
+    def eat(self, food):
+        pass
+
+    @staticmethod
+    def sleep(hours):
+        pass
+
+
+class HumanSoulInterface:
+
+    @private
+    def dream(self, about):
+        pass
+
+
+class Human:
+
+    def love(self, whom):
+        pass
+
+    def eat(self, food):
+        pass
+
+    def dream(self, about):
+        pass
+
+    def walk(self, where):
+        pass
+
+
+def test_get_interfaces_conformance_diff():
+    """
+    Case: get differences between the class and the interfaces it implements.
+    Expect: missing, extra, wrong access, wrong signature members and unraised exceptions are found in one pass.
+    """
+    diff = get_interfaces_conformance_diff(Human, HumanBasicsInterface, HumanSoulInterface)
+
+    assert diff
+    assert [('HumanBasicsInterface', 'sleep')] == [
+        (interface.__name__, interface_member.name) for interface, interface_member in diff.missing
+    ]
+    assert ['walk'] == [class_member.name for class_member in diff.extra]
+    assert ['dream'] == [class_member.name for _, _, class_member in diff.wrong_access]
+    assert ['love'] == [class_member.name for _, _, class_member in diff.wrong_signature]
+    assert [HumanDoesNotExistError] == [exception for _, _, _, exception in diff.unraised_exceptions]
+
+
+def test_get_interfaces_conformance_diff_no_differences():
+    """
+    Case: get differences between the class and the interfaces it implements correctly.
+    Expect: no differences.
+    """
+    class HumanWithImplementation:
+
+        def love(self, who):
+            raise HumanDoesNotExistError
+
+        def eat(self, food):
+            pass
+
+        @staticmethod
+        def sleep(hours):
+            pass
+
+    diff = get_interfaces_conformance_diff(HumanWithImplementation, HumanBasicsInterface)
+
+    assert not diff
+    assert [] == diff.errors
+
+
+def test_implements_raises_aggregated_exception(enable_accessify):
+    """
+    Case: implement interfaces with multiple mismatches.
+    Expect: class does not conform to interfaces error message that lists all mismatches.
+    """
+    with pytest.raises(ClassDoesNotConformToInterfacesException) as error:
+        implements(HumanBasicsInterface, HumanSoulInterface)(Human)
+
+    assert 'class Human does not conform to implemented interfaces:\n' \
+           '  - class Human implements interface member HumanBasicsInterface.love(self, who) with mismatched ' \
+           'arguments\n' \
+           '  - Declared exception HumanDoesNotExistError by HumanBasicsInterface.love() member has not been ' \
+           'implemented by Human.love(self, whom)\n' \
+           '  - class Human does not implement interface member HumanBasicsInterface.sleep(hours)\n' \
+           '  - Human.dream(self, about) mismatches HumanSoulInterface.dream() member access modifier.' == \
+           error.value.message
+
+    assert 4 == len(error.value.diff.errors)
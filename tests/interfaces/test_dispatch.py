@@ -0,0 +1,93 @@
+"""
+Provide tests for dispatching calls by interfaces implemented by the class of the first argument.
+"""
+from accessify import dispatch
+from accessify.interfaces import implements
+
+
+class ExporterInterface:
+
+    def export(self):
+        pass
+
+
+class CsvExporterInterface(ExporterInterface):
+    pass
+
+
+class ImporterInterface:
+
+    def load(self):
+        pass
+
+
+@implements(ExporterInterface)
+class JsonExporter:
+
+    def export(self):
+        pass
+
+
+@implements(CsvExporterInterface, ImporterInterface)
+class CsvExporter:
+
+    def export(self):
+        pass
+
+    def load(self):
+        pass
+
+
+class ExcelExporter(CsvExporter):
+    pass
+
+
+@dispatch
+def describe(handler):
+    return 'unknown'
+
+
+@describe.register(ExporterInterface)
+def describe_exporter(exporter):
+    return 'exporter'
+
+
+@describe.register(CsvExporterInterface)
+def describe_csv_exporter(exporter):
+    return 'csv exporter'
+
+
+def test_dispatch():
+    """
+    Case: dispatch calls by interfaces implemented by the class of the first argument.
+    Expect: implementation for the most specific interface is called, default is called if there is no implementation.
+    """
+    assert 'exporter' == describe(JsonExporter())
+    assert 'csv exporter' == describe(CsvExporter())
+    assert 'csv exporter' == describe(ExcelExporter())
+    assert 'unknown' == describe(object())
+    assert 'describe' == describe.__name__
+
+
+def test_dispatch_cache_invalidated_on_registration(enable_accessify):
+    """
+    Case: register implementation and implemented interfaces after calls have been dispatched.
+    Expect: newly registered implementations and implementors are dispatched to.
+    """
+    @dispatch
+    def load(handler):
+        return 'default'
+
+    class XmlImporter:
+
+        def load(self):
+            pass
+
+    assert 'default' == load(CsvExporter())
+    assert 'default' == load(XmlImporter())
+
+    load.register(ImporterInterface, lambda importer: 'importer')
+    assert 'importer' == load(CsvExporter())
+
+    implements(ImporterInterface)(XmlImporter)
+    assert 'importer' == load(XmlImporter())
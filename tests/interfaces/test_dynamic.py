@@ -0,0 +1,92 @@
+"""
+Provide tests for interfaces implemented by classes created at runtime by `type`.
+"""
+import pytest
+from accessify import (
+    accessify,
+    implements,
+    private,
+)
+from accessify.errors import (
+    ImplementedInterfaceMemberHasIncorrectAccessModifierException,
+    InterfaceMemberHasNotBeenImplementedException,
+)
+
+
+def save(self, using=None):
+    pass
+
+
+def validate(self):
+    pass
+
+
+def key(self):
+    return 'key'
+
+
+def create(cls, **fields):
+    return cls()
+
+
+RecordInterface = type('RecordInterface', (), {
+    'save': save,
+    'validate': private(validate),
+    'key': property(key),
+    'create': classmethod(create),
+})
+
+
+def test_implements_by_class_created_by_type(enable_accessify):
+    """
+    Case: implement interface by classes created by type, members are inherited from the base created by type.
+    Expect: interface is implemented without errors.
+    """
+    base_record_class = type('BaseRecord', (), {'save': save, 'key': property(key)})
+
+    for index in range(100):
+        record_class = type('Record' + str(index), (base_record_class,), {
+            'validate': private(validate),
+            'create': classmethod(create),
+        })
+
+        assert record_class is implements(RecordInterface)(record_class)
+
+
+def test_implements_by_class_created_by_type_with_missed_member(enable_accessify):
+    """
+    Case: implement interface by class created by type without one of interface members.
+    Expect: interface member has not been implemented exception is raised.
+    """
+    record_class = type('Record', (), {
+        'save': save, 'validate': private(validate), 'key': property(key),
+    })
+
+    with pytest.raises(InterfaceMemberHasNotBeenImplementedException) as error:
+        implements(RecordInterface)(record_class)
+
+    assert 'class Record does not implement interface member RecordInterface.create(cls, fields)' == error.value.message
+
+
+def test_implements_by_class_created_by_type_with_incorrect_access_modifier(enable_accessify):
+    """
+    Case: implement interface by class created by type with public member the interface declares private.
+    Expect: implemented interface member has incorrect access modifier exception is raised.
+    """
+    record_class = type('Record', (), {
+        'save': save, 'validate': validate, 'key': property(key), 'create': classmethod(create),
+    })
+
+    with pytest.raises(ImplementedInterfaceMemberHasIncorrectAccessModifierException):
+        implements(RecordInterface)(record_class)
+
+
+def test_accessify_class_created_by_type(enable_accessify):
+    """
+    Case: mark class created by type as class that uses accessibility levels.
+    Expect: private member is hidden from the instance members names.
+    """
+    record_class = accessify(type('Record', (), {'save': save, 'validate': private(validate)}))
+
+    assert 'save' in dir(record_class())
+    assert 'validate' not in dir(record_class())
@@ -115,3 +115,61 @@ def test_get_class_members(enable_accessify):
         expected_member = expected_result.get(member_unique_name)
         assert expected_member.__dict__ == member.__dict__
         assert expected_member.arguments == member.arguments
+
+
+class CarInterface:
+
+    @property
+    def speed(self):
+        return
+
+    @speed.setter
+    def speed(self, value=max(0, 1), *, unit=('km', 'h')):
+        return
+
+    def drive(self, route, /, speed, *points, stops=(), **options):
+        pass
+
+
+def test_get_class_members_arguments(enable_accessify):
+    """
+    Case: get arguments of the class members with positional-only, keyword-only arguments and defaults with brackets.
+    Expect: arguments in order of declaration.
+    """
+    members = get_class_members(class_=CarInterface)
+
+    assert ('self', ) == members[ClassMemberTypes.GETTER + 'speed'].arguments
+    assert ('self', 'value', 'unit') == members[ClassMemberTypes.SETTER + 'speed'].arguments
+    assert ('self', 'route', 'speed', 'points', 'stops', 'options') == \
+        members[ClassMemberTypes.METHOD + 'drive'].arguments
+
+
+def test_get_class_members_without_source_code(enable_accessify):
+    """
+    Case: get members of the class which source code could not be retrieved.
+    Expect: class members are classified by their descriptors and arguments are got from code objects.
+    """
+    namespace = {'private': private, 'protected': protected}
+
+    exec(
+        'class Car:\n'
+        '    @private\n'
+        '    @classmethod\n'
+        '    def create(cls, model):\n'
+        '        pass\n'
+        '    @staticmethod\n'
+        '    def wheels(number=4):\n'
+        '        pass\n'
+        '    @protected\n'
+        '    def start_engine(self, *args):\n'
+        '        pass\n',
+        namespace,
+    )
+
+    members = get_class_members(class_=namespace['Car'])
+
+    assert {
+        ClassMemberTypes.CLASS_METHOD + 'create': ('cls', 'model'),
+        ClassMemberTypes.STATIC_METHOD + 'wheels': ('number', ),
+        ClassMemberTypes.METHOD + 'start_engine': ('self', 'args'),
+    } == {unique_name: member.arguments for unique_name, member in members.items()}
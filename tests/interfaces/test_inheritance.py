@@ -0,0 +1,91 @@
+"""
+Provide tests for interfaces extending other interfaces.
+"""
+import pytest
+from accessify.errors import InterfaceMemberHasNotBeenImplementedException
+from accessify.interfaces import implements
+from accessify.utils import (
+    ClassMemberTypes,
+    get_class_members,
+    get_interface_members,
+)
+
+
+class StorageInterface:
+
+    def get(self, key):
+        pass
+
+    def delete(self, key):
+        pass
+
+
+class ReadableStorageInterface(StorageInterface):
+
+    def scan(self, prefix):
+        pass
+
+
+class WritableStorageInterface(StorageInterface):
+
+    def delete(self, key, force):
+        pass
+
+    def put(self, key, value):
+        pass
+
+
+class RepositoryInterface(ReadableStorageInterface, WritableStorageInterface):
+
+    @property
+    def size(self):
+        return
+
+
+def test_get_interface_members():
+    """
+    Case: get flattened members of the interface with diamond-shaped hierarchy.
+    Expect: members are the same as members got by inspecting the whole interface, overridden members are resolved
+    in method resolution order.
+    """
+    interface_members = get_interface_members(interface=RepositoryInterface)
+    inspected_members = get_class_members(class_=RepositoryInterface)
+
+    assert sorted(inspected_members) == sorted(interface_members)
+    assert ('self', 'key', 'force') == interface_members[ClassMemberTypes.METHOD + 'delete'].arguments
+
+    for unique_name, member in interface_members.items():
+        assert inspected_members[unique_name].arguments == member.arguments
+
+
+def test_interface_members_are_cached():
+    """
+    Case: get flattened members of the interfaces sharing the parent interface.
+    Expect: members tables are computed once, parent members are reused by extending interfaces.
+    """
+    assert get_interface_members(interface=RepositoryInterface) is get_interface_members(interface=RepositoryInterface)
+
+    storage_get = get_interface_members(interface=StorageInterface)[ClassMemberTypes.METHOD + 'get']
+
+    assert storage_get is get_interface_members(interface=ReadableStorageInterface)[ClassMemberTypes.METHOD + 'get']
+    assert storage_get is get_interface_members(interface=RepositoryInterface)[ClassMemberTypes.METHOD + 'get']
+
+
+def test_implements_extended_interface(enable_accessify):
+    """
+    Case: implement the interface that extends another interface without implementing parent interface member.
+    Expect: class does not implement interface member error message.
+    """
+    with pytest.raises(InterfaceMemberHasNotBeenImplementedException) as error:
+
+        @implements(ReadableStorageInterface)
+        class Storage:
+
+            def scan(self, prefix):
+                pass
+
+            def delete(self, key):
+                pass
+
+    assert 'class Storage does not implement interface member ReadableStorageInterface.get(self, key)' == \
+        error.value.message
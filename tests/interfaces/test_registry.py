@@ -0,0 +1,169 @@
+"""
+Provide tests for registry of interfaces implemented by classes.
+"""
+import abc
+import gc
+import json
+
+from accessify import (
+    implementors,
+    provides,
+)
+from accessify.interfaces import implements
+from accessify.registry import (
+    InterfacesRegistry,
+    get_provided_interfaces,
+    load_implementors_from_manifest,
+    write_implementors_manifest,
+)
+
+
+class StorageInterface:
+
+    def get(self, key):
+        pass
+
+
+class RepositoryInterface(StorageInterface):
+
+    def save(self, entity):
+        pass
+
+
+class CacheInterface(abc.ABC):
+
+    def invalidate(self, key):
+        pass
+
+
+@implements(RepositoryInterface)
+class Repository:
+
+    def get(self, key):
+        pass
+
+    def save(self, entity):
+        pass
+
+
+class CachedRepository(Repository):
+
+    def invalidate(self, key):
+        pass
+
+
+implements(CacheInterface)(CachedRepository)
+
+
+def test_provides(enable_accessify):
+    """
+    Case: check if objects provide interfaces declared by their classes, their parents and extended interfaces.
+    Expect: declared, inherited and extended interfaces are provided, others are not.
+    """
+    repository, cached_repository = Repository(), CachedRepository()
+
+    assert provides(repository, RepositoryInterface)
+    assert provides(repository, StorageInterface)
+    assert not provides(repository, CacheInterface)
+
+    assert provides(cached_repository, RepositoryInterface)
+    assert provides(cached_repository, CacheInterface)
+    assert not provides(object(), StorageInterface)
+
+
+def test_implements_declares_interfaces(enable_accessify):
+    """
+    Case: get interfaces declared and provided by the class.
+    Expect: class declares only interfaces it has been decorated with, provides inherited and extended ones as well.
+    """
+    assert frozenset([RepositoryInterface]) == Repository.__implements__
+    assert frozenset([CacheInterface]) == CachedRepository.__implements__
+    assert frozenset([RepositoryInterface, StorageInterface, CacheInterface]) == \
+        get_provided_interfaces(CachedRepository)
+
+
+def test_isinstance_of_abstract_interface(enable_accessify):
+    """
+    Case: check if object is instance of the interface that is abstract base class.
+    Expect: object of the class that implements the interface is its instance.
+    """
+    assert isinstance(CachedRepository(), CacheInterface)
+    assert issubclass(CachedRepository, CacheInterface)
+    assert not isinstance(Repository(), CacheInterface)
+
+
+def test_registry_cache_invalidated_on_registration():
+    """
+    Case: register interfaces after provided interfaces of the class have been cached.
+    Expect: newly registered interfaces are provided.
+    """
+    registry = InterfacesRegistry()
+
+    class Parent:
+        pass
+
+    class Child(Parent):
+        pass
+
+    assert frozenset() == registry.get_provided_interfaces(Child)
+
+    registry.register(Parent, [RepositoryInterface])
+
+    assert frozenset([RepositoryInterface, StorageInterface]) == registry.get_provided_interfaces(Child)
+
+
+def test_implementors(enable_accessify):
+    """
+    Case: get implementors of the interfaces.
+    Expect: classes declared to implement the interface or interfaces extending it.
+    """
+    assert frozenset([Repository]) == implementors(RepositoryInterface)
+    assert frozenset([Repository]) == implementors(StorageInterface)
+    assert frozenset([CachedRepository]) == implementors(CacheInterface)
+
+
+def test_implementors_are_not_kept_alive(enable_accessify):
+    """
+    Case: get implementors of the interface after the implementor class has been deleted.
+    Expect: deleted class is not an implementor.
+    """
+    class ExporterInterface:
+        pass
+
+    @implements(ExporterInterface)
+    class Exporter:
+        pass
+
+    assert frozenset([Exporter]) == implementors(ExporterInterface)
+
+    del Exporter
+    gc.collect()
+
+    assert frozenset() == implementors(ExporterInterface)
+
+
+def test_implementors_manifest(tmpdir, enable_accessify):
+    """
+    Case: write manifest of the interfaces implementors and load implementors from it.
+    Expect: importable implementors are written by qualified names and loaded back.
+    """
+    @implements(RepositoryInterface)
+    class LocalRepository:
+
+        def get(self, key):
+            pass
+
+        def save(self, entity):
+            pass
+
+    path = str(tmpdir.join('implementors.json'))
+    write_implementors_manifest(path, interfaces=[StorageInterface, CacheInterface])
+
+    with open(path) as file:
+        assert {
+            'tests.interfaces.test_registry:StorageInterface': ['tests.interfaces.test_registry:Repository'],
+            'tests.interfaces.test_registry:CacheInterface': ['tests.interfaces.test_registry:CachedRepository'],
+        } == json.load(file)
+
+    assert (Repository, ) == load_implementors_from_manifest(path, interface=StorageInterface)
+    assert () == load_implementors_from_manifest(path, interface=RepositoryInterface)
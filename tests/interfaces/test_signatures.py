@@ -0,0 +1,103 @@
+"""
+Provide tests for matching signatures of interface members and class members.
+"""
+import pytest
+from accessify.errors import InterfaceMemberHasNotBeenImplementedWithMismatchedArgumentsException
+from accessify.interfaces import (
+    get_class_members,
+    implements,
+)
+from accessify.utils import (
+    ArgumentKinds,
+    ClassMemberTypes,
+    get_code_parameters,
+)
+
+
+class CarInterface:
+
+    def drive(self, route, /, speed: int, *points, stops=(), **options) -> None:
+        pass
+
+
+def test_implements_mismatched_arguments(enable_accessify):
+    """
+    Case: implement interface member with mismatched arguments.
+    Expect: class implements interface member with mismatched arguments error message.
+    """
+    with pytest.raises(InterfaceMemberHasNotBeenImplementedWithMismatchedArgumentsException) as error:
+
+        @implements(CarInterface)
+        class Car:
+
+            def drive(self, route, speed, *points, **options):
+                pass
+
+    assert 'class Car implements interface member ' \
+           'CarInterface.drive(self, route, speed, points, stops, options) with mismatched arguments' == \
+           error.value.message
+
+
+def test_signatures_are_interned():
+    """
+    Case: get signatures of the members of the different classes with the same arguments.
+    Expect: signatures are the same object.
+    """
+    class Car:
+
+        def drive(self, route, speed, *points, stops=(), **options):
+            pass
+
+    interface_member = get_class_members(class_=CarInterface)[ClassMemberTypes.METHOD + 'drive']
+    class_member = get_class_members(class_=Car)[ClassMemberTypes.METHOD + 'drive']
+
+    assert interface_member.get_signature() is class_member.get_signature()
+    assert interface_member.get_signature(strict=True) is not class_member.get_signature(strict=True)
+
+
+def test_get_code_parameters():
+    """
+    Case: get names and kinds of the arguments from code object.
+    Expect: names and kinds of the arguments in order of declaration, the same object for every call.
+    """
+    assert (
+        ('self', ArgumentKinds.POSITIONAL_ONLY),
+        ('route', ArgumentKinds.POSITIONAL_ONLY),
+        ('speed', ArgumentKinds.POSITIONAL_OR_KEYWORD),
+        ('points', ArgumentKinds.VARIABLE_POSITIONAL),
+        ('stops', ArgumentKinds.KEYWORD_ONLY),
+        ('options', ArgumentKinds.VARIABLE_KEYWORD),
+    ) == get_code_parameters(code=CarInterface.drive.__code__)
+
+    assert get_code_parameters(code=CarInterface.drive.__code__) is get_code_parameters(
+        code=CarInterface.drive.__code__,
+    )
+
+
+def test_implements_strict(enable_accessify):
+    """
+    Case: implement interface member with the same arguments names in strict mode.
+    Expect: no errors if arguments kinds and annotations match.
+    """
+    @implements(CarInterface, strict=True)
+    class Car:
+
+        def drive(self, route, /, speed: int, *points, stops=(), **options) -> None:
+            pass
+
+    assert Car() is not None
+
+
+@pytest.mark.parametrize('drive', [
+    lambda self, route, speed, *points, stops=(), **options: None,
+    lambda self, route, /, speed, *points, stops=(), **options: None,
+])
+def test_implements_strict_mismatched_arguments(drive, enable_accessify):
+    """
+    Case: implement interface member with the same arguments names, but other kinds or annotations in strict mode.
+    Expect: class implements interface member with mismatched arguments error message.
+    """
+    with pytest.raises(InterfaceMemberHasNotBeenImplementedWithMismatchedArgumentsException):
+        implements(CarInterface, strict=True)(type('Car', (), {'drive': drive}))
+
+    assert implements(CarInterface)(type('Car', (), {'drive': drive})) is not None
@@ -0,0 +1,178 @@
+"""
+Provide tests for interfaces implemented by classes which source code has been removed.
+"""
+import importlib
+import importlib.util
+import inspect
+import marshal
+import sys
+import textwrap
+import zipfile
+
+import pytest
+from accessify.errors import DeclaredInterfaceExceptionHasNotBeenImplementedException
+from accessify.utils import get_raised_exceptions_names
+
+SOURCE_CODE = textwrap.dedent('''
+    from accessify import implements, private, throws
+
+
+    class HumanDoesNotExistError(Exception):
+        pass
+
+
+    class HumanAlreadyInLoveError(Exception):
+        pass
+
+
+    class HumanBasicsInterface:
+
+        @throws(HumanDoesNotExistError, HumanAlreadyInLoveError)
+        def love(self, who, *args, **kwargs):
+            pass
+
+        @private
+        @staticmethod
+        def dream(about):
+            pass
+
+        @classmethod
+        def think(cls, about):
+            pass
+
+        @property
+        def name(self):
+            return
+
+
+    @implements(HumanBasicsInterface)
+    class Human:
+
+        def love(self, who, *args, **kwargs):
+            if who is None:
+                raise HumanDoesNotExistError
+
+            if who.loved:
+                raise HumanAlreadyInLoveError(
+                    'Human already in love.',
+                )
+
+        @private
+        @staticmethod
+        def dream(about):
+            pass
+
+        @classmethod
+        def think(cls, about):
+            pass
+
+        @property
+        def name(self):
+            return
+
+
+    def implement_without_exception():
+
+        @implements(HumanBasicsInterface)
+        class HumanWithoutImplementedException:
+
+            def love(self, who, *args, **kwargs):
+                raise HumanDoesNotExistError
+
+            @private
+            @staticmethod
+            def dream(about):
+                pass
+
+            @classmethod
+            def think(cls, about):
+                pass
+
+            @property
+            def name(self):
+                return
+''')
+
+
+def compile_to_bytecode(module_name):
+    """
+    Compile the source code to the content of the sourceless `.pyc` file.
+    """
+    code = compile(SOURCE_CODE, module_name + '.py', 'exec')
+    return importlib.util.MAGIC_NUMBER + b'\x00' * 12 + marshal.dumps(code)
+
+
+def write_pyc(tmpdir, module_name):
+    """
+    Write sourceless `.pyc` file to the directory.
+    """
+    tmpdir.join(module_name + '.pyc').write_binary(compile_to_bytecode(module_name))
+    return str(tmpdir)
+
+
+def write_zipapp(tmpdir, module_name):
+    """
+    Write the archive that contains only sourceless `.pyc` file.
+    """
+    path = str(tmpdir.join('application.pyz'))
+
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr(module_name + '.pyc', compile_to_bytecode(module_name))
+
+    return path
+
+
+@pytest.mark.parametrize('module_name, write_module', [
+    ('sourceless_human', write_pyc),
+    ('zipapp_human', write_zipapp),
+])
+def test_implements_without_source_code(module_name, write_module, tmpdir, enable_accessify):
+    """
+    Case: import the module with implemented interfaces that has only bytecode.
+    Expect: interfaces are checked, declared exceptions that are not raised are detected.
+    """
+    sys.path.insert(0, write_module(tmpdir, module_name))
+
+    try:
+        module = importlib.import_module(module_name)
+
+        with pytest.raises(OSError):
+            inspect.getsource(module.Human)
+
+        assert module.Human is not None
+
+        with pytest.raises(DeclaredInterfaceExceptionHasNotBeenImplementedException) as error:
+            module.implement_without_exception()
+
+        assert 'Declared exception HumanAlreadyInLoveError by HumanBasicsInterface.love() member has not been ' \
+               'implemented by HumanWithoutImplementedException.love(self, who, args, kwargs)' == error.value.message
+
+    finally:
+        sys.path.pop(0)
+        sys.modules.pop(module_name, None)
+
+
+def test_get_raised_exceptions_names():
+    """
+    Case: get names of the exceptions raised by the function.
+    Expect: names of the exceptions raised directly, through the attribute, in multiple lines and in nested functions.
+    """
+    def love(who):
+        def nested():
+            raise HumanInNestedFunctionError  # noqa: F821
+
+        if who is None:
+            raise errors.HumanDoesNotExistError  # noqa: F821
+
+        try:
+            who.love()
+        except KeyError as error:
+            raise HumanAlreadyInLoveError(  # noqa: F821
+                'Human already in love.',
+            ) from error
+
+        raise
+
+    assert {
+        'HumanInNestedFunctionError', 'errors', 'HumanDoesNotExistError', 'HumanAlreadyInLoveError',
+    } == get_raised_exceptions_names(code=love.__code__)
@@ -0,0 +1,155 @@
+"""
+Provide tests for warming accessify caches up and freezing them.
+"""
+import gc
+import sys
+import types
+
+from accessify import (
+    dispatch,
+    freeze,
+    private,
+    unfreeze,
+    warm,
+)
+from accessify.interfaces import implements
+from accessify.registry import INTERFACES_REGISTRY
+from accessify.utils import (
+    CLASS_OWN_MEMBERS_CACHE,
+    INTERFACE_MEMBERS_CACHE,
+    METHOD_CLASS_BY_CODE_CACHE,
+    get_class_own_members,
+)
+
+
+class CarInterface:
+
+    def run(self):
+        pass
+
+
+@implements(CarInterface)
+class Car:
+
+    @private
+    def start_engine(self):
+        return 'Engine sound.'
+
+    def run(self):
+        return self.start_engine()
+
+
+@dispatch
+def describe(object_):
+    return 'unknown'
+
+
+@describe.register(CarInterface)
+def describe_car(car):
+    return 'car'
+
+
+def test_warm_module(enable_accessify):
+    """
+    Case: warm caches up by the module.
+    Expect: members tables, interfaces members tables, provided interfaces, dispatching and callers classes are cached.
+    """
+    warm([sys.modules[__name__]])
+
+    assert Car is METHOD_CLASS_BY_CODE_CACHE.lookup(Car.run.__code__)()
+    assert get_class_own_members(class_=Car) is CLASS_OWN_MEMBERS_CACHE.lookup(Car)
+    assert id(CarInterface) in INTERFACE_MEMBERS_CACHE.table
+    assert id(Car) in INTERFACES_REGISTRY.provided_interfaces_cache.table
+    assert id(Car) in describe.resolution_cache.table
+
+
+def test_warm_class(enable_accessify):
+    """
+    Case: warm caches up by the class.
+    Expect: class members are cached.
+    """
+    class Tesla(Car):
+
+        def drive(self):
+            return self.run()
+
+    warm([Tesla])
+
+    assert id(Tesla) in CLASS_OWN_MEMBERS_CACHE.table
+
+
+def test_warm_class_with_members_implemented_in_c(enable_accessify):
+    """
+    Case: warm caches up by the class with the class method and the property, functions of which are implemented
+        in C and have no code objects.
+    Expect: members without code objects are skipped, other members are cached.
+    """
+    class Garage:
+
+        __class_getitem__ = classmethod(getattr(types, 'GenericAlias', dict))
+        size = property(len)
+
+        def park(self, car):
+            pass
+
+    warm([Garage])
+
+    assert id(Garage) in CLASS_OWN_MEMBERS_CACHE.table
+    assert ('self', 'car') == get_class_own_members(class_=Garage)['methodpark'].get_signature()
+
+
+def test_freeze(enable_accessify):
+    """
+    Case: freeze warmed caches up.
+    Expect: cached items are moved to the frozen tables and still used, new items are cached to the new tables.
+    """
+    warm([Car])
+    freeze()
+
+    try:
+        assert gc.get_freeze_count() > 0
+        assert not CLASS_OWN_MEMBERS_CACHE.table
+        assert id(Car) in CLASS_OWN_MEMBERS_CACHE.frozen_table
+        assert not METHOD_CLASS_BY_CODE_CACHE.table
+
+        assert 'Engine sound.' == Car().run()
+        assert 'car' == describe(Car())
+        assert not METHOD_CLASS_BY_CODE_CACHE.table
+
+        class Bus:
+
+            def run(self):
+                pass
+
+        get_class_own_members(class_=Bus)
+
+        assert id(Bus) in CLASS_OWN_MEMBERS_CACHE.table
+        assert id(Bus) not in CLASS_OWN_MEMBERS_CACHE.frozen_table
+
+    finally:
+        unfreeze()
+
+    assert not CLASS_OWN_MEMBERS_CACHE.frozen_table
+    assert id(Car) in CLASS_OWN_MEMBERS_CACHE.table
+    assert id(Bus) in CLASS_OWN_MEMBERS_CACHE.table
+
+
+def test_frozen_caches_are_cleared(enable_accessify):
+    """
+    Case: implement the interface by the class after caches are frozen.
+    Expect: frozen provided interfaces are dropped along with the others.
+    """
+    warm([Car])
+    freeze()
+
+    try:
+        class Plane:
+            pass
+
+        implements()(Plane)
+
+        assert not INTERFACES_REGISTRY.provided_interfaces_cache.frozen_table
+        assert CarInterface in INTERFACES_REGISTRY.get_provided_interfaces(class_=Car)
+
+    finally:
+        unfreeze()